@@ -48,6 +48,7 @@ def execute_execute_plan_mutation_raw(handle, variables, instance_ref=None):
         DagsterInstance.from_ref(instance_ref) if instance_ref else DagsterInstance.ephemeral()
     )
     res = execute_query(handle, RAW_EXECUTE_PLAN_MUTATION, variables, instance=instance)
+    instance.dispose()
     handle_execution_errors(res, 'executePlan')
     return handle_execute_plan_result_raw(res)
 
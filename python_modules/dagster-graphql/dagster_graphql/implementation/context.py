@@ -1,10 +1,16 @@
-from dagster import ExecutionTargetHandle, check
+from collections import OrderedDict
+
+from dagster import ExecutionTargetHandle, PipelineDefinition, RunConfig, check
 from dagster.core.definitions.partition import PartitionScheduleDefinition
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun
 
 from .pipeline_execution_manager import PipelineExecutionManager
 from .reloader import Reloader
 
+MAX_CACHED_RUN_EXECUTION_PLANS = 32
+
 
 class DagsterGraphQLContext(object):
     def __init__(self, handle, execution_manager, instance, reloader=None, version=None):
@@ -18,6 +24,7 @@ class DagsterGraphQLContext(object):
         self.repository_definition = self.get_handle().build_repository_definition()
 
         self._cached_pipelines = {}
+        self._cached_run_execution_plans = OrderedDict()
         self.scheduler_handle = self.get_handle().build_scheduler_handle()
         self.partitions_handle = self.get_handle().build_partitions_handle()
 
@@ -61,6 +68,26 @@ class DagsterGraphQLContext(object):
 
         return self._cached_pipelines[pipeline_name]
 
+    def get_execution_plan_for_run(self, pipeline_def, pipeline_run):
+        '''The execution plan of a run, built once and reused by every request for a page of its
+        logs, as long as the pipeline definition is not reloaded.'''
+        check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+
+        cached = self._cached_run_execution_plans.pop(pipeline_run.run_id, None)
+        if cached is not None and cached[0] is pipeline_def:
+            execution_plan = cached[1]
+        else:
+            execution_plan = create_execution_plan(
+                pipeline_def, pipeline_run.environment_dict, RunConfig(mode=pipeline_run.mode),
+            )
+
+        self._cached_run_execution_plans[pipeline_run.run_id] = (pipeline_def, execution_plan)
+        while len(self._cached_run_execution_plans) > MAX_CACHED_RUN_EXECUTION_PLANS:
+            self._cached_run_execution_plans.popitem(last=False)
+
+        return execution_plan
+
     def _build_pipeline(self, pipeline_name):
         orig_handle = self.get_handle()
         if orig_handle.is_resolved_to_pipeline:
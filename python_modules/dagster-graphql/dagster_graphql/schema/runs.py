@@ -7,7 +7,7 @@ from dagster_graphql import dauphin
 from dagster_graphql.implementation.fetch_pipelines import get_pipeline_reference_or_raise
 from dagster_graphql.implementation.fetch_runs import get_stats
 
-from dagster import RunConfig, check, seven
+from dagster import check, seven
 from dagster.core.definitions.events import (
     EventMetadataEntry,
     JsonMetadataEntryData,
@@ -20,7 +20,6 @@ from dagster.core.definitions.events import (
 from dagster.core.definitions.pipeline import ExecutionSelector
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
-from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.storage.compute_log_manager import ComputeIOType, ComputeLogFileData
@@ -80,7 +79,11 @@ class DauphinPipelineRun(dauphin.ObjectType):
     status = dauphin.NonNull('PipelineRunStatus')
     pipeline = dauphin.NonNull('PipelineReference')
     stats = dauphin.NonNull('PipelineRunStatsOrError')
-    logs = dauphin.NonNull('LogMessageConnection')
+    logs = dauphin.Field(
+        dauphin.NonNull('LogMessageConnection'),
+        cursor=dauphin.Argument('Cursor'),
+        limit=dauphin.Argument(dauphin.Int),
+    )
     computeLogs = dauphin.Field(
         dauphin.NonNull('ComputeLogs'),
         stepKey=dauphin.Argument(dauphin.NonNull(dauphin.String)),
@@ -105,8 +108,10 @@ class DauphinPipelineRun(dauphin.ObjectType):
     def resolve_pipeline(self, graphene_info):
         return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
 
-    def resolve_logs(self, graphene_info):
-        return graphene_info.schema.type_named('LogMessageConnection')(self._pipeline_run)
+    def resolve_logs(self, graphene_info, **kwargs):
+        return graphene_info.schema.type_named('LogMessageConnection')(
+            self._pipeline_run, kwargs.get('cursor'), kwargs.get('limit')
+        )
 
     def resolve_stats(self, graphene_info):
         return get_stats(graphene_info, self.run_id)
@@ -117,10 +122,8 @@ class DauphinPipelineRun(dauphin.ObjectType):
     def resolve_executionPlan(self, graphene_info):
         pipeline = self.resolve_pipeline(graphene_info)
         if isinstance(pipeline, DauphinPipeline):
-            execution_plan = create_execution_plan(
-                pipeline.get_dagster_pipeline(),
-                self._pipeline_run.environment_dict,
-                RunConfig(mode=self._pipeline_run.mode),
+            execution_plan = graphene_info.context.get_execution_plan_for_run(
+                pipeline.get_dagster_pipeline(), self._pipeline_run
             )
             return graphene_info.schema.type_named('ExecutionPlan')(pipeline, execution_plan)
         else:
@@ -259,38 +262,52 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
     nodes = dauphin.non_null_list('PipelineRunEvent')
     pageInfo = dauphin.NonNull('PageInfo')
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, cursor=None, limit=None):
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._cursor = check.opt_int_param(cursor, 'cursor')
+        if self._cursor is None:
+            self._cursor = -1
+        self._limit = check.opt_int_param(limit, 'limit')
+        self._logs = None
+
+    def _get_logs(self, graphene_info):
+        # nodes and pageInfo are resolved separately, so fetch the page of logs only once
+        if self._logs is None:
+            self._logs = graphene_info.context.instance.logs_after(
+                self._pipeline_run.run_id, self._cursor, self._limit
+            )
+        return self._logs
 
     def resolve_nodes(self, graphene_info):
+        logs = self._get_logs(graphene_info)
         pipeline = get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
 
-        if isinstance(pipeline, DauphinPipeline):
-            execution_plan = create_execution_plan(
-                pipeline.get_dagster_pipeline(),
-                self._pipeline_run.environment_dict,
-                RunConfig(mode=self._pipeline_run.mode),
+        # The execution plan is only needed to resolve the steps of step events
+        if isinstance(pipeline, DauphinPipeline) and any(log.step_key for log in logs):
+            execution_plan = graphene_info.context.get_execution_plan_for_run(
+                pipeline.get_dagster_pipeline(), self._pipeline_run
             )
         else:
-            pipeline = None
+            if not isinstance(pipeline, DauphinPipeline):
+                pipeline = None
             execution_plan = None
 
-        return [
-            from_event_record(graphene_info, log, pipeline, execution_plan)
-            for log in graphene_info.context.instance.all_logs(self._pipeline_run.run_id)
-        ]
+        return [from_event_record(graphene_info, log, pipeline, execution_plan) for log in logs]
 
     def resolve_pageInfo(self, graphene_info):
-        count = len(graphene_info.context.instance.all_logs(self._pipeline_run.run_id))
+        count = len(self._get_logs(graphene_info))
+        total_count = graphene_info.context.instance.get_logs_count_for_run(
+            self._pipeline_run.run_id
+        )
         lastCursor = None
         if count > 0:
-            lastCursor = str(count - 1)
+            lastCursor = str(self._cursor + count)
         return graphene_info.schema.type_named('PageInfo')(
             lastCursor=lastCursor,
-            hasNextPage=None,
-            hasPreviousPage=None,
+            hasNextPage=self._cursor + count + 1 < total_count,
+            hasPreviousPage=self._cursor > -1,
             count=count,
-            totalCount=count,
+            totalCount=total_count,
         )
 
 
@@ -1,8 +1,10 @@
 import copy
 
+import mock
 from dagster_graphql.test.utils import define_context_for_file, execute_dagster_graphql
 
 from dagster import RepositoryDefinition, execute_pipeline, lambda_solid, pipeline
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.instance import DagsterInstance
 
 RUNS_QUERY = '''
@@ -79,6 +81,27 @@ ALL_RUNS_QUERY = '''
 }
 '''
 
+RUN_LOGS_QUERY = '''
+query RunLogsQuery($runId: ID!, $cursor: Cursor, $limit: Int) {
+  pipelineRunOrError(runId: $runId) {
+    ... on PipelineRun {
+      logs(cursor: $cursor, limit: $limit) {
+        nodes {
+          __typename
+        }
+        pageInfo {
+          lastCursor
+          hasNextPage
+          hasPreviousPage
+          count
+          totalCount
+        }
+      }
+    }
+  }
+}
+'''
+
 
 def _get_runs_data(result, run_id):
     for run_data in result.data['pipeline']['runs']:
@@ -165,6 +188,72 @@ def test_get_runs_over_graphql():
     assert result.data['deletePipelineRun']['__typename'] == 'PipelineRunNotFoundError'
 
 
+def test_paginated_run_logs():
+    instance = DagsterInstance.local_temp()
+    repo = get_repo_at_time_1()
+    run_id = execute_pipeline(repo.get_pipeline('evolving_pipeline'), instance=instance).run_id
+    all_logs = instance.all_logs(run_id)
+    assert len(all_logs) > 4
+
+    context = define_context_for_file(__file__, 'get_repo_at_time_1', instance)
+
+    result = execute_dagster_graphql(context, RUN_LOGS_QUERY, variables={'runId': run_id})
+    logs = result.data['pipelineRunOrError']['logs']
+    typenames = [node['__typename'] for node in logs['nodes']]
+    assert len(typenames) == len(all_logs)
+    assert logs['pageInfo'] == {
+        'lastCursor': len(all_logs) - 1,
+        'hasNextPage': False,
+        'hasPreviousPage': False,
+        'count': len(all_logs),
+        'totalCount': len(all_logs),
+    }
+
+    result = execute_dagster_graphql(
+        context, RUN_LOGS_QUERY, variables={'runId': run_id, 'cursor': 1, 'limit': 2}
+    )
+    logs = result.data['pipelineRunOrError']['logs']
+    assert [node['__typename'] for node in logs['nodes']] == typenames[2:4]
+    assert logs['pageInfo'] == {
+        'lastCursor': 3,
+        'hasNextPage': True,
+        'hasPreviousPage': True,
+        'count': 2,
+        'totalCount': len(all_logs),
+    }
+
+    result = execute_dagster_graphql(
+        context, RUN_LOGS_QUERY, variables={'runId': run_id, 'cursor': len(all_logs) - 1}
+    )
+    logs = result.data['pipelineRunOrError']['logs']
+    assert logs['nodes'] == []
+    assert logs['pageInfo']['lastCursor'] is None
+    assert logs['pageInfo']['hasNextPage'] is False
+    assert logs['pageInfo']['totalCount'] == len(all_logs)
+
+
+def test_paginated_run_logs_build_execution_plan_once():
+    instance = DagsterInstance.local_temp()
+    repo = get_repo_at_time_1()
+    run_id = execute_pipeline(repo.get_pipeline('evolving_pipeline'), instance=instance).run_id
+    context = define_context_for_file(__file__, 'get_repo_at_time_1', instance)
+
+    with mock.patch(
+        'dagster_graphql.implementation.context.create_execution_plan',
+        wraps=create_execution_plan,
+    ) as create_execution_plan_mock:
+        cursor = None
+        has_next_page = True
+        while has_next_page:
+            result = execute_dagster_graphql(
+                context, RUN_LOGS_QUERY, variables={'runId': run_id, 'cursor': cursor, 'limit': 2}
+            )
+            page_info = result.data['pipelineRunOrError']['logs']['pageInfo']
+            cursor, has_next_page = page_info['lastCursor'], page_info['hasNextPage']
+
+        assert create_execution_plan_mock.call_count == 1
+
+
 def get_repo_at_time_1():
     @lambda_solid
     def solid_A():
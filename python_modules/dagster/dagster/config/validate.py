@@ -26,6 +26,7 @@ from .evaluate_value_result import EvaluateValueResult
 from .post_process import post_process_config
 from .stack import EvaluationStack
 from .validation_context import ValidationContext
+from .validation_plan import process_with_plan, validate_with_plan
 
 
 def is_config_scalar_valid(config_type, config_value):
@@ -47,12 +48,21 @@ def is_config_scalar_valid(config_type, config_value):
 
 
 def validate_config(config_type, config_value):
-    context = ValidationContext(
-        config_type=check.inst_param(config_type, 'config_type', ConfigType),
-        stack=EvaluationStack(config_type=config_type, entries=[]),
-    )
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    # Only values that fail the plan compiled for the type are validated recursively, which
+    # tracks where in the document each error occurred
+    evr = validate_with_plan(config_type, config_value)
+    if evr is not None:
+        return evr
 
-    return _validate_config(context, config_value)
+    return _validate_config(_root_context(config_type), config_value)
+
+
+def _root_context(config_type):
+    return ValidationContext(
+        config_type=config_type, stack=EvaluationStack(config_type=config_type, entries=[]),
+    )
 
 
 def _validate_config(context, config_value):
@@ -304,7 +314,13 @@ def validate_enum_config(context, config_value):
 
 
 def process_config(config_type, config_dict):
-    validate_evr = validate_config(config_type, config_dict)
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    evr = process_with_plan(config_type, config_dict)
+    if evr is not None:
+        return evr
+
+    validate_evr = _validate_config(_root_context(config_type), config_dict)
     if not validate_evr.success:
         return validate_evr
 
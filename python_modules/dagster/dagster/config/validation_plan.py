@@ -0,0 +1,415 @@
+'''Validation plans compiled once per config type.
+
+The recursive validator in validate.py builds a ValidationContext and an EvaluationStack for every
+value it visits so that it can describe where an error occurred, and post_process.py walks the
+validated value a second time. Most values are valid, and for those that bookkeeping is wasted.
+
+A validation plan resolves everything that depends only on the config type (its kind, fields,
+scalar check and post processing) up front, and validates and post processes a value in a single
+pass without tracking where in the document it is. It does not report errors: any value it cannot
+vouch for is handed back to the recursive validator, which produces the error messages.
+'''
+
+from abc import ABCMeta, abstractmethod
+from enum import Enum as PythonEnum
+
+import six
+
+from dagster import check
+from dagster.utils import frozendict, frozenlist
+
+from .config_type import Bool, ConfigScalar, ConfigType, ConfigTypeKind, Float, Int, Path, String
+from .evaluate_value_result import EvaluateValueResult
+
+
+class InvalidConfigValue(Exception):
+    '''Raised by a validation plan when a value does not conform to its type, or when post
+    processing it fails.'''
+
+
+def validate_with_plan(config_type, config_value):
+    '''Validate a value against the plan compiled for its type.
+
+    Returns:
+        Optional[EvaluateValueResult]: The result if the value is valid, or None if it must be
+            validated by the recursive validator, which reports errors.
+    '''
+    try:
+        return EvaluateValueResult.for_value(
+            get_validation_plan(config_type).validate(config_value)
+        )
+    except InvalidConfigValue:
+        return None
+
+
+def process_with_plan(config_type, config_value):
+    '''Validate and post process a value against the plan compiled for its type.
+
+    Returns:
+        Optional[EvaluateValueResult]: The result if the value is valid and post processing
+            succeeded, or None if it must be processed by the recursive validator, which reports
+            errors.
+    '''
+    try:
+        return EvaluateValueResult.for_value(get_validation_plan(config_type).process(config_value))
+    except InvalidConfigValue:
+        return None
+
+
+def get_validation_plan(config_type):
+    # Config types are not modified once constructed, so the plan is kept on the type itself. Two
+    # threads may race to compile the same plan, in which case one of the equivalent plans is kept.
+    plan = getattr(config_type, '_validation_plan', None)
+    if plan is None:
+        plan = _compile_validation_plan(config_type)
+        config_type._validation_plan = plan  # pylint: disable=protected-access
+    return plan
+
+
+def _compile_validation_plan(config_type):
+    kind = config_type.kind
+
+    if kind == ConfigTypeKind.ANY:
+        return AnyValidationPlan(config_type)
+    elif kind == ConfigTypeKind.SCALAR:
+        return ScalarValidationPlan(config_type)
+    elif kind == ConfigTypeKind.ENUM:
+        return EnumValidationPlan(config_type)
+    elif kind == ConfigTypeKind.SELECTOR:
+        return SelectorValidationPlan(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return ShapeValidationPlan(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return ArrayValidationPlan(config_type)
+    elif kind == ConfigTypeKind.NONEABLE:
+        return NoneableValidationPlan(config_type)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return ScalarUnionValidationPlan(config_type)
+    else:
+        check.failed('Unsupported ConfigTypeKind {}'.format(kind))
+
+
+class ValidationPlan(six.with_metaclass(ABCMeta)):
+    '''Validates values of a single config type.
+
+    validate returns the same value as the recursive validator. process returns the same value as
+    validating and then post processing. post_process returns the same value as post processing
+    without validating, which is how field defaults are resolved. All three raise InvalidConfigValue
+    rather than return a value the recursive path would have rejected.
+    '''
+
+    def __init__(self, config_type):
+        self.config_type = config_type
+
+        # Skip the call entirely for the many types that do not post process their values
+        if six.get_unbound_function(type(config_type).post_process) is six.get_unbound_function(
+            ConfigType.post_process
+        ):
+            self._post_process_fn = None
+        else:
+            self._post_process_fn = config_type.post_process
+
+    @abstractmethod
+    def validate(self, config_value):
+        pass
+
+    @abstractmethod
+    def process(self, config_value):
+        pass
+
+    @abstractmethod
+    def post_process(self, config_value):
+        pass
+
+    def finish(self, value):
+        if self._post_process_fn is None:
+            return value
+
+        try:
+            return self._post_process_fn(value)
+        except Exception:  # pylint: disable=broad-except
+            # Post processing may run arbitrary code. The recursive path reports its failures.
+            raise InvalidConfigValue()
+
+
+class AnyValidationPlan(ValidationPlan):
+    def validate(self, config_value):
+        return config_value
+
+    def process(self, config_value):
+        return self.finish(config_value)
+
+    def post_process(self, config_value):
+        return self.finish(config_value)
+
+
+def _scalar_check(config_type):
+    # Resolved once per type, in the same order as is_config_scalar_valid
+    if isinstance(config_type, Int):
+        return lambda value: not isinstance(value, bool) and isinstance(value, six.integer_types)
+    elif isinstance(config_type, String) or isinstance(config_type, Path):
+        return lambda value: isinstance(value, six.string_types)
+    elif isinstance(config_type, Bool):
+        return lambda value: isinstance(value, bool)
+    elif isinstance(config_type, Float):
+        return lambda value: isinstance(value, float)
+    elif isinstance(config_type, ConfigScalar):
+        return config_type.is_config_scalar_valid
+    else:
+        check.failed('Not a supported scalar {}'.format(config_type))
+
+
+class ScalarValidationPlan(ValidationPlan):
+    def __init__(self, config_type):
+        super(ScalarValidationPlan, self).__init__(config_type)
+        self._is_valid = _scalar_check(config_type)
+
+    def validate(self, config_value):
+        if config_value is None or not self._is_valid(config_value):
+            raise InvalidConfigValue()
+        return config_value
+
+    def process(self, config_value):
+        return self.finish(self.validate(config_value))
+
+    def post_process(self, config_value):
+        return self.finish(config_value)
+
+
+class EnumValidationPlan(ValidationPlan):
+    def validate(self, config_value):
+        if isinstance(config_value, PythonEnum):
+            config_value = config_value.name
+
+        if not isinstance(
+            config_value, six.string_types
+        ) or not self.config_type.is_valid_config_enum_value(config_value):
+            raise InvalidConfigValue()
+
+        return config_value
+
+    def process(self, config_value):
+        return self.finish(self.validate(config_value))
+
+    def post_process(self, config_value):
+        return self.finish(config_value)
+
+
+class NoneableValidationPlan(ValidationPlan):
+    def __init__(self, config_type):
+        super(NoneableValidationPlan, self).__init__(config_type)
+        self.inner_plan = get_validation_plan(config_type.inner_type)
+
+    def validate(self, config_value):
+        return None if config_value is None else self.inner_plan.validate(config_value)
+
+    def process(self, config_value):
+        return self.finish(None if config_value is None else self.inner_plan.process(config_value))
+
+    def post_process(self, config_value):
+        return self.finish(
+            None if config_value is None else self.inner_plan.post_process(config_value)
+        )
+
+
+class ArrayValidationPlan(ValidationPlan):
+    def __init__(self, config_type):
+        super(ArrayValidationPlan, self).__init__(config_type)
+        self.inner_plan = get_validation_plan(config_type.inner_type)
+        self._allows_none = config_type.inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def validate(self, config_value):
+        if not isinstance(config_value, list):
+            raise InvalidConfigValue()
+
+        inner_validate = self.inner_plan.validate
+        return [inner_validate(item) for item in config_value]
+
+    def process(self, config_value):
+        if not isinstance(config_value, list):
+            raise InvalidConfigValue()
+
+        return self._process_items(config_value, self.inner_plan.process)
+
+    def post_process(self, config_value):
+        return self._process_items(config_value, self.inner_plan.post_process)
+
+    def _process_items(self, config_value, inner_fn):
+        if not config_value:
+            return self.finish([])
+
+        if not self._allows_none and any(item is None for item in config_value):
+            raise InvalidConfigValue()
+
+        return self.finish(frozenlist([inner_fn(item) for item in config_value]))
+
+
+class ScalarUnionValidationPlan(ValidationPlan):
+    def __init__(self, config_type):
+        super(ScalarUnionValidationPlan, self).__init__(config_type)
+        self.scalar_plan = get_validation_plan(config_type.scalar_type)
+        self.non_scalar_plan = get_validation_plan(config_type.non_scalar_type)
+
+    def _plan_for(self, config_value):
+        if isinstance(config_value, dict) or isinstance(config_value, list):
+            return self.non_scalar_plan
+        return self.scalar_plan
+
+    def validate(self, config_value):
+        if config_value is None:
+            raise InvalidConfigValue()
+        return self._plan_for(config_value).validate(config_value)
+
+    def process(self, config_value):
+        if config_value is None:
+            raise InvalidConfigValue()
+        return self.finish(self._plan_for(config_value).process(config_value))
+
+    def post_process(self, config_value):
+        return self.finish(self._plan_for(config_value).post_process(config_value))
+
+
+class FieldValidationPlan(object):
+    def __init__(self, name, field_def):
+        self.name = name
+        self.field_def = field_def
+        self.plan = get_validation_plan(field_def.config_type)
+        self.is_required = field_def.is_required
+        self.default_provided = field_def.default_provided
+        self.has_fields = ConfigTypeKind.has_fields(field_def.config_type.kind)
+
+
+class SelectorValidationPlan(ValidationPlan):
+    def __init__(self, config_type):
+        super(SelectorValidationPlan, self).__init__(config_type)
+        self.field_plans = {
+            name: FieldValidationPlan(name, field_def)
+            for name, field_def in config_type.fields.items()
+        }
+        self._only_field_plan = (
+            list(self.field_plans.values())[0] if len(self.field_plans) == 1 else None
+        )
+
+    def _selected(self, config_value):
+        if not isinstance(config_value, dict) or len(config_value) != 1:
+            raise InvalidConfigValue()
+
+        ((field_name, field_value),) = config_value.items()
+        field_plan = self.field_plans.get(field_name)
+        if field_plan is None:
+            raise InvalidConfigValue()
+
+        # A selected key without a value fills in the defaults of the selected field
+        if field_value is None and field_plan.has_fields:
+            field_value = {}
+
+        return field_plan, field_value
+
+    def validate(self, config_value):
+        if config_value is None:
+            raise InvalidConfigValue()
+
+        if config_value == {}:
+            if self._only_field_plan is None or self._only_field_plan.is_required:
+                raise InvalidConfigValue()
+            return {}
+
+        field_plan, field_value = self._selected(config_value)
+        return frozendict({field_plan.name: field_plan.plan.validate(field_value)})
+
+    def process(self, config_value):
+        if config_value is None:
+            raise InvalidConfigValue()
+
+        if config_value == {}:
+            if self._only_field_plan is None or self._only_field_plan.is_required:
+                raise InvalidConfigValue()
+            return self.post_process({})
+
+        field_plan, field_value = self._selected(config_value)
+        return self.finish(frozendict({field_plan.name: field_plan.plan.process(field_value)}))
+
+    def post_process(self, config_value):
+        if config_value:
+            field_plan, field_value = self._selected(config_value)
+        else:
+            field_plan = self._only_field_plan
+            if field_plan is None:
+                raise InvalidConfigValue()
+            field_value = (
+                field_plan.field_def.default_value if field_plan.default_provided else None
+            )
+            if field_value is None and field_plan.has_fields:
+                field_value = {}
+
+        return self.finish(frozendict({field_plan.name: field_plan.plan.post_process(field_value)}))
+
+
+class ShapeValidationPlan(ValidationPlan):
+    def __init__(self, config_type):
+        super(ShapeValidationPlan, self).__init__(config_type)
+        self.field_plans = [
+            FieldValidationPlan(name, field_def) for name, field_def in config_type.fields.items()
+        ]
+        self.field_names = frozenset(config_type.fields.keys())
+        self.required_field_names = frozenset(
+            field_plan.name for field_plan in self.field_plans if field_plan.is_required
+        )
+        self.is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+    def _check_fields(self, config_value):
+        if not isinstance(config_value, dict):
+            raise InvalidConfigValue()
+
+        if not self.is_permissive and not self.field_names.issuperset(config_value):
+            raise InvalidConfigValue()
+
+        if not self.required_field_names.issubset(config_value):
+            raise InvalidConfigValue()
+
+    def validate(self, config_value):
+        self._check_fields(config_value)
+
+        for field_plan in self.field_plans:
+            if field_plan.name in config_value:
+                field_plan.plan.validate(config_value[field_plan.name])
+
+        return frozendict(config_value)
+
+    def process(self, config_value):
+        self._check_fields(config_value)
+        return self._process_fields(config_value, process_incoming=True)
+
+    def post_process(self, config_value):
+        if config_value is None:
+            config_value = {}
+        elif not isinstance(config_value, dict):
+            raise InvalidConfigValue()
+
+        return self._process_fields(config_value, process_incoming=False)
+
+    def _process_fields(self, config_value, process_incoming):
+        if not all(isinstance(key, str) for key in config_value):
+            raise InvalidConfigValue()
+
+        processed = {}
+        for field_plan in self.field_plans:
+            name = field_plan.name
+            if name in config_value:
+                processed[name] = (
+                    field_plan.plan.process(config_value[name])
+                    if process_incoming
+                    else field_plan.plan.post_process(config_value[name])
+                )
+            elif field_plan.default_provided:
+                # Defaults were validated when their field was defined
+                processed[name] = field_plan.plan.post_process(field_plan.field_def.default_value)
+            elif field_plan.is_required:
+                raise InvalidConfigValue()
+
+        # Fields not defined on a permissive shape are passed through as they are
+        if self.is_permissive:
+            for extra_field in set(config_value.keys()) - self.field_names:
+                processed[extra_field] = config_value[extra_field]
+
+        return self.finish(frozendict(processed))
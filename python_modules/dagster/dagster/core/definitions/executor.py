@@ -1,7 +1,7 @@
 from functools import update_wrapper
 
 from dagster import check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Int
 from dagster.config.field import Field
 from dagster.config.field_utils import check_user_facing_opt_config_param
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
@@ -144,7 +144,11 @@ class _ExecutorDecoratorCallable(object):
 
 @executor(
     name='in_process',
-    config={'retries': get_retries_config(), 'marker_to_close': Field(str, is_required=False),},
+    config={
+        'retries': get_retries_config(),
+        'marker_to_close': Field(str, is_required=False),
+        'release_intermediates': Field(Bool, is_required=False, default_value=False),
+    },
 )
 def in_process_executor(init_context):
     '''The default in-process executor.
@@ -161,6 +165,12 @@ def in_process_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    If the optional ``release_intermediates`` arg is set to ``true``, each intermediate is released
+    as soon as every step that consumes it has succeeded, rather than being kept until the end of
+    the run. Released intermediates are no longer available to inspect once the run is over, or to
+    re-execution of the run. Intermediates that no step consumes, intermediates consumed by steps
+    that fail, and outputs configured for materialization are always kept.
     '''
     from dagster.core.engine.init import InitExecutorContext
 
@@ -170,6 +180,7 @@ def in_process_executor(init_context):
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=Retries.from_config(init_context.executor_config.get('retries', {'enabled': {}})),
         marker_to_close=init_context.executor_config.get('marker_to_close'),
+        release_intermediates=init_context.executor_config.get('release_intermediates', False),
     )
 
 
@@ -178,6 +189,8 @@ def in_process_executor(init_context):
     config={
         'max_concurrent': Field(Int, is_required=False, default_value=0),
         'retries': get_retries_config(),
+        'persistent_workers': Field(Bool, is_required=False, default_value=False),
+        'release_intermediates': Field(Bool, is_required=False, default_value=False),
     },
 )
 def multiprocess_executor(init_context):
@@ -197,6 +210,17 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default, each step is executed in a new process. If the optional ``persistent_workers`` arg
+    is set to ``true``, steps are instead executed by a pool of up to ``max_concurrent``
+    long-lived worker processes, each of which loads the pipeline, builds the execution plan and
+    connects to the instance only once. This reduces the overhead of executing many short steps.
+
+    If the optional ``release_intermediates`` arg is set to ``true``, the parent process removes
+    each intermediate from storage as soon as every step that consumes it has succeeded. Removed
+    intermediates are no longer available to re-execution of the run. Intermediates that no step
+    consumes, intermediates consumed by steps that fail, and outputs configured for materialization
+    are always kept.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -213,6 +237,8 @@ def multiprocess_executor(init_context):
         handle=handle,
         max_concurrent=init_context.executor_config['max_concurrent'],
         retries=Retries.from_config(init_context.executor_config['retries']),
+        persistent_workers=init_context.executor_config['persistent_workers'],
+        release_intermediates=init_context.executor_config['release_intermediates'],
     )
 
 
@@ -57,8 +57,8 @@ def last_empty_partition(context, partition_set_def):
                 'dagster/partition_set': partition_set_def.name,
             }
         )
-        matching = context.instance.get_runs(filters)
-        if not any(run.status == PipelineRunStatus.SUCCESS for run in matching):
+        matching = context.instance.get_run_summaries(filters)
+        if not any(summary.status == PipelineRunStatus.SUCCESS for summary in matching):
             selected = partition
             break
     return selected
@@ -43,6 +43,23 @@ class ChildProcessCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-in
         Yields a sequence of events to be handled by _execute_command_in_child_process.'''
 
 
+class ChildProcessWorkerCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
+    '''Inherit from this class in order to execute a sequence of tasks in a single, long-lived
+    child process.
+
+    The object must be picklable; instantiate it and pass it to ChildProcessWorker. State built up
+    while executing one task is retained in the child process for the tasks that follow.'''
+
+    @abstractmethod
+    def execute_task(self, task):
+        ''' This method is invoked in the child process, once for each task sent to the worker.
+
+        Yields a sequence of events to be handled by ChildProcessWorker.execute_task.'''
+
+    def dispose(self):
+        ''' This method is invoked in the child process when the worker is stopped.'''
+
+
 class ChildProcessCrashException(Exception):
     '''Thrown when the child process crashes.'''
 
@@ -153,3 +170,106 @@ def execute_child_process_command(command):
         raise ChildProcessCrashException()
 
     process.join()
+
+
+def _execute_tasks_in_child_process(task_queue, event_queue, worker_command):
+    '''Wraps the execution of a ChildProcessWorkerCommand.
+
+    Executes tasks as they arrive on the task queue until it receives None, and communicates across
+    the event queue with the parent process. Each task is bracketed by a ChildProcessStartEvent and
+    either a ChildProcessDoneEvent or a ChildProcessSystemErrorEvent.'''
+
+    check.inst_param(worker_command, 'worker_command', ChildProcessWorkerCommand)
+
+    pid = os.getpid()
+    try:
+        while True:
+            try:
+                task = task_queue.get()
+            except KeyboardInterrupt:
+                break
+
+            if task is None:
+                break
+
+            event_queue.put(ChildProcessStartEvent(pid=pid))
+            try:
+                for event in worker_command.execute_task(task):
+                    event_queue.put(event)
+                event_queue.put(ChildProcessDoneEvent(pid=pid))
+            except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
+                event_queue.put(
+                    ChildProcessSystemErrorEvent(
+                        pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                )
+    finally:
+        worker_command.dispose()
+        event_queue.close()
+
+
+class ChildProcessWorker(object):
+    '''A long-lived child process to which tasks are sent one at a time.
+
+    The child process is started when the worker is constructed, and runs until ``stop`` is called.
+    Tasks, and the events yielded while executing them, must be picklable.
+
+    Args:
+        worker_command (ChildProcessWorkerCommand): The command with which to execute tasks in the
+            child process.
+    '''
+
+    def __init__(self, worker_command):
+        check.inst_param(worker_command, 'worker_command', ChildProcessWorkerCommand)
+
+        multiprocessing_context = get_multiprocessing_context()
+        self._task_queue = multiprocessing_context.Queue()
+        self._event_queue = multiprocessing_context.Queue()
+        self._process = multiprocessing_context.Process(
+            target=_execute_tasks_in_child_process,
+            args=(self._task_queue, self._event_queue, worker_command),
+        )
+        self._process.start()
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def is_alive(self):
+        return self._process.is_alive()
+
+    def execute_task(self, task):
+        '''Send a task to the child process and poll for the events it yields until the task is
+        complete.
+
+        Yields the same set of objects as execute_child_process_command. If the child process dies
+        before the task is complete, raises ChildProcessCrashException, and the worker may not be
+        used again.
+        '''
+        check.invariant(task is not None, 'None is reserved for stopping the worker')
+
+        self._task_queue.put(task)
+
+        completed_properly = False
+
+        while not completed_properly:
+            event = _poll_for_event(self._process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+
+        if not completed_properly:
+            raise ChildProcessCrashException()
+
+    def stop(self):
+        '''Stop the child process once it has finished any task it is executing.'''
+        if self._process.is_alive():
+            self._task_queue.put(None)
+        self._process.join()
+        self._task_queue.close()
@@ -29,6 +29,7 @@ from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
     SystemStepExecutionContext,
 )
+from dagster.core.execution.intermediate_refs import IntermediateReferenceCounter
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
 from dagster.core.execution.plan.objects import (
     StepFailureData,
@@ -83,9 +84,12 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
             ):
                 yield event
 
-            # It would be good to implement a reference tracking algorithm here to
-            # garbage collect results that are no longer needed by any steps
-            # https://github.com/dagster-io/dagster/issues/811
+            intermediate_refs = (
+                IntermediateReferenceCounter(pipeline_context, execution_plan)
+                if pipeline_context.executor_config.release_intermediates
+                else None
+            )
+
             active_execution = execution_plan.start(
                 retries=pipeline_context.executor_config.retries
             )
@@ -127,6 +131,12 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
                             yield step_event
                             active_execution.handle_event(step_event)
 
+                            if intermediate_refs is not None:
+                                for event in intermediate_refs.release_for_event(
+                                    pipeline_context, step_event
+                                ):
+                                    yield event
+
                     active_execution.verify_complete(pipeline_context, step.key)
 
                 # process skips from failures or uncovered inputs
@@ -162,27 +172,45 @@ class MultipleStepOutputsListWrapper(list):
     pass
 
 
+def _input_dagster_type_for_source_handles(step_input):
+    if step_input.is_from_multiple_outputs:
+        if hasattr(step_input.dagster_type, 'inner_type'):
+            return step_input.dagster_type.inner_type
+        # This is the case where the fan-in is typed Any
+        return step_input.dagster_type
+
+    return step_input.dagster_type
+
+
 def _input_values_from_intermediates_manager(step_context):
     step = step_context.step
 
+    # Get the intermediates for all inputs at once, so that the intermediates manager can read them
+    # concurrently. The results are in the order requested, so inputs are assembled in step order.
+    step_inputs_from_outputs = [
+        step_input
+        for step_input in step.step_inputs
+        if step_input.dagster_type.kind != DagsterTypeKind.NOTHING
+        and (step_input.is_from_multiple_outputs or step_input.is_from_single_output)
+    ]
+    intermediates = iter(
+        step_context.intermediates_manager.get_intermediates(
+            step_context,
+            [
+                (_input_dagster_type_for_source_handles(step_input), source_handle)
+                for step_input in step_inputs_from_outputs
+                for source_handle in step_input.source_handles
+            ],
+        )
+    )
+
     input_values = {}
     for step_input in step.step_inputs:
         if step_input.dagster_type.kind == DagsterTypeKind.NOTHING:
             continue
 
         if step_input.is_from_multiple_outputs:
-            if hasattr(step_input.dagster_type, 'inner_type'):
-                dagster_type = step_input.dagster_type.inner_type
-            else:  # This is the case where the fan-in is typed Any
-                dagster_type = step_input.dagster_type
-            _input_value = [
-                step_context.intermediates_manager.get_intermediate(
-                    context=step_context,
-                    step_output_handle=source_handle,
-                    dagster_type=dagster_type,
-                )
-                for source_handle in step_input.source_handles
-            ]
+            _input_value = [next(intermediates) for _ in step_input.source_handles]
             # When we're using an object store-backed intermediate store, we wrap the
             # ObjectStoreOperation[] representing the fan-in values in a MultipleStepOutputsListWrapper
             # so we can yield the relevant object store events and unpack the values in the caller
@@ -192,11 +220,7 @@ def _input_values_from_intermediates_manager(step_context):
                 input_value = _input_value
 
         elif step_input.is_from_single_output:
-            input_value = step_context.intermediates_manager.get_intermediate(
-                context=step_context,
-                step_output_handle=step_input.source_handles[0],
-                dagster_type=step_input.dagster_type,
-            )
+            input_value = next(intermediates)
 
         else:  # is from config
 
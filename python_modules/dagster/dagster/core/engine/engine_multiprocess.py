@@ -3,11 +3,13 @@ import os
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import execute_plan_iterator
 from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.intermediate_refs import IntermediateReferenceCounter
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.snapshot import ExecutionPlanSnapshot
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -16,6 +18,8 @@ from .child_process_executor import (
     ChildProcessCommand,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
     execute_child_process_command,
 )
 from .engine_base import Engine, override_env_for_inner_executor
@@ -25,12 +29,20 @@ DELEGATE_MARKER = 'multiprocess_subprocess_init'
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
-        self, environment_dict, pipeline_run, executor_config, step_key, instance_ref, term_event
+        self,
+        environment_dict,
+        pipeline_run,
+        executor_config,
+        step_key,
+        execution_plan_snapshot,
+        instance_ref,
+        term_event,
     ):
         self.environment_dict = environment_dict
         self.executor_config = executor_config
         self.pipeline_run = pipeline_run
         self.step_key = step_key
+        self.execution_plan_snapshot = execution_plan_snapshot
         self.instance_ref = instance_ref
         self.term_event = term_event
 
@@ -40,27 +52,166 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
 
         start_termination_thread(self.term_event)
 
-        execution_plan = create_execution_plan(
-            pipeline_def, self.environment_dict, self.pipeline_run
-        ).build_subset_plan([self.step_key])
+        environment_dict = override_env_for_inner_executor(
+            self.environment_dict, self.executor_config.retries, self.step_key, DELEGATE_MARKER,
+        )
+        execution_plan = self.execution_plan_snapshot.rebuild_execution_plan(
+            pipeline_def, environment_dict, self.pipeline_run
+        )
+
+        instance = DagsterInstance.from_ref(self.instance_ref)
+        try:
+            for step_event in execute_plan_iterator(
+                execution_plan,
+                self.pipeline_run,
+                environment_dict=environment_dict,
+                instance=instance,
+            ):
+                yield step_event
+        finally:
+            # Ensures that any events buffered by the instance's event log storage are written
+            # before the child process exits
+            instance.dispose()
+
 
+class InProcessExecutorChildProcessWorkerCommand(ChildProcessWorkerCommand):
+    '''Executes steps sent to a persistent worker process one at a time.
+
+    The pipeline is loaded and the instance rehydrated when the first step is executed, and are
+    reused for the steps that follow. Each step is sent along with a snapshot of the part of the
+    execution plan it needs.'''
+
+    def __init__(self, environment_dict, pipeline_run, executor_config, instance_ref, term_event):
+        self.environment_dict = environment_dict
+        self.executor_config = executor_config
+        self.pipeline_run = pipeline_run
+        self.instance_ref = instance_ref
+        self.term_event = term_event
+
+        self._pipeline_def = None
+        self._instance = None
+
+    def _initialize(self):
+        check.inst(self.executor_config, MultiprocessExecutorConfig)
+        self._pipeline_def = self.executor_config.load_pipeline(self.pipeline_run)
+
+        start_termination_thread(self.term_event)
+
+        self._instance = DagsterInstance.from_ref(self.instance_ref)
+
+    def execute_task(self, task):
+        step_key, execution_plan_snapshot, retries = task
+
+        if self._pipeline_def is None:
+            self._initialize()
+
+        environment_dict = override_env_for_inner_executor(
+            self.environment_dict, retries, step_key, DELEGATE_MARKER,
+        )
         for step_event in execute_plan_iterator(
-            execution_plan,
-            self.pipeline_run,
-            environment_dict=override_env_for_inner_executor(
-                self.environment_dict, self.executor_config.retries, self.step_key, DELEGATE_MARKER,
+            execution_plan_snapshot.rebuild_execution_plan(
+                self._pipeline_def, environment_dict, self.pipeline_run
             ),
-            instance=DagsterInstance.from_ref(self.instance_ref),
+            self.pipeline_run,
+            environment_dict=environment_dict,
+            instance=self._instance,
         ):
             yield step_event
 
+    def dispose(self):
+        # Ensures that any events buffered by the instance's event log storage are written
+        # before the worker process exits
+        if self._instance is not None:
+            self._instance.dispose()
+
+
+class MultiprocessWorkerPool(object):
+    '''Lazily starts persistent worker processes, up to one per concurrently executing step, and
+    reuses them for the steps of a single pipeline run.'''
+
+    def __init__(self, pipeline_context):
+        self._pipeline_context = check.inst_param(
+            pipeline_context, 'pipeline_context', SystemPipelineExecutionContext
+        )
+        self._idle = []
+        self._term_events = {}
+
+    def acquire(self):
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.is_alive:
+                return worker
+            self._discard(worker)
+
+        term_event = get_multiprocessing_context().Event()
+        worker = ChildProcessWorker(
+            InProcessExecutorChildProcessWorkerCommand(
+                self._pipeline_context.environment_dict,
+                self._pipeline_context.pipeline_run,
+                self._pipeline_context.executor_config,
+                self._pipeline_context.instance.get_ref(),
+                term_event,
+            )
+        )
+        self._term_events[worker] = term_event
+        return worker
+
+    def release(self, worker):
+        if worker.is_alive:
+            self._idle.append(worker)
+        else:
+            self._discard(worker)
+
+    def term_event_for(self, worker):
+        return self._term_events[worker]
+
+    def _discard(self, worker):
+        worker.stop()
+        del self._term_events[worker]
+
+    def stop(self):
+        for worker in list(self._term_events.keys()):
+            worker.stop()
+        self._idle = []
+        self._term_events = {}
+
+
+def _snapshot_for_step(execution_plan, step):
+    return ExecutionPlanSnapshot.from_execution_plan(execution_plan.build_subset_plan([step.key]))
+
+
+def execute_step_in_worker(step_context, execution_plan, step, worker, errors, term_events):
+    yield DagsterEvent.engine_event(
+        step_context,
+        'Executing {step_key} in worker process (pid: {pid})'.format(
+            step_key=step.key, pid=worker.pid
+        ),
+        EngineEventData(marker_start=DELEGATE_MARKER),
+        step_key=step.key,
+    )
+
+    for event in _handle_child_process_events(
+        step_context,
+        worker.execute_task(
+            (
+                step.key,
+                _snapshot_for_step(execution_plan, step),
+                step_context.executor_config.retries,
+            )
+        ),
+        errors,
+        term_events,
+    ):
+        yield event
 
-def execute_step_out_of_process(step_context, step, errors, term_events):
+
+def execute_step_out_of_process(step_context, execution_plan, step, errors, term_events):
     command = InProcessExecutorChildProcessCommand(
         step_context.environment_dict,
         step_context.pipeline_run,
         step_context.executor_config,
         step.key,
+        _snapshot_for_step(execution_plan, step),
         step_context.instance.get_ref(),
         term_events[step.key],
     )
@@ -72,12 +223,20 @@ def execute_step_out_of_process(step_context, step, errors, term_events):
         step_key=step.key,
     )
 
-    for ret in execute_child_process_command(command):
+    for event in _handle_child_process_events(
+        step_context, execute_child_process_command(command), errors, term_events
+    ):
+        yield event
+
+
+def _handle_child_process_events(step_context, child_process_events, errors, term_events):
+    for ret in child_process_events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
             if isinstance(ret, ChildProcessSystemErrorEvent):
-                errors[ret.pid] = ret.error_info
+                # A persistent worker executes many steps, so keep the errors of each of them
+                errors[(ret.pid, step_context.step.key)] = ret.error_info
         elif isinstance(ret, KeyboardInterrupt):
             yield DagsterEvent.engine_event(
                 step_context,
@@ -110,9 +269,6 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collection results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         with time_execution_scope() as timer_result:
 
             for event in copy_required_intermediates_for_execution(
@@ -123,75 +279,114 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             active_execution = execution_plan.start(
                 retries=pipeline_context.executor_config.retries
             )
+            intermediate_refs = (
+                IntermediateReferenceCounter(pipeline_context, execution_plan)
+                if pipeline_context.executor_config.release_intermediates
+                else None
+            )
             active_iters = {}
             errors = {}
             term_events = {}
             stopping = False
 
-            while (not stopping and not active_execution.is_complete) or active_iters:
-                try:
-                    # start iterators
-                    while len(active_iters) < limit and not stopping:
-                        steps = active_execution.get_steps_to_execute(
-                            limit=(limit - len(active_iters))
-                        )
-
-                        if not steps:
-                            break
+            worker_pool = None
+            active_workers = {}
+            if pipeline_context.executor_config.persistent_workers:
+                worker_pool = MultiprocessWorkerPool(pipeline_context)
 
-                        for step in steps:
-                            step_context = pipeline_context.for_step(step)
-                            term_events[step.key] = get_multiprocessing_context().Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                step_context, step, errors, term_events
+            try:
+                while (not stopping and not active_execution.is_complete) or active_iters:
+                    try:
+                        # start iterators
+                        while len(active_iters) < limit and not stopping:
+                            steps = active_execution.get_steps_to_execute(
+                                limit=(limit - len(active_iters))
                             )
 
-                    # process active iterators
-                    empty_iters = []
-                    for key, step_iter in active_iters.items():
-                        try:
-                            event_or_none = next(step_iter)
-                            if event_or_none is None:
-                                continue
-                            else:
-                                yield event_or_none
-                                active_execution.handle_event(event_or_none)
-
-                        except StopIteration:
-                            empty_iters.append(key)
-
-                    # clear and mark complete finished iterators
-                    for key in empty_iters:
-                        del active_iters[key]
-                        if term_events[key].is_set():
-                            stopping = True
-                        del term_events[key]
-                        active_execution.verify_complete(pipeline_context, key)
-
-                    # process skips from failures or uncovered inputs
-                    for event in active_execution.skipped_step_events_iterator(pipeline_context):
-                        yield event
-
-                # In the very small chance that we get interrupted in this coordination section and not
-                # polling the subprocesses for events - try to clean up gracefully
-                except KeyboardInterrupt:
-                    yield DagsterEvent.engine_event(
-                        pipeline_context,
-                        'Multiprocess engine: received KeyboardInterrupt - forwarding to active child processes',
-                        EngineEventData.interrupted(list(term_events.keys())),
-                    )
-                    stopping = True
-                    for event in term_events.values():
-                        event.set()
-
-            errs = {pid: err for pid, err in errors.items() if err}
+                            if not steps:
+                                break
+
+                            for step in steps:
+                                step_context = pipeline_context.for_step(step)
+                                if worker_pool is not None:
+                                    worker = worker_pool.acquire()
+                                    active_workers[step.key] = worker
+                                    term_events[step.key] = worker_pool.term_event_for(worker)
+                                    active_iters[step.key] = execute_step_in_worker(
+                                        step_context,
+                                        execution_plan,
+                                        step,
+                                        worker,
+                                        errors,
+                                        term_events,
+                                    )
+                                else:
+                                    term_events[step.key] = get_multiprocessing_context().Event()
+                                    active_iters[step.key] = execute_step_out_of_process(
+                                        step_context, execution_plan, step, errors, term_events
+                                    )
+
+                        # process active iterators
+                        empty_iters = []
+                        for key, step_iter in active_iters.items():
+                            try:
+                                event_or_none = next(step_iter)
+                                if event_or_none is None:
+                                    continue
+                                else:
+                                    yield event_or_none
+                                    active_execution.handle_event(event_or_none)
+
+                                    if intermediate_refs is not None:
+                                        for event in intermediate_refs.release_for_event(
+                                            pipeline_context, event_or_none
+                                        ):
+                                            yield event
+
+                            except StopIteration:
+                                empty_iters.append(key)
+
+                        # clear and mark complete finished iterators
+                        for key in empty_iters:
+                            del active_iters[key]
+                            if term_events[key].is_set():
+                                stopping = True
+                            del term_events[key]
+                            if key in active_workers:
+                                worker_pool.release(active_workers.pop(key))
+                            active_execution.verify_complete(pipeline_context, key)
+
+                        # process skips from failures or uncovered inputs
+                        for event in active_execution.skipped_step_events_iterator(
+                            pipeline_context
+                        ):
+                            yield event
+
+                    # In the very small chance that we get interrupted in this coordination section
+                    # and not polling the subprocesses for events - try to clean up gracefully
+                    except KeyboardInterrupt:
+                        yield DagsterEvent.engine_event(
+                            pipeline_context,
+                            'Multiprocess engine: received KeyboardInterrupt - forwarding to active child processes',
+                            EngineEventData.interrupted(list(term_events.keys())),
+                        )
+                        stopping = True
+                        for event in term_events.values():
+                            event.set()
+            finally:
+                if worker_pool is not None:
+                    worker_pool.stop()
+
+            errs = {key: err for key, err in errors.items() if err}
             if errs:
                 raise DagsterSubprocessError(
                     'During multiprocess execution errors occurred in child processes:\n{error_list}'.format(
                         error_list='\n'.join(
                             [
-                                'In process {pid}: {err}'.format(pid=pid, err=err.to_string())
-                                for pid, err in errs.items()
+                                'In process {pid} executing {step_key}: {err}'.format(
+                                    pid=pid, step_key=step_key, err=err.to_string()
+                                )
+                                for (pid, step_key), err in errs.items()
                             ]
                         )
                     ),
@@ -126,6 +126,14 @@ class DagsterStepOutputNotFoundError(DagsterError):
         super(DagsterStepOutputNotFoundError, self).__init__(*args, **kwargs)
 
 
+class DagsterObjectStoreKeyNotFoundError(DagsterError):
+    '''Thrown by an object store when asked to get an object at a key that does not exist.'''
+
+    def __init__(self, *args, **kwargs):
+        self.key = check.str_param(kwargs.pop('key'), 'key')
+        super(DagsterObjectStoreKeyNotFoundError, self).__init__(*args, **kwargs)
+
+
 def _add_inner_exception_for_py2(msg, exc_info):
     if sys.version_info[0] == 2:
         return (
@@ -53,6 +53,15 @@ class EventRecord(
     def is_dagster_event(self):
         return bool(self.dagster_event)
 
+    @property
+    def event_step_key(self):
+        '''Optional[str]: The key of the step that produced the event, if any.'''
+        if self.step_key:
+            return self.step_key
+        if self.is_dagster_event:
+            return self.dagster_event.step_key
+        return None
+
     def to_json(self):
         return serialize_dagster_namedtuple(self)
 
@@ -74,19 +83,31 @@ class LogMessageRecord(EventRecord):
 def construct_event_record(logger_message):
     check.inst_param(logger_message, 'logger_message', StructuredLoggerMessage)
 
+    return construct_event_record_from_meta(
+        logger_message.message,
+        logger_message.level,
+        logger_message.meta,
+        logger_message.record.created,
+    )
+
+
+def construct_event_record_from_meta(message, level, meta, timestamp):
+    '''Construct an event record from the structured properties of a log message, as built by
+    DagsterLogManager.'''
+
     log_record_cls = LogMessageRecord
-    if logger_message.meta.get('dagster_event'):
+    if meta.get('dagster_event'):
         log_record_cls = DagsterEventRecord
 
     return log_record_cls(
-        message=logger_message.message,
-        level=logger_message.level,
-        user_message=logger_message.meta['orig_message'],
-        run_id=logger_message.meta['run_id'],
-        timestamp=logger_message.record.created,
-        step_key=logger_message.meta.get('step_key'),
-        pipeline_name=logger_message.meta.get('pipeline_name'),
-        dagster_event=logger_message.meta.get('dagster_event'),
+        message=message,
+        level=level,
+        user_message=meta['orig_message'],
+        run_id=meta['run_id'],
+        timestamp=timestamp,
+        step_key=meta.get('step_key'),
+        pipeline_name=meta.get('pipeline_name'),
+        dagster_event=meta.get('dagster_event'),
         error_info=None,
     )
 
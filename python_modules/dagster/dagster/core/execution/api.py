@@ -1,14 +1,21 @@
 import time
 
 from dagster import check
-from dagster.core.definitions import PartitionSetDefinition, PipelineDefinition, SystemStorageData
+from dagster.core.definitions import (
+    ExecutionTargetHandle,
+    PartitionSetDefinition,
+    PipelineDefinition,
+    SystemStorageData,
+)
 from dagster.core.definitions.pipeline import ExecutionSelector
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.memoization import validate_retry_memoization
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.instance import DagsterInstance
+from dagster.core.execution.plan.snapshot import ExecutionPlanSnapshot
+from dagster.core.instance import DagsterInstance, InstanceRef
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.core.utils import make_new_run_id
@@ -341,6 +348,108 @@ def execute_plan(execution_plan, instance, pipeline_run, environment_dict=None):
     )
 
 
+def execute_plan_in_worker_iterator(
+    handle,
+    serialized_pipeline_run,
+    step_keys,
+    instance_ref,
+    environment_dict=None,
+    serialized_execution_plan_snapshot=None,
+):
+    '''This is the entry point of steps executed by the workers of distributed engines, such as
+    Celery and Dask. Its arguments are all serializable, and it yields the events of the execution
+    serialized with serdes, so that they can be sent back to the engine as they are.
+
+    Args:
+        handle (ExecutionTargetHandle): The handle from which the worker loads the pipeline.
+        serialized_pipeline_run (str): The serialized PipelineRun of the steps.
+        step_keys (List[str]): The keys of the steps to execute.
+        instance_ref (Optional[InstanceRef]): The ref of the instance the steps are executed
+            against. Defaults to an ephemeral instance.
+        environment_dict (Optional[dict]): The environment config with which the steps are
+            executed. Defaults to the environment config of the run.
+        serialized_execution_plan_snapshot (Optional[str]): A serialized ExecutionPlanSnapshot of
+            the steps, from which the execution plan is rebuilt instead of being built from the
+            environment config.
+
+    Yields:
+        str: The serialized DagsterEvents of the execution.
+    '''
+    check.inst_param(handle, 'handle', ExecutionTargetHandle)
+    check.str_param(serialized_pipeline_run, 'serialized_pipeline_run')
+    check.list_param(step_keys, 'step_keys', of_type=str)
+    check.opt_inst_param(instance_ref, 'instance_ref', InstanceRef)
+    check.opt_dict_param(environment_dict, 'environment_dict')
+    check.opt_str_param(serialized_execution_plan_snapshot, 'serialized_execution_plan_snapshot')
+
+    pipeline_run = check.inst(
+        deserialize_json_to_dagster_namedtuple(serialized_pipeline_run), PipelineRun
+    )
+    if environment_dict is None:
+        environment_dict = pipeline_run.environment_dict
+
+    pipeline_def = handle.build_pipeline_definition().build_sub_pipeline(
+        pipeline_run.selector.solid_subset
+    )
+
+    if serialized_execution_plan_snapshot is not None:
+        execution_plan_snapshot = check.inst(
+            deserialize_json_to_dagster_namedtuple(serialized_execution_plan_snapshot),
+            ExecutionPlanSnapshot,
+        )
+        check.invariant(
+            execution_plan_snapshot.step_keys_to_execute == step_keys,
+            'Execution plan snapshot does not execute steps {step_keys}'.format(
+                step_keys=step_keys
+            ),
+        )
+        execution_plan = execution_plan_snapshot.rebuild_execution_plan(
+            pipeline_def, environment_dict, pipeline_run
+        )
+    else:
+        execution_plan = create_execution_plan(
+            pipeline_def, environment_dict=environment_dict, run_config=pipeline_run
+        ).build_subset_plan(step_keys)
+
+    instance = (
+        DagsterInstance.from_ref(instance_ref) if instance_ref else DagsterInstance.ephemeral()
+    )
+    try:
+        for event in execute_plan_iterator(
+            execution_plan, pipeline_run, environment_dict=environment_dict, instance=instance,
+        ):
+            yield serialize_dagster_namedtuple(event)
+    finally:
+        # Ensures that any events buffered by the instance's event log storage are written
+        # before the worker moves on
+        instance.dispose()
+
+
+def execute_plan_in_worker(
+    handle,
+    serialized_pipeline_run,
+    step_keys,
+    instance_ref,
+    environment_dict=None,
+    serialized_execution_plan_snapshot=None,
+):
+    '''Executes steps in the worker of a distributed engine, see execute_plan_in_worker_iterator.
+
+    Returns:
+        List[str]: The serialized DagsterEvents of the execution.
+    '''
+    return list(
+        execute_plan_in_worker_iterator(
+            handle,
+            serialized_pipeline_run,
+            step_keys,
+            instance_ref,
+            environment_dict=environment_dict,
+            serialized_execution_plan_snapshot=serialized_execution_plan_snapshot,
+        )
+    )
+
+
 def step_output_event_filter(pipe_iterator):
     for step_event in pipe_iterator:
         if step_event.is_successful_output:
@@ -2,16 +2,14 @@ from __future__ import print_function
 
 import io
 import os
-import subprocess
 import sys
+import threading
 import time
 from contextlib import contextmanager
 
 from dagster import check
-from dagster.core.execution import watch_orphans
 from dagster.core.execution.context.system import SystemStepExecutionContext
 from dagster.core.storage.compute_log_manager import ComputeIOType
-from dagster.seven import IS_WINDOWS
 from dagster.utils import ensure_file
 
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = '''\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m'''
@@ -54,107 +52,105 @@ def warn_if_compute_logs_disabled():
         print(WIN_PY36_COMPUTE_LOG_DISABLED_MSG)
 
 
+# The maximum number of bytes read from the pipe capturing a stream at once
+PIPE_READ_SIZE = 64 * 1024
+
+# How long to wait for captured output to be drained once a step has finished. Subprocesses that
+# outlive the step and still hold the pipe open would otherwise block the step from completing.
+MIRROR_DRAIN_TIMEOUT = 5
+
+
 @contextmanager
-def mirror_io(outpath, errpath, buffering=1):
-    with mirror_stream(outpath, ComputeIOType.STDOUT, buffering):
-        with mirror_stream(errpath, ComputeIOType.STDERR, buffering):
+def mirror_io(outpath, errpath):
+    with mirror_stream(outpath, ComputeIOType.STDOUT):
+        with mirror_stream(errpath, ComputeIOType.STDERR):
             yield
 
 
 @contextmanager
-def mirror_stream(path, io_type, buffering=1):
+def mirror_stream(path, io_type):
     ensure_file(path)
     from_stream = sys.stderr if io_type == ComputeIOType.STDERR else sys.stdout
-    with tailf(path, io_type):
-        with open(path, 'a+', buffering=buffering) as to_stream:
-            with redirect_stream(to_stream=to_stream, from_stream=from_stream):
-                yield
-
-
-@contextmanager
-def redirect_stream(to_stream=os.devnull, from_stream=sys.stdout):
-    # swap the file descriptors to capture system-level output in the process
-    # From https://stackoverflow.com/questions/4675728/redirect-stdout-to-a-file-in-python/22434262#22434262
     from_fd = _fileno(from_stream)
-    to_fd = _fileno(to_stream)
 
-    if not from_fd or not to_fd or should_disable_io_stream_redirect():
+    if not from_fd or should_disable_io_stream_redirect():
         yield
         return
 
-    with os.fdopen(os.dup(from_fd), 'wb') as copied:
+    # Swap the file descriptor of the stream for the write end of a pipe, to capture system-level
+    # output in the process and its subprocesses. A thread copies everything written to the pipe
+    # to the log file and to the original destination of the stream.
+    log_file = open(path, 'ab', 0)
+    mirror_fd = _SharedFd(os.dup(from_fd), users=2)
+    read_fd, write_fd = os.pipe()
+
+    reader = threading.Thread(
+        target=_mirror_pipe,
+        args=(read_fd, log_file, mirror_fd),
+        name='compute-log-{io_type}'.format(io_type=io_type),
+    )
+    reader.daemon = True
+    reader.start()
+
+    from_stream.flush()
+    os.dup2(write_fd, from_fd)
+    os.close(write_fd)
+    try:
+        yield
+    finally:
         from_stream.flush()
-        try:
-            os.dup2(_fileno(to_stream), from_fd)
-        except ValueError:
-            with open(to_stream, 'wb') as to_file:
-                os.dup2(to_file.fileno(), from_fd)
-        try:
-            yield from_stream
-        finally:
-            from_stream.flush()
-            to_stream.flush()
-            os.dup2(copied.fileno(), from_fd)
+        # Restoring the stream closes the last write end of the pipe held by this process, so that
+        # the thread reads the remaining output and exits
+        os.dup2(mirror_fd.fd, from_fd)
+        # Subprocesses that outlive the step may hold the write end open, in which case the thread
+        # keeps mirroring their output, and the descriptor stays open until it exits
+        reader.join(MIRROR_DRAIN_TIMEOUT)
+        mirror_fd.release()
 
 
-POLLING_INTERVAL = 0.1
+class _SharedFd(object):
+    '''A file descriptor that is closed once each of its users has released it.'''
 
+    def __init__(self, fd, users):
+        self.fd = fd
+        self._users = users
+        self._lock = threading.Lock()
 
-@contextmanager
-def tailf(path, io_type=ComputeIOType.STDOUT):
-    if IS_WINDOWS:
-        with execute_windows_tail(path, io_type):
-            yield
-    else:
-        with execute_posix_tail(path, io_type):
-            yield
+    def release(self):
+        with self._lock:
+            self._users -= 1
+            if self._users == 0:
+                os.close(self.fd)
 
 
-@contextmanager
-def execute_windows_tail(path, io_type):
-    # Cannot use multiprocessing here because we already may be in a daemonized process
-    # Instead, invoke a thin wrapper around tail_polling using the dagster cli
-    cmd = '{} -m dagster utils tail {} --parent-pid {} --io-type {}'.format(
-        sys.executable, path, os.getpid(), io_type
-    ).split(' ')
-    tail_process = subprocess.Popen(cmd)
-
+def _mirror_pipe(read_fd, log_file, mirror_fd):
+    is_mirroring = True
     try:
-        yield
+        while True:
+            data = os.read(read_fd, PIPE_READ_SIZE)
+            if not data:
+                break
+
+            log_file.write(data)
+            if is_mirroring:
+                try:
+                    _write_fully(mirror_fd.fd, data)
+                except OSError:
+                    # keep capturing to the log file if the original destination goes away
+                    is_mirroring = False
     finally:
-        if tail_process:
-            time.sleep(2 * POLLING_INTERVAL)
-            tail_process.terminate()
-
+        os.close(read_fd)
+        log_file.close()
+        mirror_fd.release()
 
-@contextmanager
-def execute_posix_tail(path, io_type):
-    # open a subprocess to tail the file and print to stdout
-    tail_cmd = 'tail -F -c +0 {}'.format(path).split(' ')
-    stream = sys.stdout if io_type == ComputeIOType.STDOUT else sys.stderr
-    stream = stream if _fileno(stream) else None
-    tail_process = subprocess.Popen(tail_cmd, stdout=stream)
-
-    # open a watcher process to check for the orphaning of the tail process (e.g. when the
-    # current process is suddenly killed)
-    watcher_file = os.path.abspath(watch_orphans.__file__)
-    watcher_process = subprocess.Popen(
-        [sys.executable, watcher_file, str(os.getpid()), str(tail_process.pid),]
-    )
 
-    try:
-        yield
-    finally:
-        _clean_up_subprocess(tail_process)
-        _clean_up_subprocess(watcher_process)
+def _write_fully(fd, data):
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
 
 
-def _clean_up_subprocess(subprocess_obj):
-    try:
-        if subprocess_obj:
-            subprocess_obj.terminate()
-    except OSError:
-        pass
+POLLING_INTERVAL = 0.1
 
 
 def tail_polling(filepath, stream=sys.stdout, parent_pid=None):
@@ -116,9 +116,12 @@ class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
 
 
 class InProcessExecutorConfig(ExecutorConfig):
-    def __init__(self, retries, marker_to_close):
+    def __init__(self, retries, marker_to_close, release_intermediates=False):
         self.retries = check.inst_param(retries, 'retries', Retries)
         self.marker_to_close = check.opt_str_param(marker_to_close, 'marker_to_close')
+        self.release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
 
     def get_engine(self):
         from dagster.core.engine.engine_inprocess import InProcessEngine
@@ -127,13 +130,24 @@ class InProcessExecutorConfig(ExecutorConfig):
 
 
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, retries, max_concurrent=None):
+    def __init__(
+        self,
+        handle,
+        retries,
+        max_concurrent=None,
+        persistent_workers=False,
+        release_intermediates=False,
+    ):
         from dagster import ExecutionTargetHandle
 
         self._handle = check.inst_param(handle, 'handle', ExecutionTargetHandle,)
         self.retries = check.inst_param(retries, 'retries', Retries)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.persistent_workers = check.bool_param(persistent_workers, 'persistent_workers')
+        self.release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
 
     def load_pipeline(self, pipeline_run):
         from dagster.core.storage.pipeline_run import PipelineRun
@@ -0,0 +1,112 @@
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.storage.object_store import ObjectStoreOperation
+
+
+class IntermediateReferenceCounter(object):
+    '''Tracks which steps of an execution plan still need to consume each intermediate, so that
+    intermediates may be released as soon as every step that consumes them has succeeded.
+
+    An intermediate is only ever released if it was produced by a step executing in this run and
+    all of its consumers are executing in this run. Intermediates that are not consumed by any
+    step (so may be inspected once the run is over) and outputs configured for materialization are
+    always kept. A consumer that fails, is skipped or is up for retry never releases its inputs, so
+    they remain available to retries and to re-execution of the run.
+    '''
+
+    def __init__(self, pipeline_context, execution_plan):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        self.execution_plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        step_keys_to_execute = set(execution_plan.step_keys_to_execute)
+        consumers = defaultdict(set)
+        for step in execution_plan.steps:
+            for step_input in step.step_inputs:
+                for source_handle in step_input.source_handles:
+                    consumers[source_handle].add(step.key)
+
+        self._pending_consumers = {}
+        for source_handle, consumer_keys in consumers.items():
+            if (
+                source_handle.step_key in step_keys_to_execute
+                and consumer_keys.issubset(step_keys_to_execute)
+                and not _is_configured_for_materialization(
+                    pipeline_context, execution_plan, source_handle
+                )
+            ):
+                self._pending_consumers[source_handle] = set(consumer_keys)
+
+        self._handles_by_consumer = defaultdict(list)
+        for source_handle, consumer_keys in self._pending_consumers.items():
+            for step_key in consumer_keys:
+                self._handles_by_consumer[step_key].append(source_handle)
+
+    def mark_success(self, step_key):
+        '''Record that a step has succeeded.
+
+        Returns:
+            List[StepOutputHandle]: The intermediates that are no longer needed by any step.
+        '''
+        check.str_param(step_key, 'step_key')
+
+        releasable = []
+        for source_handle in self._handles_by_consumer.pop(step_key, []):
+            pending = self._pending_consumers[source_handle]
+            pending.discard(step_key)
+            if not pending:
+                del self._pending_consumers[source_handle]
+                releasable.append(source_handle)
+
+        return releasable
+
+    def release_for_event(self, pipeline_context, dagster_event):
+        '''Release the intermediates that are no longer needed once the step that emitted the event
+        has succeeded, yielding an event for each intermediate removed from an object store.'''
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.inst_param(dagster_event, 'dagster_event', DagsterEvent)
+
+        if dagster_event.event_type != DagsterEventType.STEP_SUCCESS:
+            return
+
+        intermediates_manager = pipeline_context.intermediates_manager
+        for source_handle in self.mark_success(dagster_event.step_key):
+            step_context = pipeline_context.for_step(
+                self.execution_plan.get_step_by_key(source_handle.step_key)
+            )
+            operation = intermediates_manager.rm_intermediate(step_context, source_handle)
+            if operation is None:
+                step_context.log.debug(
+                    'Released intermediate for output {output_name} of step {step_key}.'.format(
+                        output_name=source_handle.output_name, step_key=source_handle.step_key
+                    )
+                )
+            else:
+                yield DagsterEvent.object_store_operation(
+                    step_context,
+                    ObjectStoreOperation.serializable(
+                        operation, value_name=source_handle.output_name
+                    ),
+                )
+
+
+def _is_configured_for_materialization(pipeline_context, execution_plan, step_output_handle):
+    step = execution_plan.get_step_by_key(step_output_handle.step_key)
+    current_handle = step.solid_handle
+
+    # mirror the lookup of output materializations up the composition hierarchy
+    while current_handle:
+        solid_config = pipeline_context.environment_config.solids.get(current_handle.to_string())
+        current_handle = current_handle.parent
+
+        if solid_config is None:
+            continue
+
+        for output_spec in solid_config.outputs:
+            if step_output_handle.output_name in output_spec:
+                return True
+
+    return False
@@ -45,7 +45,9 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
     if not previous_run_id:
         return
 
-    previous_run_logs = pipeline_context.instance.all_logs(execution_plan.previous_run_id)
+    previous_run_logs = get_previous_run_logs_for_memoization(
+        pipeline_context.instance, previous_run_id
+    )
 
     output_handles_for_current_run = output_handles_from_execution_plan(execution_plan)
     output_handles_from_previous_run = output_handles_from_event_logs(previous_run_logs)
@@ -56,20 +58,35 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
     for handle in output_handles_to_copy:
         output_handles_to_copy_by_step[handle.step_key].append(handle)
 
-    intermediates_manager = pipeline_context.intermediates_manager
-    for step in execution_plan.topological_steps():
-        step_context = pipeline_context.for_step(step)
-        for handle in output_handles_to_copy_by_step.get(step.key, []):
-            if intermediates_manager.has_intermediate(pipeline_context, handle):
-                continue
+    steps_and_handles = [
+        (step, handle)
+        for step in execution_plan.topological_steps()
+        for handle in sorted(output_handles_to_copy_by_step.get(step.key, []))
+    ]
 
-            operation = intermediates_manager.copy_intermediate_from_prev_run(
-                pipeline_context, previous_run_id, handle
-            )
-            yield DagsterEvent.object_store_operation(
-                step_context,
-                ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
-            )
+    operations = pipeline_context.intermediates_manager.copy_intermediates_from_prev_run(
+        pipeline_context, previous_run_id, [handle for _, handle in steps_and_handles]
+    )
+
+    for (step, handle), operation in zip(steps_and_handles, operations):
+        if operation is None:
+            continue
+
+        yield DagsterEvent.object_store_operation(
+            pipeline_context.for_step(step),
+            ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
+        )
+
+
+def get_previous_run_logs_for_memoization(instance, previous_run_id):
+    '''Fetch only the logs of a previous run that determine which of its steps failed and which
+    outputs it wrote to the intermediate store.'''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(previous_run_id, 'previous_run_id')
+
+    return instance.get_logs_for_run_by_type(
+        previous_run_id, [DagsterEventType.STEP_FAILURE, DagsterEventType.OBJECT_STORE_OPERATION],
+    )
 
 
 def is_step_failure_event(record):
@@ -95,6 +112,17 @@ def is_intermediate_store_write_event(record):
     )
 
 
+def is_intermediate_store_rm_event(record):
+    check.inst_param(record, 'record', EventRecord)
+    if not record.is_dagster_event:
+        return False
+
+    return (
+        record.dagster_event.event_type_value == DagsterEventType.OBJECT_STORE_OPERATION.value
+        and record.dagster_event.event_specific_data.op == ObjectStoreOperationType.RM_OBJECT.value
+    )
+
+
 def output_handles_from_event_logs(event_logs):
     output_handles_from_previous_run = set()
     failed_step_keys = set(
@@ -102,6 +130,16 @@ def output_handles_from_event_logs(event_logs):
     )
 
     for record in event_logs:
+        if is_intermediate_store_rm_event(record):
+            # intermediates released during the run are no longer available to copy
+            output_handles_from_previous_run.discard(
+                StepOutputHandle(
+                    record.dagster_event.step_key,
+                    record.dagster_event.event_specific_data.value_name,
+                )
+            )
+            continue
+
         if not is_intermediate_store_write_event(record):
             continue
 
@@ -136,7 +174,9 @@ def get_retry_steps_from_execution_plan(instance, execution_plan):
         return execution_plan.step_keys_to_execute
 
     previous_run = instance.get_run_by_id(execution_plan.previous_run_id)
-    previous_run_logs = instance.all_logs(execution_plan.previous_run_id)
+    previous_run_logs = get_previous_run_logs_for_memoization(
+        instance, execution_plan.previous_run_id
+    )
     failed_step_keys = set(
         record.dagster_event.step_key
         for record in previous_run_logs
@@ -1,3 +1,4 @@
+import heapq
 import time
 
 from dagster import check
@@ -13,6 +14,10 @@ def _default_sort_key(step):
 
 class ActiveExecution(object):
     '''State machine used to track progress through execution of an ExecutionPlan
+
+    Each pending step keeps a count of its dependencies that have yet to complete, so that
+    completing a step only visits the steps immediately downstream of it. The dependencies are
+    taken from the plan, which computes them once.
     '''
 
     def __init__(self, execution_plan, retries, sort_key_fn=None):
@@ -23,8 +28,27 @@ class ActiveExecution(object):
         # All steps to be executed start out here in _pending
         self._pending = self._plan.execution_deps()
 
-        # steps move in to these buckets as a result of _update calls
+        # index of each step in the plan, used to order steps that become ready at the same time
+        self._step_index = {key: index for index, key in enumerate(self._pending.keys())}
+
+        # number of dependencies of each pending step that have yet to complete
+        self._remaining_deps = {
+            key: len(requirements) for key, requirements in self._pending.items()
+        }
+
+        # reverse index of the dependencies, from each step to the steps that depend on it
+        self._downstream = self._plan.execution_downstream_deps()
+
+        # pending steps with a dependency that completed without success, which will be skipped
+        self._has_unsuccessful_deps = set()
+
+        # pending steps all of whose dependencies have completed, moved out of _pending by _update
+        self._newly_ready = [key for key, count in self._remaining_deps.items() if count == 0]
+
+        # steps move in to these buckets as a result of _update calls. _executable is a heap
+        # ordered by sort key, and then by the order in which steps became executable.
         self._executable = []
+        self._executable_count = 0
         self._pending_skip = []
         self._pending_retry = []
         self._waiting_to_retry = {}
@@ -41,27 +65,33 @@ class ActiveExecution(object):
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
+    def _push_executable(self, step_key):
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self._plan.get_step_by_key(step_key)),
+                self._executable_count,
+                step_key,
+            ),
+        )
+        self._executable_count += 1
+
     def _update(self):
         '''Moves steps from _pending to _executable / _pending_skip / _pending_retry
            as a function of what has been _completed
         '''
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        for step_key, requirements in self._pending.items():
-
-            if requirements.issubset(self._completed):
-                if requirements.issubset(self._success):
-                    new_steps_to_execute.append(step_key)
+        if self._newly_ready:
+            for key in sorted(self._newly_ready, key=self._step_index.get):
+                del self._pending[key]
+                if key in self._has_unsuccessful_deps:
+                    self._pending_skip.append(key)
                 else:
-                    new_steps_to_skip.append(step_key)
+                    self._push_executable(key)
+            self._newly_ready = []
 
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+        for key in self._pending_retry:
+            self._push_executable(key)
+        self._pending_retry = []
 
         ready_to_retry = []
         tick_time = time.time()
@@ -70,7 +100,7 @@ class ActiveExecution(object):
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_til_ready(self):
@@ -98,28 +128,20 @@ class ActiveExecution(object):
         check.opt_int_param(limit, 'limit')
         self._update()
 
-        steps = sorted(
-            [self._plan.get_step_by_key(key) for key in self._executable], key=self._sort_key_fn
-        )
-
-        if limit:
-            steps = steps[:limit]
-
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        while self._executable and (not limit or len(steps) < limit):
+            _, _, key = heapq.heappop(self._executable)
+            steps.append(self._plan.get_step_by_key(key))
+            self._in_flight.add(key)
 
         return steps
 
     def get_steps_to_skip(self):
         self._update()
 
-        steps = []
-        steps_to_skip = list(self._pending_skip)
-        for key in steps_to_skip:
-            steps.append(self._plan.get_step_by_key(key))
-            self._in_flight.add(key)
-            self._pending_skip.remove(key)
+        steps = [self._plan.get_step_by_key(key) for key in self._pending_skip]
+        self._in_flight.update(self._pending_skip)
+        self._pending_skip = []
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -174,10 +196,11 @@ class ActiveExecution(object):
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.execution_deps()[step_key]
+                self._pending_retry.append(step_key)
 
         elif self._retries.deferred:
             self._completed.add(step_key)
+            self._resolve_downstream(step_key)
 
         self._retries.mark_attempt(step_key)
         self._in_flight.remove(step_key)
@@ -195,6 +218,21 @@ class ActiveExecution(object):
         )
         self._in_flight.remove(step_key)
         self._completed.add(step_key)
+        self._resolve_downstream(step_key)
+
+    def _resolve_downstream(self, step_key):
+        '''Account for the completion of step_key in the steps that depend on it'''
+        success = step_key in self._success
+        for downstream_key in self._downstream[step_key]:
+            if downstream_key not in self._pending:
+                continue
+
+            if not success:
+                self._has_unsuccessful_deps.add(downstream_key)
+
+            self._remaining_deps[downstream_key] -= 1
+            if self._remaining_deps[downstream_key] == 0:
+                self._newly_ready.append(downstream_key)
 
     def handle_event(self, dagster_event):
         check.inst_param(dagster_event, 'dagster_event', DagsterEvent)
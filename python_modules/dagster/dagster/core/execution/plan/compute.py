@@ -22,6 +22,16 @@ def create_compute_step(pipeline_name, environment_config, solid, step_inputs, h
         for output_spec in solid_config.outputs:
             config_output_names = config_output_names.union(output_spec.keys())
 
+    return build_compute_step(pipeline_name, solid, step_inputs, handle, config_output_names)
+
+
+def build_compute_step(pipeline_name, solid, step_inputs, handle, output_names_to_materialize):
+    check.str_param(pipeline_name, 'pipeline_name')
+    check.inst_param(solid, 'solid', Solid)
+    check.list_param(step_inputs, 'step_inputs', of_type=StepInput)
+    check.opt_inst_param(handle, 'handle', SolidHandle)
+    check.set_param(output_names_to_materialize, 'output_names_to_materialize', of_type=str)
+
     return ExecutionStep(
         pipeline_name=pipeline_name,
         key_suffix='compute',
@@ -31,7 +41,7 @@ def create_compute_step(pipeline_name, environment_config, solid, step_inputs, h
                 name=name,
                 dagster_type=output_def.dagster_type,
                 optional=output_def.optional,
-                should_materialize=name in config_output_names,
+                should_materialize=name in output_names_to_materialize,
             )
             for name, output_def in solid.definition.output_dict.items()
         ],
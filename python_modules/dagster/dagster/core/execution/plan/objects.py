@@ -115,10 +115,12 @@ class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms')):
         )
 
 
+@whitelist_for_serdes
 class StepKind(Enum):
     COMPUTE = 'COMPUTE'
 
 
+@whitelist_for_serdes
 class StepInputSourceType(Enum):
     SINGLE_OUTPUT = 'SINGLE_OUTPUT'
     MULTIPLE_OUTPUTS = 'MULTIPLE_OUTPUTS'
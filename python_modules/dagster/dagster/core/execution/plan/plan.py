@@ -257,6 +257,96 @@ def get_step_input(
     )
 
 
+class _StepGraph(object):
+    '''The steps of an execution plan and the dependencies between them.
+
+    These do not change once a plan has been built, so they are shared by every plan built as a
+    subset of it, along with the topological order of the steps, which is computed at most once.
+    '''
+
+    def __init__(self, step_dict, deps):
+        self.step_dict = step_dict
+        self.deps = deps
+        self.steps = list(step_dict.values())
+        self._step_levels = None
+        self._step_key_index = None
+
+    @property
+    def step_levels(self):
+        if self._step_levels is None:
+            self._step_levels = [
+                [self.step_dict[step_key] for step_key in step_key_level]
+                for step_key_level in toposort(self.deps)
+            ]
+        return self._step_levels
+
+    @property
+    def step_key_index(self):
+        '''The position of each step in topological order'''
+        if self._step_key_index is None:
+            self._step_key_index = {
+                step.key: index
+                for index, step in enumerate(step for level in self.step_levels for step in level)
+            }
+        return self._step_key_index
+
+
+class _ExecutionTopology(object):
+    '''The dependencies between the steps an execution plan will execute, computed on first use.
+
+    Only dependencies on other steps to execute are considered, so levels are derived from the
+    topological order of the whole plan rather than by sorting the subset again.
+    '''
+
+    def __init__(self, step_graph, step_keys_to_execute):
+        self.step_graph = step_graph
+        self._step_keys_to_execute = step_keys_to_execute
+        self._deps = None
+        self._downstream_deps = None
+        self._step_levels = None
+
+    @property
+    def deps(self):
+        if self._deps is None:
+            to_execute = set(self._step_keys_to_execute)
+            deps = OrderedDict()
+            for step_key in self._step_keys_to_execute:
+                deps[step_key] = self.step_graph.deps[step_key].intersection(to_execute)
+            self._deps = deps
+        return self._deps
+
+    @property
+    def downstream_deps(self):
+        if self._downstream_deps is None:
+            downstream_deps = OrderedDict((step_key, set()) for step_key in self.deps)
+            for step_key, requirements in self.deps.items():
+                for requirement in requirements:
+                    downstream_deps[requirement].add(step_key)
+            self._downstream_deps = downstream_deps
+        return self._downstream_deps
+
+    @property
+    def step_levels(self):
+        if self._step_levels is None:
+            # Each step is one level below the deepest of its dependencies, which precede it in
+            # topological order
+            step_key_levels = []
+            level_by_key = {}
+            for step_key in sorted(self.deps, key=self.step_graph.step_key_index.get):
+                requirements = self.deps[step_key]
+                level = max(level_by_key[req] for req in requirements) + 1 if requirements else 0
+                level_by_key[step_key] = level
+                if level == len(step_key_levels):
+                    step_key_levels.append([])
+                step_key_levels[level].append(step_key)
+
+            self._step_levels = [
+                [self.step_graph.step_dict[step_key] for step_key in sorted(step_key_level)]
+                for step_key_level in step_key_levels
+            ]
+        return self._step_levels
+
+
 class ExecutionPlan(
     namedtuple(
         '_ExecutionPlan',
@@ -271,6 +361,7 @@ class ExecutionPlan(
         artifacts_persisted,
         previous_run_id,
         step_keys_to_execute,
+        step_graph=None,
     ):
         missing_steps = [step_key for step_key in step_keys_to_execute if step_key not in step_dict]
         if missing_steps:
@@ -280,20 +371,53 @@ class ExecutionPlan(
                 ),
                 step_keys=missing_steps,
             )
-        return super(ExecutionPlan, cls).__new__(
+
+        # Subset plans share the steps of the plan they were built from, which were checked when
+        # that plan was built
+        if step_graph is None:
+            step_graph = _StepGraph(
+                check.dict_param(step_dict, 'step_dict', key_type=str, value_type=ExecutionStep),
+                check.dict_param(deps, 'deps', key_type=str, value_type=set),
+            )
+        else:
+            check.inst_param(step_graph, 'step_graph', _StepGraph)
+            check.param_invariant(
+                step_graph.step_dict is step_dict and step_graph.deps is deps, 'step_graph'
+            )
+
+        step_keys_to_execute = check.list_param(
+            step_keys_to_execute, 'step_keys_to_execute', of_type=str
+        )
+
+        plan = super(ExecutionPlan, cls).__new__(
             cls,
             pipeline_def=check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition),
-            step_dict=check.dict_param(
-                step_dict, 'step_dict', key_type=str, value_type=ExecutionStep
-            ),
-            deps=check.dict_param(deps, 'deps', key_type=str, value_type=set),
-            steps=list(step_dict.values()),
+            step_dict=step_graph.step_dict,
+            deps=step_graph.deps,
+            steps=step_graph.steps,
             artifacts_persisted=check.bool_param(artifacts_persisted, 'artifacts_persisted'),
             previous_run_id=check.opt_str_param(previous_run_id, 'previous_run_id'),
-            step_keys_to_execute=check.list_param(
-                step_keys_to_execute, 'step_keys_to_execute', of_type=str
-            ),
+            step_keys_to_execute=step_keys_to_execute,
         )
+        # Kept out of the tuple, so that plans compare by their fields alone
+        plan._step_graph = step_graph
+        return plan
+
+    @property
+    def topology(self):
+        # Plans made with _replace are not built by __new__, so the topology is derived from the
+        # fields of the plan on first use, rather than copied from the plan it was made from
+        if '_topology' not in self.__dict__:
+            step_graph = self.__dict__.get('_step_graph')
+            if (
+                step_graph is None
+                or step_graph.step_dict is not self.step_dict
+                or step_graph.deps is not self.deps
+            ):
+                step_graph = _StepGraph(self.step_dict, self.deps)
+                self._step_graph = step_graph
+            self._topology = _ExecutionTopology(step_graph, self.step_keys_to_execute)
+        return self._topology
 
     def get_step_output(self, step_output_handle):
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
@@ -309,36 +433,29 @@ class ExecutionPlan(
         return self.step_dict[key]
 
     def topological_steps(self):
-        return [step for step_level in self.topological_step_levels() for step in step_level]
+        return [step for step_level in self.topology.step_graph.step_levels for step in step_level]
 
     def topological_step_levels(self):
-        return [
-            [self.step_dict[step_key] for step_key in sorted(step_key_level)]
-            for step_key_level in toposort(self.deps)
-        ]
+        return [list(step_level) for step_level in self.topology.step_graph.step_levels]
 
     def execution_step_levels(self):
-        return [
-            [self.step_dict[step_key] for step_key in sorted(step_key_level)]
-            for step_key_level in toposort(self.execution_deps())
-        ]
+        return [list(step_level) for step_level in self.topology.step_levels]
 
     def missing_steps(self):
         return [step_key for step_key in self.step_keys_to_execute if not self.has_step(step_key)]
 
     def execution_deps(self):
-        deps = OrderedDict()
-
-        for key in self.step_keys_to_execute:
-            deps[key] = set()
+        '''The dependencies of each step to execute on the other steps to execute.'''
+        return OrderedDict(
+            (step_key, set(requirements)) for step_key, requirements in self.topology.deps.items()
+        )
 
-        for key in self.step_keys_to_execute:
-            step = self.step_dict[key]
-            for step_input in step.step_inputs:
-                deps[step.key].update(
-                    step_input.dependency_keys.intersection(self.step_keys_to_execute)
-                )
-        return deps
+    def execution_downstream_deps(self):
+        '''The steps to execute that depend on each step to execute.'''
+        return OrderedDict(
+            (step_key, set(dependents))
+            for step_key, dependents in self.topology.downstream_deps.items()
+        )
 
     def build_subset_plan(self, step_keys_to_execute):
         check.list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
@@ -349,6 +466,7 @@ class ExecutionPlan(
             self.artifacts_persisted,
             self.previous_run_id,
             step_keys_to_execute,
+            step_graph=self.topology.step_graph,
         )
 
     def start(
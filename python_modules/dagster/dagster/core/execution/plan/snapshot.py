@@ -0,0 +1,345 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+from dagster import check
+from dagster.core.definitions import CompositeSolidDefinition, PipelineDefinition, SolidHandle
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.config import IRunConfig
+from dagster.core.serdes import whitelist_for_serdes
+from dagster.core.system_config.objects import EnvironmentConfig
+
+from .compute import build_compute_step
+from .objects import StepInput, StepInputSourceType, StepKind, StepOutputHandle
+from .plan import ExecutionPlan
+
+_PIPELINE_FINGERPRINTS = weakref.WeakKeyDictionary()
+_PIPELINE_FINGERPRINTS_LOCK = threading.Lock()
+
+
+def pipeline_fingerprint(pipeline_def):
+    '''A digest of the structure of a pipeline from which the steps of its execution plans are
+    built: its solids, their inputs, outputs and tags, the dependencies between them and the
+    mappings of composite solids.
+
+    Returns:
+        str: The hex digest, computed once per pipeline definition.
+    '''
+    check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+
+    with _PIPELINE_FINGERPRINTS_LOCK:
+        fingerprint = _PIPELINE_FINGERPRINTS.get(pipeline_def)
+    if fingerprint is not None:
+        return fingerprint
+
+    digest = hashlib.sha1(pipeline_def.name.encode('utf-8'))
+    _update_fingerprint(digest, pipeline_def, None)
+    fingerprint = digest.hexdigest()
+
+    with _PIPELINE_FINGERPRINTS_LOCK:
+        _PIPELINE_FINGERPRINTS[pipeline_def] = fingerprint
+    return fingerprint
+
+
+def _update_fingerprint(digest, container, parent_handle):
+    dependency_structure = container.dependency_structure
+    for solid in sorted(container.solids, key=lambda solid: solid.name):
+        solid_def = solid.definition
+        handle = SolidHandle(solid.name, solid_def.name, parent_handle)
+
+        inputs = []
+        for input_def in solid_def.input_defs:
+            input_handle = solid.input_handle(input_def.name)
+            if dependency_structure.has_singular_dep(input_handle):
+                upstream = [dependency_structure.get_singular_dep(input_handle)]
+            elif dependency_structure.has_multi_deps(input_handle):
+                upstream = dependency_structure.get_multi_deps(input_handle)
+            else:
+                upstream = []
+            inputs.append(
+                (
+                    input_def.name,
+                    input_def.dagster_type.key,
+                    [(output.solid.name, output.output_def.name) for output in upstream],
+                )
+            )
+
+        outputs = [
+            (output_def.name, output_def.dagster_type.key, output_def.optional)
+            for output_def in solid_def.output_defs
+        ]
+
+        mappings = None
+        if isinstance(solid_def, CompositeSolidDefinition):
+            mappings = (
+                [
+                    (mapping.definition.name, mapping.solid_name, mapping.input_name)
+                    for mapping in solid_def.input_mappings
+                ],
+                [
+                    (mapping.definition.name, mapping.solid_name, mapping.output_name)
+                    for mapping in solid_def.output_mappings
+                ],
+            )
+
+        digest.update(
+            repr(
+                (
+                    handle.to_string(),
+                    solid_def.name,
+                    sorted(solid.tags.items()),
+                    inputs,
+                    outputs,
+                    mappings,
+                )
+            ).encode('utf-8')
+        )
+
+        if isinstance(solid_def, CompositeSolidDefinition):
+            _update_fingerprint(digest, solid_def, handle)
+
+
+@whitelist_for_serdes
+class ExecutionStepInputSnap(
+    namedtuple('_ExecutionStepInputSnap', 'name source_type source_handles')
+):
+    '''The config of inputs sourced from config is not part of the snapshot, since once processed it
+    may not be serializable. It is processed again from the environment config of the executing
+    process when the step is rebuilt.'''
+
+    def __new__(cls, name, source_type, source_handles):
+        return super(ExecutionStepInputSnap, cls).__new__(
+            cls,
+            name=check.str_param(name, 'name'),
+            source_type=check.inst_param(source_type, 'source_type', StepInputSourceType),
+            source_handles=check.list_param(
+                source_handles, 'source_handles', of_type=StepOutputHandle
+            ),
+        )
+
+
+@whitelist_for_serdes
+class ExecutionStepOutputSnap(namedtuple('_ExecutionStepOutputSnap', 'name should_materialize')):
+    def __new__(cls, name, should_materialize):
+        return super(ExecutionStepOutputSnap, cls).__new__(
+            cls,
+            name=check.str_param(name, 'name'),
+            should_materialize=check.bool_param(should_materialize, 'should_materialize'),
+        )
+
+
+@whitelist_for_serdes
+class ExecutionStepSnap(
+    namedtuple('_ExecutionStepSnap', 'solid_handle key_suffix kind inputs outputs')
+):
+    def __new__(cls, solid_handle, key_suffix, kind, inputs, outputs):
+        return super(ExecutionStepSnap, cls).__new__(
+            cls,
+            solid_handle=check.inst_param(solid_handle, 'solid_handle', SolidHandle),
+            key_suffix=check.str_param(key_suffix, 'key_suffix'),
+            kind=check.inst_param(kind, 'kind', StepKind),
+            inputs=check.list_param(inputs, 'inputs', of_type=ExecutionStepInputSnap),
+            outputs=check.list_param(outputs, 'outputs', of_type=ExecutionStepOutputSnap),
+        )
+
+    @property
+    def key(self):
+        return str(self.solid_handle) + '.' + self.key_suffix
+
+
+@whitelist_for_serdes
+class ExecutionPlanSnapshot(
+    namedtuple(
+        '_ExecutionPlanSnapshot',
+        'pipeline_name pipeline_fingerprint steps artifacts_persisted previous_run_id '
+        'step_keys_to_execute',
+    )
+):
+    '''The steps of an execution plan that are needed to execute some of them, in a form that can
+    be serialized with serdes and sent to the processes that execute those steps.
+
+    The steps are rebuilt against the pipeline definition loaded by the executing process, which
+    is much cheaper than building the plan again, and only if that definition has the same
+    fingerprint as the one the plan was built from.
+    '''
+
+    def __new__(
+        cls,
+        pipeline_name,
+        pipeline_fingerprint,  # pylint: disable=redefined-outer-name
+        steps,
+        artifacts_persisted,
+        previous_run_id,
+        step_keys_to_execute,
+    ):
+        return super(ExecutionPlanSnapshot, cls).__new__(
+            cls,
+            pipeline_name=check.str_param(pipeline_name, 'pipeline_name'),
+            pipeline_fingerprint=check.str_param(pipeline_fingerprint, 'pipeline_fingerprint'),
+            steps=check.list_param(steps, 'steps', of_type=ExecutionStepSnap),
+            artifacts_persisted=check.bool_param(artifacts_persisted, 'artifacts_persisted'),
+            previous_run_id=check.opt_str_param(previous_run_id, 'previous_run_id'),
+            step_keys_to_execute=check.list_param(
+                step_keys_to_execute, 'step_keys_to_execute', of_type=str
+            ),
+        )
+
+    @staticmethod
+    def from_execution_plan(execution_plan):
+        '''Snapshot the steps a plan executes, along with the steps whose outputs they consume,
+        which the executing process needs in order to load their inputs.'''
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        step_keys = set(execution_plan.step_keys_to_execute)
+        for step_key in execution_plan.step_keys_to_execute:
+            step_keys.update(execution_plan.deps[step_key])
+
+        return ExecutionPlanSnapshot(
+            pipeline_name=execution_plan.pipeline_def.name,
+            pipeline_fingerprint=pipeline_fingerprint(execution_plan.pipeline_def),
+            steps=[
+                _snap_from_step(execution_plan.get_step_by_key(step_key))
+                for step_key in sorted(
+                    step_keys, key=execution_plan.topology.step_graph.step_key_index.get
+                )
+            ],
+            artifacts_persisted=execution_plan.artifacts_persisted,
+            previous_run_id=execution_plan.previous_run_id,
+            step_keys_to_execute=execution_plan.step_keys_to_execute,
+        )
+
+    def rebuild_execution_plan(self, pipeline_def, environment_dict, run_config=None):
+        '''Rebuild the execution plan from the pipeline definition loaded by this process.
+
+        Args:
+            pipeline_def (PipelineDefinition): The pipeline definition loaded by this process.
+            environment_dict (dict): The environment config the steps are executed with, from
+                which the config of their inputs is processed.
+            run_config (Optional[IRunConfig]): The run config the steps are executed with.
+
+        Raises:
+            DagsterInvariantViolationError: If the pipeline definition has changed since the
+                snapshot was taken.
+        '''
+        check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+        check.dict_param(environment_dict, 'environment_dict')
+        check.opt_inst_param(run_config, 'run_config', IRunConfig)
+
+        if (
+            pipeline_def.name != self.pipeline_name
+            or pipeline_fingerprint(pipeline_def) != self.pipeline_fingerprint
+        ):
+            raise DagsterInvariantViolationError(
+                (
+                    'Execution plan snapshot for pipeline {snapshot_name} does not match the '
+                    'definition of pipeline {pipeline_name} loaded in this process, which may '
+                    'have changed since the plan was built.'
+                ).format(snapshot_name=self.pipeline_name, pipeline_name=pipeline_def.name)
+            )
+
+        environment_config = None
+        if any(
+            input_snap.source_type == StepInputSourceType.CONFIG
+            for step_snap in self.steps
+            for input_snap in step_snap.inputs
+        ):
+            # Built once per environment config and reused when the steps are executed
+            environment_config = EnvironmentConfig.build(pipeline_def, environment_dict, run_config)
+
+        step_dict = OrderedDict()
+        for step_snap in self.steps:
+            step_dict[step_snap.key] = _step_from_snap(pipeline_def, environment_config, step_snap)
+
+        deps = {}
+        for step in step_dict.values():
+            deps[step.key] = set()
+            for step_input in step.step_inputs:
+                deps[step.key].update(step_input.dependency_keys.intersection(step_dict))
+
+        return ExecutionPlan(
+            pipeline_def,
+            step_dict,
+            deps,
+            self.artifacts_persisted,
+            self.previous_run_id,
+            self.step_keys_to_execute,
+        )
+
+
+def _snap_from_step(step):
+    return ExecutionStepSnap(
+        solid_handle=step.solid_handle,
+        key_suffix=step.key_suffix,
+        kind=step.kind,
+        inputs=[
+            ExecutionStepInputSnap(
+                name=step_input.name,
+                source_type=step_input.source_type,
+                source_handles=step_input.source_handles,
+            )
+            for step_input in step.step_inputs
+        ],
+        outputs=[
+            ExecutionStepOutputSnap(
+                name=step_output.name, should_materialize=step_output.should_materialize
+            )
+            for step_output in step.step_outputs
+        ],
+    )
+
+
+def _step_from_snap(pipeline_def, environment_config, step_snap):
+    check.invariant(
+        step_snap.kind == StepKind.COMPUTE,
+        'Unsupported step kind {kind}'.format(kind=step_snap.kind),
+    )
+
+    solid = pipeline_def.get_solid(step_snap.solid_handle)
+    step_inputs = []
+    for input_snap in step_snap.inputs:
+        config_data = None
+        if input_snap.source_type == StepInputSourceType.CONFIG:
+            config_data = _input_config_data(
+                pipeline_def, environment_config, step_snap.solid_handle, input_snap.name
+            )
+
+        step_inputs.append(
+            StepInput(
+                name=input_snap.name,
+                dagster_type=solid.definition.input_def_named(input_snap.name).dagster_type,
+                source_type=input_snap.source_type,
+                source_handles=input_snap.source_handles,
+                config_data=config_data,
+            )
+        )
+
+    return build_compute_step(
+        pipeline_def.name,
+        solid,
+        step_inputs,
+        step_snap.solid_handle,
+        {output_snap.name for output_snap in step_snap.outputs if output_snap.should_materialize},
+    )
+
+
+def _input_config_data(pipeline_def, environment_config, solid_handle, input_name):
+    # Inputs are sourced from their own config or, failing that, from the config of the input of
+    # the composite solid that they are mapped from, as when the plan is built
+    handle, name = solid_handle, input_name
+    while handle is not None:
+        solid_config = environment_config.solids.get(str(handle))
+        if solid_config and name in solid_config.inputs:
+            return solid_config.inputs[name]
+
+        solid = pipeline_def.get_solid(handle)
+        if not solid.container_maps_input(name):
+            break
+
+        handle, name = handle.parent, solid.container_mapped_input(name).definition.name
+
+    check.failed(
+        'No config found for input {input_name} of solid {solid_handle}'.format(
+            input_name=input_name, solid_handle=solid_handle
+        )
+    )
@@ -18,6 +18,7 @@ from dagster.core.errors import (
     DagsterRunAlreadyExists,
     DagsterRunConflict,
 )
+from dagster.core.log_manager import StructuredEventLogger
 from dagster.core.serdes import ConfigurableClass, whitelist_for_serdes
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.utils.yaml_utils import load_yaml_from_globs
@@ -68,6 +69,28 @@ class _EventListenerLogHandler(logging.Handler):
             raise
 
 
+class _EventListenerLogger(StructuredEventLogger):
+    '''Passes the messages of pipeline runs to the instance as event records.'''
+
+    def __init__(self, instance):
+        self._instance = instance
+        super(_EventListenerLogger, self).__init__('__event_listener', level=logging.DEBUG)
+        self.addHandler(_EventListenerLogHandler(instance))
+
+    def log_structured(self, level, message, meta, timestamp):
+        from dagster.core.events.log import construct_event_record_from_meta
+
+        try:
+            event = construct_event_record_from_meta(message, level, meta, timestamp)
+
+            self._instance.handle_new_event(event)
+
+        except Exception as e:  # pylint: disable=W0703
+            logging.critical('Error during instance event listen')
+            logging.exception(str(e))
+            raise
+
+
 class InstanceType(Enum):
     PERSISTENT = 'PERSISTENT'
     EPHEMERAL = 'EPHEMERAL'
@@ -326,6 +349,7 @@ class DagsterInstance:
     def dispose(self):
         self._run_storage.dispose()
         self._event_storage.dispose()
+        self._compute_log_manager.dispose()
 
     # run storage
 
@@ -391,6 +415,9 @@ class DagsterInstance:
     def get_runs(self, filters=None, cursor=None, limit=None):
         return self._run_storage.get_runs(filters, cursor, limit)
 
+    def get_run_summaries(self, filters=None, cursor=None, limit=None):
+        return self._run_storage.get_run_summaries(filters, cursor, limit)
+
     def get_runs_count(self, filters=None):
         return self._run_storage.get_runs_count(filters)
 
@@ -404,22 +431,28 @@ class DagsterInstance:
 
     # event storage
 
-    def logs_after(self, run_id, cursor):
-        return self._event_storage.get_logs_for_run(run_id, cursor=cursor)
+    def logs_after(self, run_id, cursor, limit=None):
+        return self._event_storage.get_logs_for_run(run_id, cursor=cursor, limit=limit)
 
     def all_logs(self, run_id):
         return self._event_storage.get_logs_for_run(run_id)
 
+    def get_logs_count_for_run(self, run_id):
+        return self._event_storage.get_logs_count_for_run(run_id)
+
+    def get_logs_for_step(self, run_id, step_key):
+        return self._event_storage.get_logs_for_step(run_id, step_key)
+
+    def get_logs_for_run_by_type(self, run_id, dagster_event_types):
+        return self._event_storage.get_logs_for_run_by_type(run_id, dagster_event_types)
+
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
 
     # event subscriptions
 
     def get_logger(self):
-        logger = logging.Logger('__event_listener')
-        logger.addHandler(_EventListenerLogHandler(self))
-        logger.setLevel(10)
-        return logger
+        return _EventListenerLogger(self)
 
     def handle_new_event(self, event):
         run_id = event.run_id
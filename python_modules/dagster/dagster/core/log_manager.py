@@ -1,8 +1,12 @@
 import datetime
 import itertools
 import logging
+import time
+from abc import ABCMeta, abstractmethod
 from collections import OrderedDict, namedtuple
 
+import six
+
 from dagster import check, seven
 from dagster.core.utils import make_new_run_id
 from dagster.utils import frozendict
@@ -96,6 +100,27 @@ def construct_log_string(synth_props, logging_tags, message_props):
     return prefix + log_props_str + stack
 
 
+class StructuredEventLogger(six.with_metaclass(ABCMeta, logging.Logger)):
+    '''A logger that can consume the structured messages built by DagsterLogManager directly.
+
+    DagsterLogManager hands messages to ``log_structured`` rather than calling ``log``, which skips
+    the construction of a LogRecord and its dispatch through the logging machinery. Messages
+    logged through the standard logging API are still passed to the logger's handlers as usual.
+    '''
+
+    @abstractmethod
+    def log_structured(self, level, message, meta, timestamp):
+        '''Consume a structured log message.
+
+        Args:
+            level (int): The Python logging level of the message.
+            message (str): The formatted log message.
+            meta (dict): The structured properties of the message, as stored under the
+                DAGSTER_META_KEY of the LogRecords passed to other loggers.
+            timestamp (float): The time at which the message was logged, in seconds since the epoch.
+        '''
+
+
 def coerce_valid_log_level(log_level):
     '''Convert a log level into an integer for consumption by the low-level Python logging API.'''
     if isinstance(log_level, int):
@@ -206,10 +231,19 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
 
         level = coerce_valid_log_level(level)
 
+        # Skip building the message entirely if no logger is listening at this level
+        loggers = [logger_ for logger_ in self.loggers if logger_.isEnabledFor(level)]
+        if not loggers:
+            return
+
         message, extra = self._prepare_message(orig_message, message_props)
+        timestamp = time.time()
 
-        for logger_ in self.loggers:
-            logger_.log(level, message, extra=extra)
+        for logger_ in loggers:
+            if isinstance(logger_, StructuredEventLogger):
+                logger_.log_structured(level, message, extra[DAGSTER_META_KEY], timestamp)
+            else:
+                logger_.log(level, message, extra=extra)
 
     def log(self, level, msg, **kwargs):
         '''Invoke the underlying loggers for a given integer log level.
@@ -26,6 +26,22 @@ from dagster import check, seven
 _WHITELISTED_TUPLE_MAP = {}
 _WHITELISTED_ENUM_MAP = {}
 
+# Values of these exact types are serialized as themselves. Subclasses, e.g. of str and Enum, must
+# take the slow path.
+_PRIMITIVE_TYPES = frozenset(six.string_types + six.integer_types + (float, bool, type(None)))
+
+# Per-class cache of the names of the arguments accepted by the constructor of a whitelisted
+# namedtuple, which are expensive to compute with seven.get_args
+_ARGS_FOR_CLASS = {}
+
+
+def _get_args_for_class(klass):
+    args_for_class = _ARGS_FOR_CLASS.get(klass)
+    if args_for_class is None:
+        args_for_class = frozenset(seven.get_args(klass))
+        _ARGS_FOR_CLASS[klass] = args_for_class
+    return args_for_class
+
 
 def register_serdes_tuple_fallbacks(fallback_map):
     for class_name, klass in fallback_map.items():
@@ -56,6 +72,8 @@ def pack_value(val):
 
 
 def _pack_value(val, enum_map, tuple_map):
+    if type(val) in _PRIMITIVE_TYPES:
+        return val
     if isinstance(val, list):
         return [_pack_value(i, enum_map, tuple_map) for i in val]
     if isinstance(val, tuple):
@@ -64,8 +82,9 @@ def _pack_value(val, enum_map, tuple_map):
             klass_name in tuple_map,
             'Can only serialize whitelisted namedtuples, recieved {}'.format(klass_name),
         )
+        # equivalent to iterating over val._asdict(), without building an intermediate OrderedDict
         base_dict = {
-            key: _pack_value(value, enum_map, tuple_map) for key, value in val._asdict().items()
+            key: _pack_value(value, enum_map, tuple_map) for key, value in zip(val._fields, val)
         }
         base_dict['__class__'] = klass_name
         return base_dict
@@ -97,6 +116,8 @@ def unpack_value(val):
 
 
 def _unpack_value(val, enum_map, tuple_map):
+    if type(val) in _PRIMITIVE_TYPES:
+        return val
     if isinstance(val, list):
         return [_unpack_value(i, enum_map, tuple_map) for i in val]
     if isinstance(val, dict) and val.get('__class__'):
@@ -119,11 +140,11 @@ def _unpack_value(val, enum_map, tuple_map):
         # Naively implements backwards compatibility by filtering arguments that aren't present in
         # the constructor. If a property is present in the serialized object, but doesn't exist in
         # the version of the class loaded into memory, that property will be completely ignored.
-        # The call to seven.get_args turns out to be pretty expensive -- we should probably turn
-        # to, e.g., manually managing the deprecated keys on the serdes constructor.
-        args_for_class = seven.get_args(klass)
-        filtered_val = {k: v for k, v in unpacked_val.items() if k in args_for_class}
-        return klass(**filtered_val)
+        # The arguments of each class are computed once, since seven.get_args is expensive.
+        args_for_class = _get_args_for_class(klass)
+        if not args_for_class.issuperset(unpacked_val):
+            unpacked_val = {k: v for k, v in unpacked_val.items() if k in args_for_class}
+        return klass(**unpacked_val)
     if isinstance(val, dict) and val.get('__enum__'):
         name, member = val['__enum__'].split('.')
         return getattr(enum_map[name], member)
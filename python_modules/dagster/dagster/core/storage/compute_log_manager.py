@@ -1,4 +1,5 @@
 import atexit
+import threading
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 from enum import Enum
@@ -120,6 +121,10 @@ class ComputeLogManager(six.with_metaclass(ABCMeta)):
         '''
         return True
 
+    def dispose(self):
+        '''Hook for releasing any resources, such as threads watching for log data, held by the
+        manager.'''
+
     @abstractmethod
     def on_subscribe(self, subscription):
         '''Hook for managing streaming subscriptions for log data from `dagit`
@@ -170,6 +175,7 @@ class ComputeLogSubscription(object):
         self.io_type = io_type
         self.cursor = cursor
         self.observer = None
+        self._fetch_lock = threading.Lock()
         atexit.register(self._clean)
 
     def __call__(self, observer):
@@ -182,19 +188,22 @@ class ComputeLogSubscription(object):
         if not self.observer:
             return
 
-        should_fetch = True
-        while should_fetch:
-            update = self.manager.read_logs_file(
-                self.run_id,
-                self.step_key,
-                self.io_type,
-                self.cursor,
-                max_bytes=MAX_BYTES_CHUNK_READ,
-            )
-            if not self.cursor or update.cursor != self.cursor:
-                self.observer.on_next(update)
-                self.cursor = update.cursor
-            should_fetch = update.data and len(update.data.encode('utf-8')) >= MAX_BYTES_CHUNK_READ
+        # Fetches are made both when subscribing and as the logs are written
+        with self._fetch_lock:
+            should_fetch = True
+            while should_fetch:
+                update = self.manager.read_logs_file(
+                    self.run_id,
+                    self.step_key,
+                    self.io_type,
+                    self.cursor,
+                    max_bytes=MAX_BYTES_CHUNK_READ,
+                )
+                # A full chunk means there may be more to read
+                should_fetch = update.cursor - self.cursor >= MAX_BYTES_CHUNK_READ
+                if not self.cursor or update.cursor != self.cursor:
+                    self.observer.on_next(update)
+                    self.cursor = update.cursor
 
     def complete(self):
         if not self.observer:
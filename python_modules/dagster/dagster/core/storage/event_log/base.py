@@ -3,6 +3,8 @@ from abc import ABCMeta, abstractmethod, abstractproperty
 import pyrsistent
 import six
 
+from dagster import check
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.stats import build_stats_from_events
 
@@ -24,15 +26,53 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
     '''
 
     @abstractmethod
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         '''Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. If not set, all logs after
+                the cursor will be returned.
         '''
 
+    def get_logs_count_for_run(self, run_id):
+        '''Get the number of logs corresponding to a run.
+
+        Args:
+            run_id (str): The id of the run for which to count logs.
+        '''
+        return len(self.get_logs_for_run(run_id))
+
+    def get_logs_for_step(self, run_id, step_key):
+        '''Get all of the logs produced by a single step of a run.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            step_key (str): The key of the step for which to fetch logs.
+        '''
+        check.str_param(step_key, 'step_key')
+
+        return [
+            record for record in self.get_logs_for_run(run_id) if record.event_step_key == step_key
+        ]
+
+    def get_logs_for_run_by_type(self, run_id, dagster_event_types):
+        '''Get the logs of a run corresponding to dagster events of the given types.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            dagster_event_types (List[DagsterEventType]): The types of dagster event to fetch.
+        '''
+        check.list_param(dagster_event_types, 'dagster_event_types', of_type=DagsterEventType)
+
+        return [
+            record
+            for record in self.get_logs_for_run(run_id)
+            if record.is_dagster_event and record.dagster_event.event_type in dagster_event_types
+        ]
+
     def get_stats_for_run(self, run_id):
         '''Get a summary of events that have ocurred in a run.'''
 
@@ -47,6 +87,9 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
             event (EventRecord): The event to store.
         '''
 
+    def flush(self):
+        '''Write any events held in memory by the storage through to the backing store.'''
+
     @abstractmethod
     def delete_events(self, run_id):
         '''Remove events for a given run id'''
@@ -0,0 +1,113 @@
+import atexit
+import os
+import threading
+import weakref
+
+from dagster import check
+from dagster.core.events import DagsterEventType
+from dagster.core.events.log import EventRecord
+
+DEFAULT_EVENT_BUFFER_FLUSH_INTERVAL = 1.0
+
+# Buffered events are always written through before these are stored, so that consumers of the
+# event log see step and pipeline transitions as soon as they happen.
+FLUSH_BOUNDARY_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.PIPELINE_INIT_FAILURE,
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+}
+
+
+# The flush timer is a daemon thread, and instances are not disposed when pipelines are executed in
+# process, from the CLI or from dagit, so whatever is still buffered is written at interpreter exit
+_live_buffers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_buffers():
+    for event_buffer in list(_live_buffers):
+        event_buffer.flush()
+
+
+def is_flush_boundary(event):
+    check.inst_param(event, 'event', EventRecord)
+    return event.is_dagster_event and event.dagster_event.event_type in FLUSH_BOUNDARY_EVENT_TYPES
+
+
+class EventLogBuffer(object):
+    '''Accumulates events in memory and hands them to ``flush_fn`` in batches.
+
+    The buffer is flushed when it holds ``max_size`` events, when ``flush_interval`` seconds have
+    elapsed since the first event was buffered, when a step or pipeline boundary event is added,
+    whenever ``flush`` is called explicitly, and at interpreter exit. Events are handed to
+    ``flush_fn`` in the order in which they were added.
+
+    Args:
+        flush_fn (Callable[[List[EventRecord]], None]): Writes a batch of events to storage.
+        max_size (int): The maximum number of events to hold before flushing.
+        flush_interval (Optional[float]): The maximum number of seconds to hold an event before
+            flushing. (default: 1.0)
+    '''
+
+    def __init__(self, flush_fn, max_size, flush_interval=None):
+        self._flush_fn = check.callable_param(flush_fn, 'flush_fn')
+        self._max_size = check.int_param(max_size, 'max_size')
+        self._flush_interval = check.opt_numeric_param(flush_interval, 'flush_interval')
+        if self._flush_interval is None:
+            self._flush_interval = DEFAULT_EVENT_BUFFER_FLUSH_INTERVAL
+
+        self._lock = threading.RLock()
+        self._events = []
+        self._timer = None
+        self._pid = os.getpid()
+        _live_buffers.add(self)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._events)
+
+    def _reset_after_fork(self):
+        if os.getpid() == self._pid:
+            return
+
+        # Events buffered before a fork belong to the parent process, which is responsible for
+        # writing them -- a forked child must not write them a second time. Neither the parent's
+        # timer thread nor any thread holding the lock at the time of the fork exists in the child.
+        self._lock = threading.RLock()
+        self._events = []
+        self._timer = None
+        self._pid = os.getpid()
+
+    def add(self, event):
+        check.inst_param(event, 'event', EventRecord)
+
+        self._reset_after_fork()
+        with self._lock:
+            self._events.append(event)
+
+            if len(self._events) >= self._max_size or is_flush_boundary(event):
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        self._reset_after_fork()
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if not self._events:
+                return
+
+            events, self._events = self._events, []
+            self._flush_fn(events)
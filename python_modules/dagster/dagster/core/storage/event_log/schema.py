@@ -10,4 +10,7 @@ SqlEventLogStorageTable = db.Table(
     db.Column('event', db.Text, nullable=False),
     db.Column('dagster_event_type', db.Text),
     db.Column('timestamp', db.types.TIMESTAMP),
+    db.Column('step_key', db.Text),
+    db.Index('idx_run_id_step_key', 'run_id', 'step_key'),
+    db.Index('idx_run_id_event_type', 'run_id', 'dagster_event_type'),
 )
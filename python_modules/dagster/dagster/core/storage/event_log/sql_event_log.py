@@ -1,5 +1,6 @@
 import datetime
 from abc import abstractmethod
+from collections import OrderedDict
 
 import six
 import sqlalchemy as db
@@ -13,6 +14,7 @@ from dagster.utils import datetime_as_float
 
 from ..pipeline_run import PipelineRunStatsSnapshot
 from .base import EventLogStorage
+from .buffer import EventLogBuffer
 from .schema import SqlEventLogStorageTable
 
 
@@ -35,38 +37,90 @@ class SqlEventLogStorage(EventLogStorage):
         out-of-date instance of the storage up to date.
         '''
 
-    def store_event(self, event):
-        '''Store an event corresponding to a pipeline run.
+    _event_buffer = None
+
+    def init_event_buffer(self, event_buffer_size=None, event_buffer_flush_interval=None):
+        '''Opt in to buffering events in memory and writing them in batches.
 
         Args:
-            event (EventRecord): The event to store.
+            event_buffer_size (Optional[int]): The maximum number of events to buffer before
+                writing them to storage. Events are written through immediately if this is not set
+                or is less than 2.
+            event_buffer_flush_interval (Optional[float]): The maximum number of seconds an event
+                may be buffered before it is written to storage.
         '''
+        check.opt_int_param(event_buffer_size, 'event_buffer_size')
+        check.opt_numeric_param(event_buffer_flush_interval, 'event_buffer_flush_interval')
+
+        if event_buffer_size is not None and event_buffer_size > 1:
+            self._event_buffer = EventLogBuffer(
+                self.store_events, event_buffer_size, event_buffer_flush_interval
+            )
+
+    def prepare_event_row(self, event):
+        '''Build the column values with which to insert an event into the event log table.'''
         check.inst_param(event, 'event', EventRecord)
 
         dagster_event_type = None
         if event.is_dagster_event:
             dagster_event_type = event.dagster_event.event_type_value
 
-        run_id = event.run_id
+        return {
+            'run_id': event.run_id,
+            'event': serialize_dagster_namedtuple(event),
+            'dagster_event_type': dagster_event_type,
+            'timestamp': datetime.datetime.fromtimestamp(event.timestamp),
+            'step_key': event.event_step_key,
+        }
 
-        # https://stackoverflow.com/a/54386260/324449
-        event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=run_id,
-            event=serialize_dagster_namedtuple(event),
-            dagster_event_type=dagster_event_type,
-            timestamp=datetime.datetime.fromtimestamp(event.timestamp),
-        )
+    def store_event(self, event):
+        '''Store an event corresponding to a pipeline run.
 
-        with self.connect(run_id) as conn:
-            conn.execute(event_insert)
+        If an event buffer has been configured with ``init_event_buffer``, the event may be held in
+        memory until the buffer is next flushed.
+
+        Args:
+            event (EventRecord): The event to store.
+        '''
+        check.inst_param(event, 'event', EventRecord)
+
+        if self._event_buffer is not None:
+            self._event_buffer.add(event)
+        else:
+            self.store_events([event])
+
+    def store_events(self, events):
+        '''Store a batch of events, using a single connection and insert per run.
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+        Args:
+            events (List[EventRecord]): The events to store.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+
+        rows_by_run_id = OrderedDict()
+        for event in events:
+            rows_by_run_id.setdefault(event.run_id, []).append(self.prepare_event_row(event))
+
+        for run_id, rows in rows_by_run_id.items():
+            with self.connect(run_id) as conn:
+                # https://stackoverflow.com/a/54386260/324449
+                conn.execute(
+                    SqlEventLogStorageTable.insert(), rows  # pylint: disable=no-value-for-parameter
+                )
+
+    def flush(self):
+        if self._event_buffer is not None:
+            self._event_buffer.flush()
+
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         '''Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. If not set, all logs after
+                the cursor will be returned.
         '''
         check.str_param(run_id, 'run_id')
         check.int_param(cursor, 'cursor')
@@ -74,17 +128,92 @@ class SqlEventLogStorage(EventLogStorage):
             cursor >= -1,
             'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
         )
+        check.opt_int_param(limit, 'limit')
+
+        self.flush()
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        if cursor > -1:
+            query = self._apply_cursor_to_query(query, cursor)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return self._get_logs_for_query(run_id, query)
+
+    def _apply_cursor_to_query(self, query, cursor):
+        # The cursor is the index of a log within the run, rather than a value of the id column,
+        # which is not contiguous within a run in a table shared by all runs
+        return query.offset(cursor + 1)
+
+    def get_logs_count_for_run(self, run_id):
+        '''Get the number of logs corresponding to a run.
+
+        Args:
+            run_id (str): The id of the run for which to count logs.
+        '''
+        check.str_param(run_id, 'run_id')
+
+        self.flush()
+
+        query = db.select([db.func.count(SqlEventLogStorageTable.c.id)]).where(
+            SqlEventLogStorageTable.c.run_id == run_id
+        )
+
+        with self.connect(run_id) as conn:
+            return conn.execute(query).scalar()
 
-        # cursor starts at 0 & auto-increment column starts at 1 so adjust
-        cursor = cursor + 1
+    def get_logs_for_step(self, run_id, step_key):
+        '''Get all of the logs produced by a single step of a run.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            step_key (str): The key of the step for which to fetch logs.
+        '''
+        check.str_param(run_id, 'run_id')
+        check.str_param(step_key, 'step_key')
+
+        self.flush()
 
         query = (
             db.select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.id > cursor)
+            .where(SqlEventLogStorageTable.c.step_key == step_key)
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
 
+        return self._get_logs_for_query(run_id, query)
+
+    def get_logs_for_run_by_type(self, run_id, dagster_event_types):
+        '''Get the logs of a run corresponding to dagster events of the given types.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            dagster_event_types (List[DagsterEventType]): The types of dagster event to fetch.
+        '''
+        check.str_param(run_id, 'run_id')
+        check.list_param(dagster_event_types, 'dagster_event_types', of_type=DagsterEventType)
+
+        self.flush()
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        return self._get_logs_for_query(run_id, query)
+
+    def _get_logs_for_query(self, run_id, query):
         with self.connect(run_id) as conn:
             results = conn.execute(query).fetchall()
 
@@ -104,6 +233,8 @@ class SqlEventLogStorage(EventLogStorage):
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, 'run_id')
 
+        self.flush()
+
         query = (
             db.select(
                 [
@@ -150,6 +281,8 @@ class SqlEventLogStorage(EventLogStorage):
         '''Clears the event log storage.'''
         # Should be overridden by SqliteEventLogStorage and other storages that shard based on
         # run_id
+        self.flush()
+
         # https://stackoverflow.com/a/54386260/324449
         with self.connect() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
@@ -157,6 +290,8 @@ class SqlEventLogStorage(EventLogStorage):
     def delete_events(self, run_id):
         check.str_param(run_id, 'run_id')
 
+        self.flush()
+
         statement = SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
             SqlEventLogStorageTable.c.run_id == run_id
         )
@@ -167,3 +302,6 @@ class SqlEventLogStorage(EventLogStorage):
     @property
     def is_persistent(self):
         return True
+
+    def dispose(self):
+        self.flush()
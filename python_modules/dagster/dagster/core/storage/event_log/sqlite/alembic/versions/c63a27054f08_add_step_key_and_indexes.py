@@ -0,0 +1,87 @@
+"""add step_key column and indexes to event log
+
+Revision ID: c63a27054f08
+Revises: 567bc23fd1ac
+Create Date: 2020-03-10 14:02:11.473015
+
+"""
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import reflection
+
+from dagster import check, seven
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
+
+# revision identifiers, used by Alembic.
+revision = 'c63a27054f08'
+down_revision = '567bc23fd1ac'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'event_logs' not in has_tables:
+        return
+
+    has_columns = [col['name'] for col in inspector.get_columns('event_logs')]
+    if 'step_key' not in has_columns:
+        op.add_column('event_logs', sa.Column('step_key', sa.Text))
+
+    has_indexes = [index['name'] for index in inspector.get_indexes('event_logs')]
+    if 'idx_run_id_step_key' not in has_indexes:
+        op.create_index('idx_run_id_step_key', 'event_logs', ['run_id', 'step_key'])
+    if 'idx_run_id_event_type' not in has_indexes:
+        op.create_index('idx_run_id_event_type', 'event_logs', ['run_id', 'dagster_event_type'])
+
+    # SQLite may not have the JSON1 extension available, so the step keys of existing events are
+    # backfilled by deserializing them
+    event_logs = sa.table('event_logs', sa.column('id'), sa.column('event'), sa.column('step_key'),)
+    update = (
+        event_logs.update()  # pylint: disable=no-value-for-parameter
+        .where(event_logs.c.id == sa.bindparam('_id'))
+        .values(step_key=sa.bindparam('_step_key'))
+    )
+
+    cursor = 0
+    while True:
+        rows = bind.execute(
+            sa.select([event_logs.c.id, event_logs.c.event])
+            .where(event_logs.c.id > cursor)
+            .order_by(event_logs.c.id.asc())
+            .limit(BACKFILL_BATCH_SIZE)
+        ).fetchall()
+
+        if not rows:
+            break
+
+        updates = []
+        for (event_id, event_json) in rows:
+            try:
+                step_key = deserialize_json_to_dagster_namedtuple(event_json).event_step_key
+            except (seven.JSONDecodeError, check.CheckError, AttributeError):
+                # leave the step keys of unreadable events unset rather than failing the migration
+                continue
+
+            if step_key:
+                updates.append({'_id': event_id, '_step_key': step_key})
+
+        if updates:
+            bind.execute(update, updates)
+
+        cursor = rows[-1][0]
+
+
+def downgrade():
+    op.drop_index('idx_run_id_event_type', 'event_logs')
+    op.drop_index('idx_run_id_step_key', 'event_logs')
+    with op.batch_alter_table('event_logs') as batch_op:
+        batch_op.drop_column('step_key')
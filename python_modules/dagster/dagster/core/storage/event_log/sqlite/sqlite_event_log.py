@@ -2,29 +2,42 @@ import glob
 import logging
 import os
 import sqlite3
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
 
 import sqlalchemy as db
-from sqlalchemy.pool import NullPool
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 from dagster import check
+from dagster.config import Field
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
 
 from ...pipeline_run import PipelineRunStatus
 from ...sql import (
-    create_engine,
+    EngineCache,
+    connection_pool_config,
     get_alembic_config,
     handle_schema_errors,
+    pool_kwargs_from_config,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from ..schema import SqlEventLogStorageMetadata
+from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from ..sql_event_log import SqlEventLogStorage
 
+# The number of runs for which pooled connections are kept open
+MAX_CACHED_RUN_ENGINES = 32
+
+# How long to wait for a burst of writes to a watched run to land before querying for its events
+WATCH_DEBOUNCE_INTERVAL = 0.05
+
+# How often to check watched runs for new events when no file system observer is available
+WATCH_POLLING_INTERVAL = 0.5
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     '''SQLite-backed event log storage.
@@ -49,17 +62,38 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
     run.
+
+    The optional ``event_buffer_size`` and ``event_buffer_flush_interval`` params enable writing
+    events in batches: up to ``event_buffer_size`` events are held in memory for at most
+    ``event_buffer_flush_interval`` seconds, and are always written through at step and pipeline
+    boundaries.
+
+    Connections to the database for each run are pooled, and the pools for the most recently used
+    runs are kept open for the lifetime of the storage. The optional ``connection_pool`` param
+    configures the pools; see :py:func:`~dagster.core.storage.sql.connection_pool_config`.
     '''
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(
+        self,
+        base_dir,
+        inst_data=None,
+        event_buffer_size=None,
+        event_buffer_flush_interval=None,
+        connection_pool=None,
+    ):
         '''Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database.'''
         self._base_dir = os.path.abspath(check.str_param(base_dir, 'base_dir'))
         mkdir_p(self._base_dir)
+        self.init_event_buffer(event_buffer_size, event_buffer_flush_interval)
+
+        engine_kwargs = pool_kwargs_from_config(connection_pool)
+        # pooled connections may be checked out by the watchdog thread as well as the main thread
+        engine_kwargs['connect_args'] = {'check_same_thread': False}
+        self._engine_cache = EngineCache(engine_kwargs, max_engines=MAX_CACHED_RUN_ENGINES)
+        self._alembic_config = get_alembic_config(__file__)
 
-        self._watchers = defaultdict(dict)
-        self._obs = Observer()
-        self._obs.start()
+        self._watcher = SqliteEventLogStorageWatcher(self)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     def upgrade(self):
@@ -80,7 +114,12 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return {'base_dir': str}
+        return {
+            'base_dir': str,
+            'event_buffer_size': Field(int, is_required=False),
+            'event_buffer_flush_interval': Field(float, is_required=False),
+            'connection_pool': connection_pool_config(),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -90,6 +129,10 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         all_filenames = glob.glob(os.path.join(self._base_dir, '*.db'))
         return [os.path.splitext(os.path.basename(filename))[0] for filename in all_filenames]
 
+    @property
+    def base_dir(self):
+        return self._base_dir
+
     def path_for_run_id(self, run_id):
         return os.path.join(self._base_dir, '{run_id}.db'.format(run_id=run_id))
 
@@ -124,29 +167,46 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
                     'swallowing {str_exc}'.format(str_exc=err_msg)
                 )
 
+    def _init_engine(self, engine, run_id):
+        if not os.path.exists(self.path_for_run_id(run_id)):
+            self._initdb(engine, run_id)
+
     @contextmanager
     def connect(self, run_id=None):
         check.str_param(run_id, 'run_id')
 
-        conn_string = self.conn_string_for_run_id(run_id)
-        engine = create_engine(conn_string, poolclass=NullPool)
-
-        if not os.path.exists(self.path_for_run_id(run_id)):
-            self._initdb(engine, run_id)
+        engine = self._engine_cache.get_engine(
+            self.conn_string_for_run_id(run_id),
+            init_fn=lambda engine: self._init_engine(engine, run_id),
+        )
 
         conn = engine.connect()
         try:
             with handle_schema_errors(
                 conn,
-                get_alembic_config(__file__),
+                self._alembic_config,
                 msg='SqliteEventLogStorage for run {run_id}'.format(run_id=run_id),
             ):
                 yield conn
         finally:
             conn.close()
-        engine.dispose()
+
+    def _apply_cursor_to_query(self, query, cursor):
+        # Each run has its own table, so the ids of its logs are contiguous and the cursor can
+        # seek on the id column rather than step over every earlier log. The cursor starts at 0
+        # and the auto-increment column at 1, so adjust
+        return query.where(SqlEventLogStorageTable.c.id > cursor + 1)
+
+    def dispose(self):
+        super(SqliteEventLogStorage, self).dispose()
+        self._watcher.stop()
+        self._engine_cache.dispose()
 
     def wipe(self):
+        self.flush()
+        # pooled connections must not outlive the database files they point to
+        self._engine_cache.dispose()
+
         for filename in (
             glob.glob(os.path.join(self._base_dir, '*.db'))
             + glob.glob(os.path.join(self._base_dir, '*.db-wal'))
@@ -155,39 +215,220 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             os.unlink(filename)
 
     def watch(self, run_id, start_cursor, callback):
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, start_cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, True),
-        )
+        self._watcher.watch(run_id, start_cursor, callback)
 
     def end_watch(self, run_id, handler):
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)
-            del self._watchers[run_id][handler]
+        self._watcher.unwatch(run_id, handler)
 
 
-class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
+class _Subscription(object):
+    def __init__(self, cursor, callback):
+        self.cursor = cursor
+        self.callback = callback
+
+
+class SqliteEventLogStorageWatcher(object):
+    '''Watches the databases of a SqliteEventLogStorage on behalf of all of its subscribers.
+
+    A single thread serves every watched run. File system events mark runs as modified, and are
+    debounced for ``WATCH_DEBOUNCE_INTERVAL`` seconds so that a burst of writes to a run results in
+    a single query for the events after the earliest cursor of the run's subscribers. Each
+    subscriber is then handed the events after its own cursor, in order. Where no native file
+    system observer is available, the thread instead checks the databases of the watched runs for
+    modifications every ``WATCH_POLLING_INTERVAL`` seconds.
+
+    The thread is started when the first subscription is made.
+    '''
+
+    def __init__(self, event_log_storage):
         self._event_log_storage = check.inst_param(
             event_log_storage, 'event_log_storage', SqliteEventLogStorage
         )
-        self._run_id = check.str_param(run_id, 'run_id')
-        self._cb = check.callable_param(callback, 'callback')
-        self._log_path = event_log_storage.path_for_run_id(run_id)
-        self._cursor = start_cursor if start_cursor is not None else -1
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(list)
+        self._modified_run_ids = set()
+        self._file_stats = {}
+        self._wakeup = threading.Event()
+        self._shutdown = threading.Event()
+        self._observer = None
+        self._thread = None
+
+    @property
+    def is_polling(self):
+        return self._thread is not None and self._observer is None
+
+    def watch(self, run_id, start_cursor, callback):
+        check.str_param(run_id, 'run_id')
+        check.callable_param(callback, 'callback')
+        start_cursor = start_cursor if start_cursor is not None else -1
+
+        with self._lock:
+            self._start()
+            self._subscriptions[run_id].append(_Subscription(start_cursor, callback))
+            # Catch up on any events stored before the subscription was made
+            self._modified_run_ids.add(run_id)
+        self._wakeup.set()
+
+    def unwatch(self, run_id, callback):
+        with self._lock:
+            if run_id not in self._subscriptions:
+                return
+
+            subscriptions = [
+                subscription
+                for subscription in self._subscriptions[run_id]
+                if subscription.callback != callback
+            ]
+            if subscriptions:
+                self._subscriptions[run_id] = subscriptions
+            else:
+                del self._subscriptions[run_id]
+                self._file_stats.pop(run_id, None)
+
+    def notify_modified(self, run_id):
+        with self._lock:
+            if run_id not in self._subscriptions:
+                return
+            self._modified_run_ids.add(run_id)
+        self._wakeup.set()
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+            observer, self._observer = self._observer, None
+
+        if thread is None:
+            return
+
+        self._shutdown.set()
+        self._wakeup.set()
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        thread.join()
+
+    def _start(self):
+        if self._thread is not None:
+            return
+
+        if Observer is not PollingObserver:
+            # The polling observer would snapshot the whole base directory on every pass, which is
+            # more expensive than checking the databases of the watched runs ourselves
+            try:
+                observer = Observer()
+                observer.schedule(
+                    SqliteEventLogStorageWatchdog(self), self._event_log_storage.base_dir
+                )
+                observer.start()
+                self._observer = observer
+            except OSError:
+                # e.g., the inotify instance or watch limits have been reached
+                logging.info(
+                    'SqliteEventLogStorageWatcher: Unable to start file system observer, falling '
+                    'back to polling'
+                )
+
+        self._shutdown.clear()
+        self._thread = threading.Thread(target=self._run, name='sqlite-event-log-watcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while not self._shutdown.is_set():
+            if self._observer is None:
+                self._wakeup.wait(WATCH_POLLING_INTERVAL)
+                self._check_for_modified_runs()
+            else:
+                self._wakeup.wait()
+
+            if not self._wakeup.is_set():
+                continue
+
+            # Give a burst of writes the chance to land before querying
+            self._shutdown.wait(WATCH_DEBOUNCE_INTERVAL)
+            if self._shutdown.is_set():
+                break
+
+            self._wakeup.clear()
+            with self._lock:
+                run_ids, self._modified_run_ids = self._modified_run_ids, set()
+
+            for run_id in run_ids:
+                try:
+                    self._process_run(run_id)
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception(
+                        'SqliteEventLogStorageWatcher: Error processing events for run '
+                        '{run_id}'.format(run_id=run_id)
+                    )
+
+    def _check_for_modified_runs(self):
+        with self._lock:
+            run_ids = list(self._subscriptions.keys())
+
+        modified = False
+        for run_id in run_ids:
+            path = self._event_log_storage.path_for_run_id(run_id)
+            file_stats = tuple(_file_stat(log_path) for log_path in (path, path + '-wal'))
+            with self._lock:
+                if run_id in self._subscriptions and self._file_stats.get(run_id) != file_stats:
+                    self._file_stats[run_id] = file_stats
+                    self._modified_run_ids.add(run_id)
+                    modified = True
+
+        if modified:
+            self._wakeup.set()
+
+    def _process_run(self, run_id):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(run_id, []))
+
+        if not subscriptions:
+            return
+
+        cursor = min(subscription.cursor for subscription in subscriptions)
+        events = self._event_log_storage.get_logs_for_run(run_id, cursor)
+
+        for subscription in subscriptions:
+            for index, event in enumerate(events, cursor + 1):
+                if index <= subscription.cursor:
+                    continue
+
+                status = subscription.callback(event)
+                subscription.cursor = index
+
+                if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
+                    self.unwatch(run_id, subscription.callback)
+                    break
+
+
+def _file_stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+
+class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
+    '''Notifies a SqliteEventLogStorageWatcher of modifications to the databases of any run.'''
+
+    def __init__(self, watcher, **kwargs):
+        self._watcher = check.inst_param(watcher, 'watcher', SqliteEventLogStorageWatcher)
+        # Writes land in the write-ahead log, and only reach the database file itself when it is
+        # checkpointed, which may not happen while pooled connections to the database remain open
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=['*.db', '*.db-wal'], ignore_directories=True, **kwargs
+        )
 
-    def _process_log(self):
-        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
-        self._cursor += len(events)
-        for event in events:
-            status = self._cb(event)
+    def _notify(self, path):
+        filename = os.path.basename(path)
+        if filename.endswith('-wal'):
+            filename = filename[: -len('-wal')]
+        self._watcher.notify_modified(os.path.splitext(filename)[0])
 
-            if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
-                self._event_log_storage.end_watch(self._run_id, self._cb)
+    def on_created(self, event):
+        self._notify(event.src_path)
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        self._notify(event.src_path)
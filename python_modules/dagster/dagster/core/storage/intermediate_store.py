@@ -5,19 +5,32 @@ import six
 from dagster import check
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.types.dagster_type import DagsterType, resolve_dagster_type
+from dagster.core.types.marshal import PickleSerializationStrategy, SerializationStrategy
 
 from .object_store import FilesystemObjectStore, ObjectStore
 from .type_storage import TypeStoragePluginRegistry
 
 
 class IntermediateStore(six.with_metaclass(ABCMeta)):
-    def __init__(self, object_store, root_for_run_id, run_id, type_storage_plugin_registry):
+    def __init__(
+        self,
+        object_store,
+        root_for_run_id,
+        run_id,
+        type_storage_plugin_registry,
+        serialization_strategy=None,
+    ):
         self.root_for_run_id = check.callable_param(root_for_run_id, 'root_for_run_id')
         self.run_id = check.str_param(run_id, 'run_id')
         self.object_store = check.inst_param(object_store, 'object_store', ObjectStore)
         self.type_storage_plugin_registry = check.inst_param(
             type_storage_plugin_registry, 'type_storage_plugin_registry', TypeStoragePluginRegistry
         )
+        # Used in place of plain pickling for types that don't specify their own serialization
+        # strategy, e.g. to compress intermediates
+        self.serialization_strategy = check.opt_inst_param(
+            serialization_strategy, 'serialization_strategy', SerializationStrategy
+        )
 
     @property
     def root(self):
@@ -32,6 +45,17 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
     def key_for_paths(self, paths):
         return self.object_store.key_for_paths([self.root] + paths)
 
+    def serialization_strategy_for_type(self, dagster_type):
+        check.inst_param(dagster_type, 'dagster_type', DagsterType)
+
+        if self.serialization_strategy is not None and (
+            type(dagster_type.serialization_strategy)  # pylint: disable=unidiomatic-typecheck
+            is PickleSerializationStrategy
+        ):
+            return self.serialization_strategy
+
+        return dagster_type.serialization_strategy
+
     def set_object(self, obj, context, dagster_type, paths):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
         check.inst_param(dagster_type, 'dagster_type', DagsterType)
@@ -39,7 +63,7 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.set_object(
-            key, obj, serialization_strategy=dagster_type.serialization_strategy
+            key, obj, serialization_strategy=self.serialization_strategy_for_type(dagster_type)
         )
 
     def get_object(self, context, dagster_type, paths):
@@ -48,6 +72,8 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.param_invariant(len(paths) > 0, 'paths')
         check.inst_param(dagster_type, 'dagster_type', DagsterType)
         key = self.object_store.key_for_paths([self.root] + paths)
+        # The object store reads the object with the strategy it was written with, falling back to
+        # the type's own strategy for objects written before strategies were recorded
         return self.object_store.get_object(
             key, serialization_strategy=dagster_type.serialization_strategy
         )
@@ -121,7 +147,9 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         )
 
 
-def build_fs_intermediate_store(root_for_run_id, run_id, type_storage_plugin_registry=None):
+def build_fs_intermediate_store(
+    root_for_run_id, run_id, type_storage_plugin_registry=None, serialization_strategy=None
+):
     return IntermediateStore(
         FilesystemObjectStore(),
         root_for_run_id,
@@ -129,4 +157,5 @@ def build_fs_intermediate_store(root_for_run_id, run_id, type_storage_plugin_reg
         type_storage_plugin_registry
         if type_storage_plugin_registry
         else TypeStoragePluginRegistry(types_to_register=[]),
+        serialization_strategy=serialization_strategy,
     )
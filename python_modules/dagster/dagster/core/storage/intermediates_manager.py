@@ -1,8 +1,13 @@
+import os
+import threading
 from abc import ABCMeta, abstractmethod, abstractproperty
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 import six
 
 from dagster import check
+from dagster.core.errors import DagsterObjectStoreKeyNotFoundError
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.types.dagster_type import DagsterType
@@ -10,6 +15,10 @@ from dagster.utils.backcompat import canonicalize_backcompat_args
 
 from .intermediate_store import IntermediateStore
 
+# The default maximum number of intermediates read or checked for at once within a step, which
+# overlaps the round trips to remote object stores
+DEFAULT_MAX_CONCURRENT_INTERMEDIATE_OPERATIONS = 8
+
 
 class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     @abstractmethod
@@ -36,6 +45,77 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def is_persistent(self):
         pass
 
+    def rm_intermediate(self, context, step_output_handle):
+        '''Release an intermediate that no step needs any longer.
+
+        Returns:
+            Optional[ObjectStoreOperation]: The operation that removed the intermediate from an
+                object store, if any.
+        '''
+        check.not_implemented(
+            'Releasing intermediates is not implemented by {}'.format(self.__class__.__name__)
+        )
+
+    @contextmanager
+    def operation_executor(self):
+        '''Yields an executor with which intermediates may be read and checked for concurrently, or
+        None if they should be handled one at a time.'''
+        yield None
+
+    def _map_operations(self, fn, items):
+        '''Apply fn to each item, concurrently if the manager allows, returning the results in
+        order. If any application raises, the error for the first such item is raised.'''
+        items = list(items)
+        if len(items) > 1:
+            with self.operation_executor() as executor:
+                if executor is not None:
+                    return list(executor.map(fn, items))
+
+        return [fn(item) for item in items]
+
+    def get_intermediates(self, context, requests):
+        '''Get a number of intermediates, concurrently if the manager allows.
+
+        Args:
+            requests (List[Tuple[DagsterType, StepOutputHandle]]): The intermediates to get.
+
+        Returns:
+            List: The results of get_intermediate for each request, in order.
+        '''
+        check.list_param(requests, 'requests', of_type=tuple)
+
+        return self._map_operations(
+            lambda request: self.get_intermediate(
+                context, dagster_type=request[0], step_output_handle=request[1]
+            ),
+            requests,
+        )
+
+    def copy_intermediates_from_prev_run(self, context, previous_run_id, step_output_handles):
+        '''Copy a number of intermediates from a previous run, concurrently if the manager allows.
+        Intermediates that are already present are not copied again.
+
+        Args:
+            previous_run_id (str): The id of the run from which to copy the intermediates.
+            step_output_handles (List[StepOutputHandle]): The intermediates to copy.
+
+        Returns:
+            List[Optional[ObjectStoreOperation]]: The result of copy_intermediate_from_prev_run for
+                each intermediate, in order, or None if it was already present.
+        '''
+        check.str_param(previous_run_id, 'previous_run_id')
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+
+        def _copy(step_output_handle):
+            if self.has_intermediate(context, step_output_handle):
+                return None
+
+            return self.copy_intermediate_from_prev_run(
+                context, previous_run_id, step_output_handle
+            )
+
+        return self._map_operations(_copy, step_output_handles)
+
     def all_inputs_covered(self, context, step):
         return len(self.uncovered_inputs(context, step)) == 0
 
@@ -43,12 +123,19 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
         from dagster.core.execution.plan.objects import ExecutionStep
 
         check.inst_param(step, 'step', ExecutionStep)
-        uncovered_inputs = []
-        for step_input in step.step_inputs:
-            for source_handle in step_input.source_handles:
-                if not self.has_intermediate(context, source_handle):
-                    uncovered_inputs.append(source_handle)
-        return uncovered_inputs
+        source_handles = [
+            source_handle
+            for step_input in step.step_inputs
+            for source_handle in step_input.source_handles
+        ]
+        covered = self._map_operations(
+            lambda source_handle: self.has_intermediate(context, source_handle), source_handles
+        )
+        return [
+            source_handle
+            for source_handle, is_covered in zip(source_handles, covered)
+            if not is_covered
+        ]
 
 
 class InMemoryIntermediatesManager(IntermediatesManager):
@@ -93,16 +180,60 @@ class InMemoryIntermediatesManager(IntermediatesManager):
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        self.values.pop(step_output_handle, None)
+
     @property
     def is_persistent(self):
         return False
 
 
 class IntermediateStoreIntermediatesManager(IntermediatesManager):
-    def __init__(self, intermediate_store):
+    '''Manages intermediates in an intermediate store.
+
+    Args:
+        intermediate_store (IntermediateStore): The intermediate store.
+        max_concurrent_operations (Optional[int]): The maximum number of intermediates read or
+            checked for at once within a step. Set to 1 to handle them one at a time. (default: 8)
+    '''
+
+    def __init__(self, intermediate_store, max_concurrent_operations=None):
         self._intermediate_store = check.inst_param(
             intermediate_store, 'intermediate_store', IntermediateStore
         )
+        self._max_concurrent_operations = check.opt_int_param(
+            max_concurrent_operations, 'max_concurrent_operations'
+        )
+        if self._max_concurrent_operations is None:
+            self._max_concurrent_operations = DEFAULT_MAX_CONCURRENT_INTERMEDIATE_OPERATIONS
+        check.param_invariant(
+            self._max_concurrent_operations > 0,
+            'max_concurrent_operations',
+            'Must be greater than 0',
+        )
+        self._written_step_output_handles = set()
+        self._executor_lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+
+    @contextmanager
+    def operation_executor(self):
+        if self._max_concurrent_operations == 1:
+            yield None
+            return
+
+        # The executor is shared by every step that uses this manager, rather than started and shut
+        # down for each of them. The threads of an executor created before a fork don't exist in
+        # the child, which creates its own.
+        with self._executor_lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ThreadPoolExecutor(max_workers=self._max_concurrent_operations)
+                self._executor_pid = os.getpid()
+            executor = self._executor
+
+        yield executor
 
     def _get_paths(self, step_output_handle):
         return ['intermediates', step_output_handle.step_key, step_output_handle.output_name]
@@ -116,13 +247,21 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(context, 'context', SystemPipelineExecutionContext)
         check.inst_param(canonicalize_dagster_type, 'dagster_type', DagsterType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
-        check.invariant(self.has_intermediate(context, step_output_handle))
 
-        return self._intermediate_store.get_value(
-            context=context,
-            dagster_type=canonicalize_dagster_type,
-            paths=self._get_paths(step_output_handle),
-        )
+        # Rather than checking that the intermediate exists before getting it, which costs an
+        # extra round trip to remote object stores, handle its absence when getting it
+        try:
+            return self._intermediate_store.get_value(
+                context=context,
+                dagster_type=canonicalize_dagster_type,
+                paths=self._get_paths(step_output_handle),
+            )
+        except DagsterObjectStoreKeyNotFoundError:
+            check.failed(
+                'No intermediate found for step output {step_output_handle}'.format(
+                    step_output_handle=step_output_handle
+                )
+            )
 
     def set_intermediate(
         self, context, dagster_type=None, step_output_handle=None, value=None, runtime_type=None
@@ -134,11 +273,14 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(canonicalize_dagster_type, 'dagster_type', DagsterType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
 
-        if self.has_intermediate(context, step_output_handle):
+        # Object stores replace any existing object, so only intermediates written by this manager
+        # are known to be replaced without an extra round trip to check for them
+        if step_output_handle in self._written_step_output_handles:
             context.log.warning(
                 'Replacing existing intermediate for %s.%s'
                 % (step_output_handle.step_key, step_output_handle.output_name)
             )
+        self._written_step_output_handles.add(step_output_handle)
 
         return self._intermediate_store.set_value(
             obj=value,
@@ -158,6 +300,13 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
             context, previous_run_id, self._get_paths(step_output_handle)
         )
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        key = self._intermediate_store.key_for_paths(self._get_paths(step_output_handle))
+        return self._intermediate_store.object_store.rm_object_at_key(key)
+
     @property
     def is_persistent(self):
         return True
@@ -1,8 +1,11 @@
 import hashlib
+import logging
 import os
+import threading
 from collections import defaultdict
 
-from watchdog.events import PatternMatchingEventHandler
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
 from dagster import check
@@ -17,7 +20,11 @@ from .compute_log_manager import (
     ComputeLogSubscription,
 )
 
-WATCHDOG_POLLING_TIMEOUT = 2.5
+# How long to wait for a burst of writes to a watched compute log to land before reading it
+WATCH_DEBOUNCE_INTERVAL = 0.05
+
+# How often to check watched compute logs for changes when no file system observer is available
+WATCH_POLLING_INTERVAL = 0.5
 
 IO_TYPE_EXTENSION = {ComputeIOType.STDOUT: 'out', ComputeIOType.STDERR: 'err'}
 
@@ -45,7 +52,7 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     def from_config_value(inst_data, config_value):
         return LocalComputeLogManager(inst_data=inst_data, **config_value)
 
-    def _run_directory(self, run_id):
+    def run_compute_log_directory(self, run_id):
         return os.path.join(self._base_dir, run_id, 'compute_logs')
 
     def get_local_path(self, run_id, step_key, io_type):
@@ -59,7 +66,7 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
         filename = "{}.{}".format(step_key, extension)
         if len(filename) > MAX_FILENAME_LENGTH:
             filename = "{}.{}".format(hashlib.md5(step_key.encode('utf-8')).hexdigest(), extension)
-        return os.path.join(self._run_directory(run_id), filename)
+        return os.path.join(self.run_compute_log_directory(run_id), filename)
 
     def read_logs_file(self, run_id, step_key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, step_key, io_type)
@@ -101,81 +108,253 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
+    def dispose(self):
+        self._subscription_manager.stop()
+
 
 class LocalComputeLogSubscriptionManager(object):
+    '''Watches the compute logs of a LocalComputeLogManager on behalf of all of its subscriptions.
+
+    A single thread serves every subscription. File system events on the compute log directory of
+    each run with subscriptions mark the watched steps as modified, and are debounced for
+    ``WATCH_DEBOUNCE_INTERVAL`` seconds so that a burst of writes results in a single read per
+    subscription, from the cursor at which its last read stopped. Where no native file system
+    observer is available, or a directory cannot be watched, the thread instead checks the log files
+    of the watched steps for modifications every ``WATCH_POLLING_INTERVAL`` seconds.
+
+    The thread is started when the first subscription is made.
+    '''
+
     def __init__(self, manager):
-        self._manager = manager
+        self._manager = check.inst_param(manager, 'manager', LocalComputeLogManager)
+        self._lock = threading.Lock()
         self._subscriptions = defaultdict(list)
-        self._watchers = {}
-        self._observer = PollingObserver(WATCHDOG_POLLING_TIMEOUT)
-        self._observer.start()
+        self._keys_by_path = {}
+        self._watches = {}
+        self._modified_keys = set()
+        self._file_stats = {}
+        self._wakeup = threading.Event()
+        self._shutdown = threading.Event()
+        self._observer = None
+        self._thread = None
 
-    def _key(self, run_id, step_key):
-        return '{}:{}'.format(run_id, step_key)
+    @property
+    def is_polling(self):
+        return self._thread is not None and self._observer is None
 
     def add_subscription(self, subscription):
         check.inst_param(subscription, 'subscription', ComputeLogSubscription)
-        key = self._key(subscription.run_id, subscription.step_key)
-        self._subscriptions[key].append(subscription)
-        self.watch(subscription.run_id, subscription.step_key)
+        key = (subscription.run_id, subscription.step_key)
+
+        with self._lock:
+            self._start()
+            if key not in self._subscriptions:
+                self._watch(key)
+            self._subscriptions[key].append(subscription)
+            # Catch up on any output written, or completion, before the subscription was made
+            self._modified_keys.add(key)
+        self._wakeup.set()
 
     def remove_all_subscriptions(self, run_id, step_key):
-        key = self._key(run_id, step_key)
-        for subscription in self._subscriptions.pop(key, []):
+        key = (run_id, step_key)
+        with self._lock:
+            subscriptions = self._subscriptions.pop(key, [])
+            if subscriptions:
+                self._unwatch(key)
+
+        for subscription in subscriptions:
             subscription.complete()
 
-    def watch(self, run_id, step_key):
-        key = self._key(run_id, step_key)
-        if key in self._watchers:
+    def notify_subscriptions(self, run_id, step_key):
+        key = (run_id, step_key)
+        with self._lock:
+            if key not in self._subscriptions:
+                return
+            self._modified_keys.add(key)
+        self._wakeup.set()
+
+    def notify_modified_path(self, path):
+        # Native observers may report paths with symlinks resolved
+        key = self._keys_by_path.get(os.path.realpath(path))
+        if key is not None:
+            self.notify_subscriptions(*key)
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+            observer, self._observer = self._observer, None
+            self._watches = {}
+
+        if thread is None:
             return
 
-        update_paths = [
+        self._shutdown.set()
+        self._wakeup.set()
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        thread.join()
+
+    def _paths(self, key):
+        run_id, step_key = key
+        return [
             self._manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT),
             self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR),
+            self._manager.complete_artifact_path(run_id, step_key),
         ]
-        complete_paths = [self._manager.complete_artifact_path(run_id, step_key)]
-        directory = os.path.dirname(
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR)
-        )
+
+    def _watch(self, key):
+        for path in self._paths(key):
+            self._keys_by_path[os.path.realpath(path)] = key
+
+        directory = self._manager.run_compute_log_directory(key[0])
+        if self._observer is None or directory in self._watches:
+            return
 
         ensure_dir(directory)
-        self._watchers[key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(
-                self, run_id, step_key, update_paths, complete_paths
-            ),
-            str(directory),
-        )
+        try:
+            self._watches[directory] = self._observer.schedule(
+                LocalComputeLogFilesystemEventHandler(self), directory
+            )
+        except OSError:
+            # e.g., the inotify watch limit has been reached, in which case this step is polled
+            logging.info(
+                'LocalComputeLogSubscriptionManager: Unable to watch {directory}, falling back to '
+                'polling'.format(directory=directory)
+            )
+
+    def _unwatch(self, key):
+        for path in self._paths(key):
+            self._keys_by_path.pop(os.path.realpath(path), None)
+        self._file_stats.pop(key, None)
+
+        directory = self._manager.run_compute_log_directory(key[0])
+        if directory not in self._watches or any(
+            other[0] == key[0] for other in self._subscriptions
+        ):
+            return
 
-    def notify_subscriptions(self, run_id, step_key):
-        key = self._key(run_id, step_key)
-        for subscription in self._subscriptions[key]:
+        watch = self._watches.pop(directory)
+        if self._observer is not None:
+            self._observer.unschedule(watch)
+
+    def _polled_keys(self):
+        return [
+            key
+            for key in self._subscriptions
+            if self._manager.run_compute_log_directory(key[0]) not in self._watches
+        ]
+
+    def _start(self):
+        if self._thread is not None:
+            return
+
+        if Observer is not PollingObserver:
+            # The polling observer would snapshot the watched directories on every pass, which is
+            # more expensive than checking the log files of the watched steps ourselves
+            try:
+                observer = Observer()
+                observer.start()
+                self._observer = observer
+            except OSError:
+                # e.g., the inotify instance limit has been reached
+                logging.info(
+                    'LocalComputeLogSubscriptionManager: Unable to start file system observer, '
+                    'falling back to polling'
+                )
+
+        self._shutdown.clear()
+        self._thread = threading.Thread(target=self._run, name='compute-log-watcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while not self._shutdown.is_set():
+            with self._lock:
+                polling = bool(self._polled_keys())
+
+            if polling:
+                self._wakeup.wait(WATCH_POLLING_INTERVAL)
+                self._check_for_modified_keys()
+            else:
+                self._wakeup.wait()
+
+            if not self._wakeup.is_set():
+                continue
+
+            # Give a burst of writes the chance to land before reading
+            self._shutdown.wait(WATCH_DEBOUNCE_INTERVAL)
+            if self._shutdown.is_set():
+                break
+
+            self._wakeup.clear()
+            with self._lock:
+                keys, self._modified_keys = self._modified_keys, set()
+
+            for key in keys:
+                try:
+                    self._process(key)
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception(
+                        'LocalComputeLogSubscriptionManager: Error reading compute logs for step '
+                        '{step_key} of run {run_id}'.format(run_id=key[0], step_key=key[1])
+                    )
+
+    def _check_for_modified_keys(self):
+        with self._lock:
+            keys = self._polled_keys()
+
+        modified = False
+        for key in keys:
+            file_stats = tuple(_file_stat(path) for path in self._paths(key))
+            with self._lock:
+                if key in self._subscriptions and self._file_stats.get(key) != file_stats:
+                    self._file_stats[key] = file_stats
+                    self._modified_keys.add(key)
+                    modified = True
+
+        if modified:
+            self._wakeup.set()
+
+    def _process(self, key):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(key, []))
+
+        if not subscriptions:
+            return
+
+        # Check for completion before reading, so that no output written before the step completed
+        # is missed
+        is_complete = self._manager.is_compute_completed(*key)
+
+        for subscription in subscriptions:
             subscription.fetch()
 
-    def unwatch(self, run_id, step_key, handler):
-        key = self._key(run_id, step_key)
-        if key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[key])
-        del self._watchers[key]
+        if is_complete:
+            self.remove_all_subscriptions(*key)
+
 
+def _file_stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
 
-class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
-    def __init__(self, manager, run_id, step_key, update_paths, complete_paths):
-        self.manager = manager
-        self.run_id = run_id
-        self.step_key = step_key
-        self.update_paths = update_paths
-        self.complete_paths = complete_paths
-        patterns = update_paths + complete_paths
-        super(LocalComputeLogFilesystemEventHandler, self).__init__(patterns=patterns)
+
+class LocalComputeLogFilesystemEventHandler(FileSystemEventHandler):
+    '''Notifies a LocalComputeLogSubscriptionManager of changes to the files of a compute log
+    directory.'''
+
+    def __init__(self, manager):
+        self.manager = check.inst_param(manager, 'manager', LocalComputeLogSubscriptionManager)
+        super(LocalComputeLogFilesystemEventHandler, self).__init__()
 
     def on_created(self, event):
-        if event.src_path in self.complete_paths:
-            self.manager.remove_all_subscriptions(self.run_id, self.step_key)
-            self.manager.unwatch(self.run_id, self.step_key, self)
+        self.manager.notify_modified_path(event.src_path)
 
     def on_modified(self, event):
-        if event.src_path in self.update_paths:
-            self.manager.notify_subscriptions(self.run_id, self.step_key)
+        self.manager.notify_modified_path(event.src_path)
 
 
 class NoOpComputeLogManager(LocalComputeLogManager):
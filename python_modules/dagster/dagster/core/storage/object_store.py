@@ -1,15 +1,24 @@
-import logging
+import errno
 import os
 import shutil
 from abc import ABCMeta, abstractmethod
 
 import six
 
-from dagster import check
+from dagster import check, seven
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
-from dagster.core.types.marshal import PickleSerializationStrategy, SerializationStrategy
+from dagster.core.errors import DagsterObjectStoreKeyNotFoundError
+from dagster.core.types.marshal import (
+    PickleSerializationStrategy,
+    SerializationStrategy,
+    resolve_serialization_strategy,
+)
 from dagster.utils import mkdir_p
 
+# The key under which the name of the serialization strategy used to write an object is recorded in
+# the object's metadata
+SERIALIZATION_STRATEGY_METADATA_KEY = 'dagster-serialization-strategy'
+
 
 class ObjectStore(six.with_metaclass(ABCMeta)):
     def __init__(self, name, sep):
@@ -25,7 +34,11 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
 
     @abstractmethod
     def set_object(self, key, obj, serialization_strategy=None):
-        '''Implement this method to set an object in the object store.
+        '''Implement this method to set an object in the object store, replacing any object that
+        already exists at the key.
+
+        The name of the serialization strategy should be recorded in the object's metadata, so that
+        the object can be read back with the same strategy.
         
         Should return an ObjectStoreOperation with op==ObjectStoreOperationType.SET_OBJECT
         on success.'''
@@ -33,9 +46,14 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
     @abstractmethod
     def get_object(self, key, serialization_strategy=None):
         '''Implement this method to get an object from the object store.
+
+        The object should be deserialized with the strategy recorded in its metadata, resolved with
+        resolve_serialization_strategy, falling back to serialization_strategy for objects written
+        without one.
         
         Should return an ObjectStoreOperation with op==ObjectStoreOperationType.GET_OBJECT
-        on success.'''
+        on success, and raise DagsterObjectStoreKeyNotFoundError if there is no object at the key,
+        so that callers need not check for the object first.'''
 
     @abstractmethod
     def has_object(self, key):
@@ -50,6 +68,17 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         Should return an ObjectStoreOperation with op==ObjectStoreOperationType.RM_OBJECT
         on success.'''
 
+    def rm_object_at_key(self, key):
+        '''Remove the object at exactly the given key, along with any objects nested under it, but
+        not objects whose keys merely start with it.
+
+        Object stores whose rm_object removes every object whose key starts with the given key,
+        such as S3, must override this method.
+
+        Should return an ObjectStoreOperation with op==ObjectStoreOperationType.RM_OBJECT
+        on success.'''
+        return self.rm_object(key)
+
     @abstractmethod
     def cp_object(self, src, dst):
         '''Implement this method to copy an object from one key to another in the object store.
@@ -71,6 +100,30 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
 DEFAULT_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
 
 
+def _metadata_path(key):
+    # The filesystem has no portable notion of object metadata, so it is kept alongside the object,
+    # in a hidden file that can't be mistaken for another object
+    dirname, basename = os.path.split(key)
+    return os.path.join(dirname, '.' + basename + '.meta')
+
+
+def _unlink_if_exists(path):
+    try:
+        os.unlink(path)
+    except OSError as exc:
+        if exc.errno != errno.ENOENT:
+            raise
+
+
+def _link_or_copy(src, dst):
+    # Copies from previous runs are hard links where the filesystem supports them, so that
+    # re-execution does not duplicate the data of large intermediates
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):
+        shutil.copy(src, dst)
+
+
 class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def __init__(self):
         super(FilesystemObjectStore, self).__init__(name='filesystem', sep=os.sep)
@@ -80,15 +133,25 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         # obj is an arbitrary Python object
         check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
 
-        if os.path.exists(key):
-            logging.warning('Removing existing path {path}'.format(path=key))
-            os.unlink(key)
-
         # Ensure path exists
         mkdir_p(os.path.dirname(key))
 
+        # The object may be a hard link to an object of a previous run, which must not be
+        # overwritten in place
+        _unlink_if_exists(key)
+        _unlink_if_exists(_metadata_path(key))
+
         serialization_strategy.serialize_to_file(obj, key)
 
+        # Objects without metadata are read with the strategy passed to get_object, so it is only
+        # recorded for objects that aren't written with the default strategy
+        if serialization_strategy.name != DEFAULT_SERIALIZATION_STRATEGY.name:
+            with open(_metadata_path(key), 'w') as metadata_file:
+                seven.json.dump(
+                    {SERIALIZATION_STRATEGY_METADATA_KEY: serialization_strategy.name},
+                    metadata_file,
+                )
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
             key=key,
@@ -103,7 +166,29 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         check.param_invariant(len(key) > 0, 'key')
         check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
 
-        obj = serialization_strategy.deserialize_from_file(key)
+        try:
+            with open(_metadata_path(key), 'r') as metadata_file:
+                metadata = seven.json.load(metadata_file)
+        except (IOError, OSError) as exc:
+            if exc.errno != errno.ENOENT:
+                raise
+            metadata = {}
+
+        serialization_strategy = resolve_serialization_strategy(
+            metadata.get(SERIALIZATION_STRATEGY_METADATA_KEY), serialization_strategy
+        )
+
+        try:
+            obj = serialization_strategy.deserialize_from_file(key)
+        except (IOError, OSError) as exc:
+            if exc.errno != errno.ENOENT:
+                raise
+            six.raise_from(
+                DagsterObjectStoreKeyNotFoundError(
+                    'No object at path {path}'.format(path=key), key=key
+                ),
+                exc,
+            )
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
@@ -127,6 +212,8 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         if self.has_object(key):
             if os.path.isfile(key):
                 os.unlink(key)
+                if os.path.exists(_metadata_path(key)):
+                    os.unlink(_metadata_path(key))
             elif os.path.isdir(key):
                 shutil.rmtree(key)
 
@@ -146,7 +233,9 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         mkdir_p(os.path.dirname(dst))
 
         if os.path.isfile(src):
-            shutil.copy(src, dst)
+            _link_or_copy(src, dst)
+            if os.path.exists(_metadata_path(src)):
+                _link_or_copy(_metadata_path(src), _metadata_path(dst))
         elif os.path.isdir(src):
             shutil.copytree(src, dst)
         else:
@@ -47,6 +47,31 @@ class PipelineRunStatsSnapshot(
         )
 
 
+class PipelineRunSummary(
+    namedtuple(
+        '_PipelineRunSummary', 'run_id pipeline_name status create_timestamp update_timestamp'
+    )
+):
+    '''The columns of a run that storage can report without reading the full PipelineRun.
+
+    Run storages that do not track creation and update times report them as None.
+    '''
+
+    def __new__(cls, run_id, pipeline_name, status, create_timestamp=None, update_timestamp=None):
+        return super(PipelineRunSummary, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, 'run_id'),
+            pipeline_name=check.str_param(pipeline_name, 'pipeline_name'),
+            status=check.inst_param(status, 'status', PipelineRunStatus),
+            create_timestamp=create_timestamp,
+            update_timestamp=update_timestamp,
+        )
+
+    @property
+    def is_finished(self):
+        return self.status == PipelineRunStatus.SUCCESS or self.status == PipelineRunStatus.FAILURE
+
+
 @whitelist_for_serdes
 class PipelineRun(
     namedtuple(
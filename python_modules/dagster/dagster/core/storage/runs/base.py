@@ -2,6 +2,8 @@ from abc import ABCMeta, abstractmethod
 
 import six
 
+from ..pipeline_run import PipelineRunSummary
+
 
 class RunStorage(six.with_metaclass(ABCMeta)):
     '''Abstract base class for storing pipeline run history.
@@ -45,6 +47,28 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             List[PipelineRun]
         '''
 
+    def get_run_summaries(self, filters=None, cursor=None, limit=None):
+        '''Return summaries of the runs present in the storage that match the given filter, in the
+        same order as get_runs.
+
+        Storages that can read the summary columns of a run without loading the full run should
+        override this method.
+
+        Args:
+            filter (Optional[PipelineRunsFilter]) -- The PipelineRunFilter to filter runs by
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[PipelineRunSummary]
+        '''
+        return [
+            PipelineRunSummary(
+                run_id=run.run_id, pipeline_name=run.pipeline_name, status=run.status
+            )
+            for run in self.get_runs(filters, cursor, limit)
+        ]
+
     @abstractmethod
     def get_runs_count(self, filters=None):
         '''Return the number of runs present in the storage that match the given filter
@@ -12,6 +12,7 @@ RunsTable = db.Table(
     db.Column('run_body', db.String),
     db.Column('create_timestamp', db.DateTime, server_default=db.text('CURRENT_TIMESTAMP')),
     db.Column('update_timestamp', db.DateTime, server_default=db.text('CURRENT_TIMESTAMP')),
+    db.Index('idx_run_pipeline_name_status', 'pipeline_name', 'status', 'create_timestamp'),
 )
 
 RunTagsTable = db.Table(
@@ -21,4 +22,5 @@ RunTagsTable = db.Table(
     db.Column('run_id', None, db.ForeignKey('runs.run_id', ondelete="CASCADE")),
     db.Column('key', db.String),
     db.Column('value', db.String),
+    db.Index('idx_run_tags_key_value', 'key', 'value'),
 )
@@ -11,7 +11,7 @@ from dagster.core.errors import DagsterRunAlreadyExists
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 
-from ..pipeline_run import PipelineRun, PipelineRunStatus
+from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunSummary
 from .base import RunStorage
 from .schema import RunTagsTable, RunsTable
 
@@ -77,26 +77,27 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         if event.event_type not in lookup:
             return
 
-        run = self.get_run_by_id(run_id)
-        if not run:
-            # TODO log?
-            return
-
         new_pipeline_status = lookup[event.event_type]
 
+        # Only the status column is written here, in a single statement, so that lifecycle events
+        # neither read the run back nor race with other writers of the run. The status recorded in
+        # run_body is reconciled with the status column when the run is read.
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
                 .where(RunsTable.c.run_id == run_id)
-                .values(
-                    status=new_pipeline_status.value,
-                    run_body=serialize_dagster_namedtuple(run.run_with_status(new_pipeline_status)),
-                    update_timestamp=datetime.now(),
-                )
+                .values(status=new_pipeline_status.value, update_timestamp=datetime.now())
             )
 
+    def _row_to_run(self, row):
+        run_body, status = row
+        run = deserialize_json_to_dagster_namedtuple(run_body)
+        if status is not None and run.status.value != status:
+            run = run.run_with_status(PipelineRunStatus(status))
+        return run
+
     def _rows_to_runs(self, rows):
-        return list(map(lambda r: deserialize_json_to_dagster_namedtuple(r[0]), rows))
+        return list(map(self._row_to_run, rows))
 
     def _add_cursor_limit_to_query(self, query, cursor, limit):
         ''' Helper function to deal with cursor/limit pagination args '''
@@ -123,18 +124,16 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         if filters.status:
             query = query.where(RunsTable.c.status == filters.status.value)
 
-        if filters.tags:
+        # Each tag is matched by its own lookup on the (key, value) index of the tags table, rather
+        # than by grouping the rows of a join over all tags
+        for key, value in filters.tags.items():
             query = query.where(
-                db.or_(
-                    *(
+                RunsTable.c.run_id.in_(
+                    db.select([RunTagsTable.c.run_id]).where(
                         db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
-                        for key, value in filters.tags.items()
                     )
                 )
-            ).group_by(RunsTable.c.run_body, RunsTable.c.id)
-
-            if len(filters.tags) > 0:
-                query = query.having(db.func.count(RunsTable.c.run_id) == len(filters.tags))
+            )
 
         return query
 
@@ -145,39 +144,50 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         check.opt_str_param(cursor, 'cursor')
         check.opt_int_param(limit, 'limit')
 
-        # If we have a tags filter, then we need to select from a joined table
-        if filters.tags:
-            base_query = db.select([RunsTable.c.run_body]).select_from(
-                RunsTable.outerjoin(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
-            )
-        else:
-            base_query = db.select([RunsTable.c.run_body]).select_from(RunsTable)
-
-        query = self._add_filters_to_query(base_query, filters)
+        query = self._add_filters_to_query(
+            db.select([RunsTable.c.run_body, RunsTable.c.status]), filters
+        )
         query = self._add_cursor_limit_to_query(query, cursor, limit)
         rows = self.execute(query)
         return self._rows_to_runs(rows)
 
-    def get_runs_count(self, filters=None):
+    def get_run_summaries(self, filters=None, cursor=None, limit=None):
         filters = check.opt_inst_param(
             filters, 'filters', PipelineRunsFilter, default=PipelineRunsFilter()
         )
+        check.opt_str_param(cursor, 'cursor')
+        check.opt_int_param(limit, 'limit')
 
-        # If we have a tags filter, then we need to select from a joined table
-        if filters.tags:
-            subquery = db.select([1]).select_from(
-                RunsTable.outerjoin(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
+        query = db.select(
+            [
+                RunsTable.c.run_id,
+                RunsTable.c.pipeline_name,
+                RunsTable.c.status,
+                RunsTable.c.create_timestamp,
+                RunsTable.c.update_timestamp,
+            ]
+        )
+        query = self._add_filters_to_query(query, filters)
+        query = self._add_cursor_limit_to_query(query, cursor, limit)
+        rows = self.execute(query)
+        return [
+            PipelineRunSummary(
+                run_id=run_id,
+                pipeline_name=pipeline_name,
+                status=PipelineRunStatus(status),
+                create_timestamp=create_timestamp,
+                update_timestamp=update_timestamp,
             )
-        else:
-            subquery = db.select([1]).select_from(RunsTable)
+            for (run_id, pipeline_name, status, create_timestamp, update_timestamp) in rows
+        ]
 
-        subquery = self._add_filters_to_query(subquery, filters)
-
-        # We use an alias here because Postgres requires subqueries to be
-        # aliased.
-        subquery = subquery.alias("subquery")
+    def get_runs_count(self, filters=None):
+        filters = check.opt_inst_param(
+            filters, 'filters', PipelineRunsFilter, default=PipelineRunsFilter()
+        )
 
-        query = db.select([db.func.count()]).select_from(subquery)
+        query = db.select([db.func.count()]).select_from(RunsTable)
+        query = self._add_filters_to_query(query, filters)
         rows = self.execute(query)
         count = rows[0][0]
         return count
@@ -193,13 +203,15 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         '''
         check.str_param(run_id, 'run_id')
 
-        query = db.select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
+        query = db.select([RunsTable.c.run_body, RunsTable.c.status]).where(
+            RunsTable.c.run_id == run_id
+        )
         rows = self.execute(query)
-        return deserialize_json_to_dagster_namedtuple(rows[0][0]) if len(rows) else None
+        return self._row_to_run(rows[0]) if len(rows) else None
 
     def get_run_tags(self):
         result = defaultdict(set)
-        query = db.select([RunTagsTable.c.key, RunTagsTable.c.value]).distinct(RunTagsTable.c.value)
+        query = db.select([RunTagsTable.c.key, RunTagsTable.c.value]).distinct()
         rows = self.execute(query)
         for r in rows:
             result[r[0]].add(r[1])
@@ -207,7 +219,10 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
 
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
-        return bool(self.get_run_by_id(run_id))
+
+        query = db.select([RunsTable.c.id]).where(RunsTable.c.run_id == run_id).limit(1)
+        rows = self.execute(query)
+        return bool(rows)
 
     def delete_run(self, run_id):
         check.str_param(run_id, 'run_id')
@@ -0,0 +1,43 @@
+"""add indexes for run summaries and tag filters
+
+Revision ID: 3b1e175a2be3
+Revises: 9fe9e746268c
+Create Date: 2020-03-12 10:41:27.319046
+
+"""
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# revision identifiers, used by Alembic.
+revision = '3b1e175a2be3'
+down_revision = '9fe9e746268c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'runs' in has_tables:
+        has_indexes = [index['name'] for index in inspector.get_indexes('runs')]
+        if 'idx_run_pipeline_name_status' not in has_indexes:
+            op.create_index(
+                'idx_run_pipeline_name_status',
+                'runs',
+                ['pipeline_name', 'status', 'create_timestamp'],
+            )
+
+    if 'run_tags' in has_tables:
+        has_indexes = [index['name'] for index in inspector.get_indexes('run_tags')]
+        if 'idx_run_tags_key_value' not in has_indexes:
+            op.create_index('idx_run_tags_key_value', 'run_tags', ['key', 'value'])
+
+
+def downgrade():
+    op.drop_index('idx_run_tags_key_value', 'run_tags')
+    op.drop_index('idx_run_pipeline_name_status', 'runs')
@@ -9,7 +9,16 @@ from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.seven import urljoin, urlparse
 from dagster.utils import mkdir_p
 
-from ...sql import check_alembic_revision, create_engine, get_alembic_config, stamp_alembic_rev
+from ...sql import (
+    EngineCache,
+    check_alembic_revision,
+    connection_pool_config,
+    create_engine,
+    get_alembic_config,
+    pool_kwargs_from_config,
+    run_alembic_upgrade,
+    stamp_alembic_rev,
+)
 from ..schema import RunStorageSqlMetadata, RunTagsTable, RunsTable
 from ..sql_run_storage import SqlRunStorage
 
@@ -34,28 +43,34 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
           config:
             base_dir: /path/to/dir
     
-    The ``base_dir`` param tells the run storage where on disk to store the database.
+    The ``base_dir`` param tells the run storage where on disk to store the database. Connections
+    to the database are pooled for the lifetime of the storage; the optional ``connection_pool``
+    param configures the pool, see :py:func:`~dagster.core.storage.sql.connection_pool_config`.
     '''
 
-    def __init__(self, conn_string, inst_data=None):
+    def __init__(self, conn_string, inst_data=None, connection_pool=None):
         check.str_param(conn_string, 'conn_string')
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
+        engine_kwargs = pool_kwargs_from_config(connection_pool)
+        engine_kwargs['connect_args'] = {'check_same_thread': False}
+        self._engine_cache = EngineCache(engine_kwargs)
+
     @property
     def inst_data(self):
         return self._inst_data
 
     @classmethod
     def config_type(cls):
-        return {'base_dir': str}
+        return {'base_dir': str, 'connection_pool': connection_pool_config()}
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return SqliteRunStorage.from_local(inst_data=inst_data, **config_value)
 
     @staticmethod
-    def from_local(base_dir, inst_data=None):
+    def from_local(base_dir, inst_data=None, connection_pool=None):
         check.str_param(base_dir, 'base_dir')
         mkdir_p(base_dir)
         path_components = os.path.abspath(base_dir).split(os.sep)
@@ -65,21 +80,28 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
         RunStorageSqlMetadata.create_all(engine)
         alembic_config = get_alembic_config(__file__)
         connection = engine.connect()
-        db_revision, head_revision = check_alembic_revision(alembic_config, connection)
-        if not (db_revision and head_revision and db_revision == head_revision):
+        db_revision, _head_revision = check_alembic_revision(alembic_config, connection)
+        # A database that already tracks its revision is brought up to date by upgrade, since
+        # create_all does not add new indexes to existing tables
+        if not db_revision:
             stamp_alembic_rev(alembic_config, engine)
+        connection.close()
+        engine.dispose()
 
-        return SqliteRunStorage(conn_string, inst_data)
+        return SqliteRunStorage(conn_string, inst_data, connection_pool)
 
     @contextmanager
     def connect(self):
-        engine = create_engine(self._conn_string, poolclass=NullPool)
+        engine = self._engine_cache.get_engine(self._conn_string)
         conn = engine.connect()
         try:
             yield conn
         finally:
             conn.close()
 
+    def dispose(self):
+        self._engine_cache.dispose()
+
     def upgrade(self):
         old_conn_string = 'sqlite://' + urljoin(urlparse(self._conn_string).path, '../runs.db')
         path_to_old_db = urlparse(old_conn_string).path
@@ -94,6 +116,10 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
                 self.add_run(run)
             os.unlink(path_to_old_db)
 
+        alembic_config = get_alembic_config(__file__)
+        with self.connect() as conn:
+            run_alembic_upgrade(alembic_config, conn)
+
     def delete_run(self, run_id):
         ''' Override the default sql delete run implementation until we can get full
         support on cascading deletes '''
@@ -1,3 +1,6 @@
+import os
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 
 # pylint chokes on the perfectly ok import from alembic.migration
@@ -8,12 +11,129 @@ from alembic.config import Config
 from alembic.migration import MigrationContext  # pylint: disable=import-error
 from alembic.script import ScriptDirectory
 
+from dagster import check
+from dagster.config import Field
 from dagster.core.errors import DagsterInstanceMigrationRequired
 from dagster.utils import file_relative_path
 from dagster.utils.log import quieten
 
 create_engine = db.create_engine  # exported
 
+DEFAULT_POOL_SIZE = 5
+DEFAULT_POOL_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE = -1
+
+
+def connection_pool_config():
+    '''The config field with which SQL storages expose their connection pool settings, e.g.:
+
+    .. code-block:: YAML
+
+        connection_pool:
+          size: 5
+          max_overflow: 10
+          recycle: 3600
+          pre_ping: true
+    '''
+    return Field(
+        {
+            'size': Field(int, is_required=False, default_value=DEFAULT_POOL_SIZE),
+            'max_overflow': Field(int, is_required=False, default_value=DEFAULT_POOL_MAX_OVERFLOW),
+            'recycle': Field(int, is_required=False, default_value=DEFAULT_POOL_RECYCLE),
+            'pre_ping': Field(bool, is_required=False, default_value=False),
+        },
+        is_required=False,
+    )
+
+
+def pool_kwargs_from_config(connection_pool=None):
+    '''Translate a value of the connection_pool config field into kwargs for create_engine.'''
+    connection_pool = check.opt_dict_param(connection_pool, 'connection_pool')
+
+    kwargs = dict(
+        poolclass=db.pool.QueuePool,
+        pool_size=connection_pool.get('size', DEFAULT_POOL_SIZE),
+        max_overflow=connection_pool.get('max_overflow', DEFAULT_POOL_MAX_OVERFLOW),
+        pool_recycle=connection_pool.get('recycle', DEFAULT_POOL_RECYCLE),
+    )
+    # pool_pre_ping is only available in sqlalchemy>=1.2, so don't pass it unless asked to
+    if connection_pool.get('pre_ping'):
+        kwargs['pool_pre_ping'] = True
+
+    return kwargs
+
+
+class EngineCache(object):
+    '''Caches long-lived, pooled sqlalchemy engines by connection string.
+
+    Engines are created on first use and reused until they are disposed of. An engine that was
+    inherited across a fork is never used or disposed of by the child process, since its pooled
+    connections share sockets and file handles with the parent; the child creates a fresh engine on
+    first use instead.
+
+    Args:
+        engine_kwargs (Optional[dict]): Keyword arguments passed to create_engine.
+        max_engines (Optional[int]): If set, the least recently used engine is disposed of whenever
+            more than this many engines are cached.
+    '''
+
+    def __init__(self, engine_kwargs=None, max_engines=None):
+        self._engine_kwargs = check.opt_dict_param(engine_kwargs, 'engine_kwargs')
+        self._max_engines = check.opt_int_param(max_engines, 'max_engines')
+        self._lock = threading.Lock()
+        self._engines = OrderedDict()
+        self._pid = os.getpid()
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            self._engines = OrderedDict()
+            self._pid = os.getpid()
+
+    def get_engine(self, conn_string, init_fn=None):
+        '''Get the cached engine for a connection string, creating it if necessary.
+
+        Args:
+            conn_string (str): The connection string.
+            init_fn (Optional[Callable[[Engine], None]]): Called with each newly created engine
+                before it is cached, e.g. to initialize the database schema.
+        '''
+        check.str_param(conn_string, 'conn_string')
+        check.opt_callable_param(init_fn, 'init_fn')
+
+        with self._lock:
+            self._check_pid()
+
+            engine = self._engines.pop(conn_string, None)
+            if engine is None:
+                engine = create_engine(conn_string, **self._engine_kwargs)
+                if init_fn:
+                    init_fn(engine)
+
+            self._engines[conn_string] = engine
+
+            while self._max_engines and len(self._engines) > self._max_engines:
+                _, evicted = self._engines.popitem(last=False)
+                evicted.dispose()
+
+            return engine
+
+    def dispose(self, conn_string=None):
+        '''Dispose of the cached engine for a connection string, or of all cached engines.'''
+        check.opt_str_param(conn_string, 'conn_string')
+
+        with self._lock:
+            self._check_pid()
+
+            if conn_string is None:
+                engines = list(self._engines.values())
+                self._engines = OrderedDict()
+            else:
+                engine = self._engines.pop(conn_string, None)
+                engines = [engine] if engine else []
+
+        for engine in engines:
+            engine.dispose()
+
 
 def get_alembic_config(dunder_file, config_path='alembic/alembic.ini', script_path='alembic/'):
     alembic_config = Config(file_relative_path(dunder_file, config_path))
@@ -1,5 +1,6 @@
 from dagster.config import Field
 from dagster.core.definitions.system_storage import SystemStorageData, system_storage
+from dagster.core.types.marshal import get_serialization_strategy
 
 from .file_manager import LocalFileManager
 from .intermediate_store import build_fs_intermediate_store
@@ -9,6 +10,15 @@ from .intermediates_manager import (
 )
 
 
+def serialization_strategy_from_config(system_storage_config):
+    '''The serialization strategy selected by name in the ``serialization_strategy`` config value
+    of a persistent system storage, if any.'''
+    serialization_strategy_name = system_storage_config.get('serialization_strategy')
+    if serialization_strategy_name is None:
+        return None
+    return get_serialization_strategy(serialization_strategy_name)
+
+
 def create_mem_system_storage_data(init_context):
     return SystemStorageData(
         intermediates_manager=InMemoryIntermediatesManager(),
@@ -37,7 +47,10 @@ def mem_system_storage(init_context):
 @system_storage(
     name='filesystem',
     is_persistent=True,
-    config={'base_dir': Field(str, is_required=False)},
+    config={
+        'base_dir': Field(str, is_required=False),
+        'serialization_strategy': Field(str, is_required=False),
+    },
     required_resource_keys=set(),
 )
 def fs_system_storage(init_context):
@@ -55,14 +68,21 @@ def fs_system_storage(init_context):
 
     You may omit the ``base_dir`` config value, in which case the filesystem storage will use
     the :py:class:`DagsterInstance`-provided default.
+
+    Intermediates of types that don't specify their own serialization strategy are pickled. To
+    store them differently, set ``serialization_strategy`` to the name of a registered strategy,
+    such as ``pickle_compressed``, which pickles with the highest protocol and compresses with zstd
+    or lz4 if installed and zlib otherwise.
     '''
     override_dir = init_context.system_storage_config.get('base_dir')
+    serialization_strategy = serialization_strategy_from_config(init_context.system_storage_config)
     if override_dir:
         file_manager = LocalFileManager(override_dir)
         intermediate_store = build_fs_intermediate_store(
             root_for_run_id=lambda _: override_dir,
             run_id=init_context.pipeline_run.run_id,
             type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+            serialization_strategy=serialization_strategy,
         )
     else:
         file_manager = LocalFileManager.for_instance(
@@ -72,6 +92,7 @@ def fs_system_storage(init_context):
             init_context.instance.intermediates_directory,
             run_id=init_context.pipeline_run.run_id,
             type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+            serialization_strategy=serialization_strategy,
         )
 
     return SystemStorageData(
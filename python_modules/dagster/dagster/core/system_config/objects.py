@@ -1,12 +1,17 @@
 '''System-provided config objects and constructors.'''
-from collections import namedtuple
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+import six
 
 from dagster import check
 from dagster.core.definitions.environment_schema import create_environment_type
 from dagster.core.definitions.pipeline import PipelineDefinition
 from dagster.core.errors import DagsterInvalidConfigError
 from dagster.core.execution.config import IRunConfig, RunConfig
-from dagster.utils import ensure_single_item
+from dagster.utils import ensure_single_item, frozendict, make_readonly_value
 
 
 class SolidConfig(namedtuple('_SolidConfig', 'config inputs outputs')):
@@ -63,14 +68,66 @@ class EnvironmentConfig(
 
     @staticmethod
     def build(pipeline, environment_dict=None, run_config=None):
-        from dagster.config.validate import process_config
-        from .composite_descent import composite_descent
-
+        '''Validate the environment dict for a pipeline in a mode, and process it into an
+        EnvironmentConfig.
+
+        The results are cached for each pipeline definition, keyed on the mode and the contents of
+        the environment dict, so config mapping functions on composite solids are expected to be
+        deterministic. Since they are shared, the processed solid, resource and logger config of
+        the results is read-only.
+        '''
         check.inst_param(pipeline, 'pipeline', PipelineDefinition)
         environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
         run_config = check.opt_inst_param(run_config, 'run_config', IRunConfig, default=RunConfig())
 
         mode = run_config.mode or pipeline.get_default_mode_name()
+
+        digest = _environment_dict_digest(environment_dict)
+        if digest is None:
+            return EnvironmentConfig._build(pipeline, environment_dict, run_config, mode)._freeze()
+
+        with _ENVIRONMENT_CONFIG_CACHE_LOCK:
+            cached = _ENVIRONMENT_CONFIG_CACHE.setdefault(pipeline, OrderedDict())
+            environment_config = cached.pop((mode, digest), None)
+            if environment_config is not None:
+                cached[(mode, digest)] = environment_config
+                # Refer to the dict passed by this caller, which may since have been modified by
+                # the caller that populated the cache
+                return environment_config._replace(original_config_dict=environment_dict)
+
+        environment_config = EnvironmentConfig._build(
+            pipeline, environment_dict, run_config, mode
+        )._freeze()
+
+        with _ENVIRONMENT_CONFIG_CACHE_LOCK:
+            cached = _ENVIRONMENT_CONFIG_CACHE.setdefault(pipeline, OrderedDict())
+            cached[(mode, digest)] = environment_config
+            while len(cached) > MAX_CACHED_ENVIRONMENT_CONFIGS:
+                cached.popitem(last=False)
+
+        return environment_config
+
+    def _freeze(self):
+        return self._replace(
+            solids=frozendict(
+                {
+                    name: SolidConfig(
+                        config=make_readonly_value(solid_config.config),
+                        inputs=make_readonly_value(solid_config.inputs),
+                        outputs=make_readonly_value(solid_config.outputs),
+                    )
+                    for name, solid_config in self.solids.items()
+                }
+            ),
+            resources=make_readonly_value(self.resources),
+            loggers=make_readonly_value(self.loggers),
+        )
+
+    @staticmethod
+    def _build(pipeline, environment_dict, run_config, mode):
+        from dagster.config.validate import process_config
+        from .composite_descent import composite_descent
+
         environment_type = create_environment_type(pipeline, mode)
 
         config_evr = process_config(environment_type, environment_dict)
@@ -95,6 +152,57 @@ class EnvironmentConfig(
         )
 
 
+# The number of validated environment configs cached for each pipeline definition
+MAX_CACHED_ENVIRONMENT_CONFIGS = 32
+
+_ENVIRONMENT_CONFIG_CACHE = weakref.WeakKeyDictionary()
+_ENVIRONMENT_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _environment_dict_digest(environment_dict):
+    '''A stable digest of the contents of an environment dict, or None if it can't be cached: if it
+    contains values other than dicts with string keys, lists and scalars, whose contents can't be
+    relied on, or values sourced from environment variables, which are read on each build.'''
+    canonical = _canonicalize(environment_dict)
+    if canonical is None:
+        return None
+    return hashlib.sha1(repr(canonical).encode('utf-8')).hexdigest()
+
+
+def _canonicalize(value):
+    if isinstance(value, dict):
+        if list(value.keys()) == ['env']:
+            # e.g. a StringSource, resolved when the config is post-processed
+            return None
+
+        items = []
+        for key, item in value.items():
+            if not isinstance(key, six.string_types):
+                return None
+            canonical_item = _canonicalize(item)
+            if canonical_item is None:
+                return None
+            items.append((six.text_type(key), canonical_item))
+        return ('dict', tuple(sorted(items)))
+
+    if isinstance(value, list):
+        items = []
+        for item in value:
+            canonical_item = _canonicalize(item)
+            if canonical_item is None:
+                return None
+            items.append(canonical_item)
+        return ('list', tuple(items))
+
+    if value is None or isinstance(value, (bool, float) + six.integer_types):
+        return (type(value).__name__, value)
+
+    if isinstance(value, six.string_types):
+        return ('str', six.text_type(value))
+
+    return None
+
+
 class ExecutionConfig(
     namedtuple('_ExecutionConfig', 'execution_engine_name execution_engine_config')
 ):
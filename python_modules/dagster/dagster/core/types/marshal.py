@@ -1,10 +1,15 @@
+import codecs
+import importlib
+import io
 import pickle
 import sys
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 
 import six
 
 from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
 from dagster.utils import PICKLE_PROTOCOL
 
 
@@ -49,6 +54,23 @@ class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-
     def deserialize(self, read_file_obj):
         '''Core deserialization method'''
 
+    def serialize_to_stream(self, value, write_stream):
+        '''Serialize a value to a binary file-like object, such as a spooled temporary file or a
+        stream that uploads its contents in parts, without first materializing the serialized value
+        in memory. Strategies that write text are encoded on the fly.'''
+        if self.write_mode == 'w' and sys.version_info >= (3, 0):
+            return self.serialize(value, codecs.getwriter(self.encoding)(write_stream))
+
+        return self.serialize(value, write_stream)
+
+    def deserialize_from_stream(self, read_stream):
+        '''Deserialize a value from a binary file-like object, decoding it on the fly for strategies
+        that read text.'''
+        if self.read_mode == 'r' and sys.version_info >= (3, 0):
+            return self.deserialize(codecs.getreader(self.encoding)(read_stream))
+
+        return self.deserialize(read_stream)
+
     def serialize_to_file(self, value, write_path):
         check.str_param(write_path, 'write_path')
 
@@ -63,11 +85,238 @@ class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-
 
 
 class PickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
-    def __init__(self, name='pickle'):
+    def __init__(self, name='pickle', protocol=PICKLE_PROTOCOL):
         super(PickleSerializationStrategy, self).__init__(name)
+        self._protocol = check.int_param(protocol, 'protocol')
+
+    @property
+    def protocol(self):
+        return self._protocol
 
     def serialize(self, value, write_file_obj):
-        pickle.dump(value, write_file_obj, PICKLE_PROTOCOL)
+        pickle.dump(value, write_file_obj, self._protocol)
 
     def deserialize(self, read_file_obj):
         return pickle.load(read_file_obj)
+
+
+# The modules providing the compression codecs supported by CompressedPickleSerializationStrategy,
+# in order of preference
+COMPRESSION_MODULES = OrderedDict([('zstd', 'zstandard'), ('lz4', 'lz4.frame'), ('zlib', 'zlib')])
+
+COMPRESSION_READ_SIZE = 64 * 1024
+
+
+class _Lz4Compressor(object):
+    '''Adapts an LZ4FrameCompressor to the compressobj interface of zlib and zstandard.'''
+
+    def __init__(self, compressor):
+        self._compressor = compressor
+        self._begun = False
+
+    def _begin(self):
+        if self._begun:
+            return b''
+        self._begun = True
+        return self._compressor.begin()
+
+    def compress(self, data):
+        return self._begin() + self._compressor.compress(data)
+
+    def flush(self):
+        return self._begin() + self._compressor.flush()
+
+
+def _codec(compression):
+    '''Build a streaming compressor, with compress and flush methods, and a streaming
+    decompressor, with a decompress method, for a compression codec.'''
+    module_name = COMPRESSION_MODULES[compression]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        six.raise_from(
+            DagsterInvariantViolationError(
+                'Could not import {module_name}, which is required to compress and decompress '
+                'objects with {compression}.'.format(
+                    module_name=module_name, compression=compression
+                )
+            ),
+            None,
+        )
+
+    if compression == 'zstd':
+        return (
+            module.ZstdCompressor(level=3).compressobj(),
+            module.ZstdDecompressor().decompressobj(),
+        )
+    elif compression == 'lz4':
+        return _Lz4Compressor(module.LZ4FrameCompressor()), module.LZ4FrameDecompressor()
+    else:
+        return module.compressobj(6), module.decompressobj()
+
+
+def default_compression():
+    '''The preferred compression codec that can be imported: zstd or lz4 if they are installed,
+    and otherwise zlib.'''
+    for compression, module_name in COMPRESSION_MODULES.items():
+        try:
+            importlib.import_module(module_name)
+            return compression
+        except ImportError:
+            continue
+
+    check.failed('zlib should always be available')
+
+
+class _CompressingWriter(object):
+    def __init__(self, write_stream, compressor):
+        self._write_stream = write_stream
+        self._compressor = compressor
+
+    def write(self, data):
+        compressed = self._compressor.compress(data)
+        if compressed:
+            self._write_stream.write(compressed)
+        return len(data)
+
+    def close(self):
+        self._write_stream.write(self._compressor.flush())
+
+
+class _DecompressingReader(io.RawIOBase):
+    def __init__(self, read_stream, decompressor):
+        super(_DecompressingReader, self).__init__()
+        self._read_stream = read_stream
+        self._decompressor = decompressor
+        self._buffer = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            compressed = self._read_stream.read(COMPRESSION_READ_SIZE)
+            if not compressed:
+                return 0
+            self._buffer = self._decompressor.decompress(compressed)
+
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class CompressedPickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Pickles values with the highest available pickle protocol, compressing them as they are
+    written.
+
+    Args:
+        compression (Optional[str]): One of 'zstd', 'lz4', or 'zlib'. Defaults to zstd or lz4 if the
+            zstandard or lz4 packages are installed, and to zlib otherwise.
+        protocol (Optional[int]): The pickle protocol to use. (default: pickle.HIGHEST_PROTOCOL)
+    '''
+
+    def __init__(self, compression=None, protocol=None):
+        self._compression = check.opt_str_param(compression, 'compression')
+        if self._compression is None:
+            self._compression = default_compression()
+        check.param_invariant(
+            self._compression in COMPRESSION_MODULES,
+            'compression',
+            'Unknown compression {compression}'.format(compression=self._compression),
+        )
+        self._protocol = check.opt_int_param(protocol, 'protocol')
+        if self._protocol is None:
+            self._protocol = pickle.HIGHEST_PROTOCOL
+        super(CompressedPickleSerializationStrategy, self).__init__(
+            'pickle_{compression}'.format(compression=self._compression)
+        )
+
+    @property
+    def compression(self):
+        return self._compression
+
+    def serialize(self, value, write_file_obj):
+        compressor, _ = _codec(self._compression)
+        writer = _CompressingWriter(write_file_obj, compressor)
+        pickle.dump(value, writer, self._protocol)
+        writer.close()
+
+    def deserialize(self, read_file_obj):
+        _, decompressor = _codec(self._compression)
+        return pickle.load(io.BufferedReader(_DecompressingReader(read_file_obj, decompressor)))
+
+
+class NumpySerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes numpy arrays in the .npy format, which is written and read without the overhead
+    of pickling. Arrays of Python objects, which can only be pickled, are not supported.'''
+
+    def __init__(self, name='npy'):
+        super(NumpySerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        import numpy as np
+
+        np.save(write_file_obj, value, allow_pickle=False)
+
+    def deserialize(self, read_file_obj):
+        import numpy as np
+
+        return np.load(read_file_obj, allow_pickle=False)
+
+
+_SERIALIZATION_STRATEGIES = {}
+
+
+def register_serialization_strategy(serialization_strategy, name=None):
+    '''Register a serialization strategy by name, so that system storages can be configured to use
+    it, and so that objects written with it can be read back by name.
+
+    Args:
+        serialization_strategy (SerializationStrategy): The strategy to register.
+        name (Optional[str]): The name under which to register the strategy, if it is not the
+            strategy's own name.
+    '''
+    check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
+    name = check.opt_str_param(name, 'name', default=serialization_strategy.name)
+    _SERIALIZATION_STRATEGIES[name] = serialization_strategy
+    return serialization_strategy
+
+
+def get_serialization_strategy(name):
+    check.str_param(name, 'name')
+    if name not in _SERIALIZATION_STRATEGIES:
+        raise DagsterInvariantViolationError(
+            'No serialization strategy named {name} has been registered. Registered strategies '
+            'are: {names}.'.format(name=name, names=', '.join(sorted(_SERIALIZATION_STRATEGIES)))
+        )
+    return _SERIALIZATION_STRATEGIES[name]
+
+
+def resolve_serialization_strategy(serialization_strategy_name, serialization_strategy):
+    '''Resolve the strategy with which to read an object, given the name of the strategy recorded
+    when it was written, if any.
+
+    Objects for which no strategy was recorded were written before strategies were recorded, using
+    the strategy of their type, which is passed as ``serialization_strategy``.
+    '''
+    check.opt_str_param(serialization_strategy_name, 'serialization_strategy_name')
+    check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
+
+    if (
+        serialization_strategy_name is None
+        or serialization_strategy_name == serialization_strategy.name
+    ):
+        return serialization_strategy
+
+    return get_serialization_strategy(serialization_strategy_name)
+
+
+register_serialization_strategy(PickleSerializationStrategy())
+register_serialization_strategy(
+    PickleSerializationStrategy('pickle_highest_protocol', protocol=pickle.HIGHEST_PROTOCOL)
+)
+for _compression in COMPRESSION_MODULES:
+    register_serialization_strategy(CompressedPickleSerializationStrategy(compression=_compression))
+register_serialization_strategy(CompressedPickleSerializationStrategy(), name='pickle_compressed')
+register_serialization_strategy(NumpySerializationStrategy())
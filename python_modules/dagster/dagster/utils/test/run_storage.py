@@ -1,6 +1,7 @@
 import pytest
 
 from dagster.core.definitions.pipeline import PipelineRunsFilter
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.utils import make_new_run_id
 
@@ -47,6 +48,19 @@ class TestRunStorage:
             status=status,
         )
 
+    @staticmethod
+    def build_pipeline_event(event_type, pipeline_name):
+        return DagsterEvent(
+            event_type_value=event_type.value,
+            pipeline_name=pipeline_name,
+            step_key=None,
+            solid_handle=None,
+            step_kind_value=None,
+            logging_tags=None,
+            event_specific_data=None,
+            message=None,
+        )
+
     def test_basic_storage(self, storage):
         assert storage
         run_id = make_new_run_id()
@@ -272,6 +286,71 @@ class TestRunStorage:
         some_runs = storage.get_runs(PipelineRunsFilter(tags={}))
         assert len(some_runs) == 3
 
+    def test_fetch_run_summaries(self, storage):
+        assert storage
+        one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name='some_pipeline',
+                tags={'mytag': 'hello'},
+                status=PipelineRunStatus.SUCCESS,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name='some_pipeline',
+                tags={'mytag': 'hello'},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        storage.add_run(TestRunStorage.build_run(run_id=three, pipeline_name='other_pipeline'))
+
+        summaries = storage.get_run_summaries()
+        assert [summary.run_id for summary in summaries] == [three, two, one]
+        assert [summary.run_id for summary in summaries] == [
+            run.run_id for run in storage.get_runs()
+        ]
+        assert summaries[0].pipeline_name == 'other_pipeline'
+        assert summaries[0].status == PipelineRunStatus.NOT_STARTED
+        assert summaries[1].status == PipelineRunStatus.FAILURE
+        assert summaries[1].is_finished
+
+        summaries = storage.get_run_summaries(
+            PipelineRunsFilter(tags={'mytag': 'hello'}, status=PipelineRunStatus.SUCCESS)
+        )
+        assert [summary.run_id for summary in summaries] == [one]
+
+        summaries = storage.get_run_summaries(
+            PipelineRunsFilter(pipeline_name='some_pipeline'), cursor=two, limit=1
+        )
+        assert [summary.run_id for summary in summaries] == [one]
+
+    def test_has_run(self, storage):
+        assert storage
+        run_id = make_new_run_id()
+        assert not storage.has_run(run_id)
+        storage.add_run(TestRunStorage.build_run(run_id=run_id, pipeline_name='some_pipeline'))
+        assert storage.has_run(run_id)
+        assert not storage.has_run(make_new_run_id())
+
+    def test_fetch_run_tags_sharing_values(self, storage):
+        assert storage
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name='some_pipeline',
+                tags={'mytag': 'hello', 'mytag2': 'hello'},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(), pipeline_name='some_pipeline', tags={'mytag': 'hello'}
+            )
+        )
+        assert storage.get_run_tags() == [('mytag', {'hello'}), ('mytag2', {'hello'})]
+
     def test_paginated_fetch(self, storage):
         assert storage
         one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
@@ -410,6 +489,34 @@ class TestRunStorage:
         assert len(cursor_four_limit_one) == 1
         assert cursor_four_limit_one[0].run_id == two
 
+    def test_handle_run_event_updates_status(self, storage):
+        assert storage
+        run_id = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=run_id, pipeline_name='some_pipeline', tags={'mytag': 'hello'}
+            )
+        )
+
+        storage.handle_run_event(
+            run_id,
+            TestRunStorage.build_pipeline_event(DagsterEventType.PIPELINE_START, 'some_pipeline'),
+        )
+        run = storage.get_run_by_id(run_id)
+        assert run.status == PipelineRunStatus.STARTED
+        assert run.tags == {'mytag': 'hello'}
+
+        storage.handle_run_event(
+            run_id,
+            TestRunStorage.build_pipeline_event(DagsterEventType.PIPELINE_SUCCESS, 'some_pipeline'),
+        )
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.SUCCESS
+        assert [run.status for run in storage.get_runs()] == [PipelineRunStatus.SUCCESS]
+        assert [
+            run.run_id
+            for run in storage.get_runs(PipelineRunsFilter(status=PipelineRunStatus.SUCCESS))
+        ] == [run_id]
+
     def test_delete(self, storage):
         assert storage
         run_id = make_new_run_id()
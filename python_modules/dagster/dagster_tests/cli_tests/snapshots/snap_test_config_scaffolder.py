@@ -11,6 +11,7 @@ snapshots['test_basic_solids_config 1'] = {
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -26,6 +27,8 @@ snapshots['test_basic_solids_config 1'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'persistent_workers': True,
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -59,7 +62,8 @@ snapshots['test_basic_solids_config 1'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'serialization_strategy': ''
             }
         },
         'in_memory': {
@@ -82,6 +86,7 @@ snapshots['test_two_modes 2'] = {
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -97,6 +102,8 @@ snapshots['test_two_modes 2'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'persistent_workers': True,
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -130,7 +137,8 @@ snapshots['test_two_modes 2'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'serialization_strategy': ''
             }
         },
         'in_memory': {
@@ -153,6 +161,7 @@ snapshots['test_two_modes 4'] = {
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -168,6 +177,8 @@ snapshots['test_two_modes 4'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'persistent_workers': True,
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -201,7 +212,8 @@ snapshots['test_two_modes 4'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'serialization_strategy': ''
             }
         },
         'in_memory': {
@@ -22,7 +22,7 @@ def test_0_6_4():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 'c7a6c4d7-6c88-46d0-8baa-d4937c3cefe5). Database is at revision None, head is '
-                '567bc23fd1ac. Please run `dagster instance migrate`.'
+                'c63a27054f08. Please run `dagster instance migrate`.'
             ),
         ):
             for run in runs:
@@ -49,7 +49,7 @@ def test_0_6_6_sqlite_exc():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 '89296095-892d-4a15-aa0d-9018d1580945). Database is at revision None, head is '
-                '567bc23fd1ac. Please run `dagster instance migrate`.'
+                'c63a27054f08. Please run `dagster instance migrate`.'
             ),
         ):
             instance._event_storage.get_logs_for_run('89296095-892d-4a15-aa0d-9018d1580945')
@@ -72,5 +72,12 @@ def test_0_6_6_sqlite_migrate():
 
         instance._event_storage.get_logs_for_run('89296095-892d-4a15-aa0d-9018d1580945')
 
+        # step keys of existing events are backfilled by the migration
+        step_logs = instance.get_logs_for_step(
+            '89296095-892d-4a15-aa0d-9018d1580945', 'raw_file_users.compute'
+        )
+        assert step_logs
+        assert all(record.event_step_key == 'raw_file_users.compute' for record in step_logs)
+
         assert not os.path.exists(file_relative_path(__file__, 'snapshot_0_6_6/sqlite/runs.db'))
         assert os.path.exists(file_relative_path(__file__, 'snapshot_0_6_6/sqlite/history/runs.db'))
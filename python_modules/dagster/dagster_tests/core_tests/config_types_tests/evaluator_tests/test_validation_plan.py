@@ -0,0 +1,173 @@
+import pytest
+
+from dagster import (
+    Enum,
+    EnumValue,
+    Field,
+    Int,
+    Noneable,
+    Permissive,
+    Selector,
+    Shape,
+    String,
+    check,
+)
+from dagster.config.field import resolve_to_config_type
+from dagster.config.post_process import post_process_config
+from dagster.config.stack import EvaluationStack
+from dagster.config.validate import _validate_config, process_config, validate_config
+from dagster.config.validation_context import ValidationContext
+from dagster.config.validation_plan import (
+    get_validation_plan,
+    process_with_plan,
+    validate_with_plan,
+)
+from dagster.core.instance.source_types import StringSource
+from dagster.utils import frozendict, frozenlist
+
+
+def _recursive_validate(config_type, config_value):
+    return _validate_config(
+        ValidationContext(
+            config_type=config_type, stack=EvaluationStack(config_type=config_type, entries=[]),
+        ),
+        config_value,
+    )
+
+
+def _recursive_process(config_type, config_value):
+    evr = _recursive_validate(config_type, config_value)
+    return post_process_config(config_type, evr.value) if evr.success else evr
+
+
+PartitionConfig = resolve_to_config_type(
+    Shape(
+        {
+            'partitions': [
+                {
+                    'date': String,
+                    'retries': Field(Int, is_required=False, default_value=3),
+                    'color': Field(
+                        Enum('Color', [EnumValue('red', python_value=1), EnumValue('blue')]),
+                        is_required=False,
+                        default_value='red',
+                    ),
+                    'source': Field(Noneable(Selector({'s3': {'bucket': String}, 'local': {}}))),
+                }
+            ],
+            'token': Field(StringSource, is_required=False),
+            'extra': Field(Permissive({'known': Field(Int, is_required=False)}), is_required=False),
+        }
+    )
+)
+
+
+def _partition_config(num_partitions):
+    return {
+        'partitions': [
+            {
+                'date': '2020-01-{i:02d}'.format(i=i % 28 + 1),
+                'color': 'blue' if i % 2 else 'red',
+                'source': {'s3': {'bucket': 'bucket'}} if i % 3 else {'local': None},
+            }
+            for i in range(num_partitions)
+        ],
+        'extra': {'unknown': [1, 2]},
+    }
+
+
+def test_plan_is_compiled_once():
+    assert get_validation_plan(PartitionConfig) is get_validation_plan(PartitionConfig)
+
+
+def test_plan_matches_recursive_validation():
+    config_value = _partition_config(1000)
+
+    plan_evr = validate_config(PartitionConfig, config_value)
+    assert plan_evr.success
+    assert plan_evr.value == _recursive_validate(PartitionConfig, config_value).value
+
+
+def test_plan_matches_recursive_processing():
+    config_value = _partition_config(1000)
+
+    plan_evr = process_with_plan(PartitionConfig, config_value)
+    assert plan_evr is not None
+    assert plan_evr.value == _recursive_process(PartitionConfig, config_value).value
+
+    value = plan_evr.value
+    assert isinstance(value, frozendict)
+    assert isinstance(value['partitions'], frozenlist)
+    assert value['partitions'][0] == {
+        'date': '2020-01-01',
+        'retries': 3,
+        'color': 1,
+        'source': {'local': {}},
+    }
+    assert value['partitions'][1]['color'] == 'blue'
+    assert value['extra'] == {'unknown': [1, 2]}
+
+
+def test_plan_processes_sources(monkeypatch):
+    monkeypatch.setenv('DAGSTER_PLAN_TEST_TOKEN', 'secret')
+    config_value = dict(_partition_config(2), token={'env': 'DAGSTER_PLAN_TEST_TOKEN'})
+
+    assert process_with_plan(PartitionConfig, config_value).value['token'] == 'secret'
+
+    # failed post processing is reported by the recursive path
+    monkeypatch.delenv('DAGSTER_PLAN_TEST_TOKEN')
+    assert process_with_plan(PartitionConfig, config_value) is None
+    assert not process_config(PartitionConfig, config_value).success
+
+
+@pytest.mark.parametrize(
+    'config_value',
+    [
+        None,
+        {},
+        {'partitions': None},
+        {'partitions': [{'date': 1, 'source': None}]},
+        {'partitions': [{'date': '2020-01-01'}]},
+        {'partitions': [{'date': '2020-01-01', 'source': None, 'color': 'green'}]},
+        {'partitions': [{'date': '2020-01-01', 'source': {'s3': {}, 'local': {}}}]},
+        {'partitions': [{'date': '2020-01-01', 'source': {'gcs': {}}}]},
+        {'partitions': [], 'unknown': 1},
+        {'partitions': [None]},
+    ],
+)
+def test_plan_defers_errors_to_recursive_path(config_value):
+    assert process_with_plan(PartitionConfig, config_value) is None
+
+    evr = process_config(PartitionConfig, config_value)
+    expected = _recursive_process(PartitionConfig, config_value)
+    assert not evr.success
+    assert [error.message for error in evr.errors] == [error.message for error in expected.errors]
+
+
+def test_plan_does_not_hide_its_own_errors(monkeypatch):
+    plan = get_validation_plan(PartitionConfig)
+
+    def _fail(_config_value):
+        check.failed('Bug in the validation plan')
+
+    monkeypatch.setattr(plan, 'validate', _fail)
+    monkeypatch.setattr(plan, 'process', _fail)
+
+    with pytest.raises(check.CheckError, match='Bug in the validation plan'):
+        validate_with_plan(PartitionConfig, _partition_config(1))
+
+    with pytest.raises(check.CheckError, match='Bug in the validation plan'):
+        process_with_plan(PartitionConfig, _partition_config(1))
+
+
+def test_errors_in_large_config():
+    config_value = _partition_config(1000)
+    config_value['partitions'][500]['date'] = 500
+
+    evr = validate_config(PartitionConfig, config_value)
+    assert not evr.success
+    assert len(evr.errors) == 1
+    assert evr.errors[0].message == (
+        'Invalid scalar at path root:partitions[500]:date value "500" of type '
+        '"<class \'int\'>" is not valid for expected type "String"'
+    )
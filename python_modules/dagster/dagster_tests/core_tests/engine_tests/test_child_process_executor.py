@@ -10,6 +10,8 @@ from dagster.core.engine.child_process_executor import (
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
     execute_child_process_command,
 )
 
@@ -43,6 +45,20 @@ class LongRunningCommand(ChildProcessCommand):  # pylint: disable=no-init
         yield 1
 
 
+class CountingWorkerCommand(ChildProcessWorkerCommand):  # pylint: disable=no-init
+    def __init__(self):
+        self.count = 0
+
+    def execute_task(self, task):
+        if task == 'crash':
+            os._exit(1)  # pylint: disable=protected-access
+        if task == 'error':
+            raise AnError('Oh noes!')
+
+        self.count += 1
+        yield (task, self.count)
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
@@ -87,3 +103,49 @@ def test_child_process_crashy_process():
 @pytest.mark.skip('too long')
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
+
+
+def test_child_process_worker():
+    worker = ChildProcessWorker(CountingWorkerCommand())
+    try:
+        events = list(filter(lambda x: x, worker.execute_task('a')))
+        assert len(events) == 3
+        assert isinstance(events[0], ChildProcessStartEvent)
+        assert events[0].pid == worker.pid
+        assert events[0].pid != os.getpid()
+        assert events[1] == ('a', 1)
+        assert isinstance(events[2], ChildProcessDoneEvent)
+
+        # state is retained by the worker between tasks
+        events = list(
+            filter(lambda x: x and not isinstance(x, ChildProcessEvent), worker.execute_task('b'))
+        )
+        assert events == [('b', 2)]
+
+        # errors are reported without stopping the worker
+        errors = list(
+            filter(
+                lambda x: x and isinstance(x, ChildProcessSystemErrorEvent),
+                worker.execute_task('error'),
+            )
+        )
+        assert len(errors) == 1
+        assert 'AnError' in str(errors[0].error_info.message)
+        assert worker.is_alive
+
+        events = list(
+            filter(lambda x: x and not isinstance(x, ChildProcessEvent), worker.execute_task('c'))
+        )
+        assert events == [('c', 3)]
+    finally:
+        worker.stop()
+
+    assert not worker.is_alive
+
+
+def test_child_process_worker_crash():
+    worker = ChildProcessWorker(CountingWorkerCommand())
+    with pytest.raises(ChildProcessCrashException):
+        list(worker.execute_task('crash'))
+    assert not worker.is_alive
+    worker.stop()
@@ -1,6 +1,9 @@
 import os
+import re
 import time
 
+import mock
+
 from dagster import (
     ExecutionTargetHandle,
     Field,
@@ -16,7 +19,10 @@ from dagster import (
     seven,
     solid,
 )
+from dagster.core.engine.child_process_executor import ChildProcessSystemErrorEvent
+from dagster.core.engine.engine_multiprocess import _handle_child_process_events
 from dagster.core.instance import DagsterInstance
+from dagster.utils.error import SerializableErrorInfo
 
 
 def test_diamond_simple_execution():
@@ -51,6 +57,63 @@ def test_diamond_multi_execution():
     # assert len(set(pids_by_solid.values())) == len(pipeline.solids)
 
 
+def test_diamond_multi_execution_persistent_workers():
+    pipe = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_diamond_pipeline'
+    ).build_pipeline_definition()
+    result = execute_pipeline(
+        pipe,
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'persistent_workers': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+
+    assert result.result_for_solid('adder').output_value() == 11
+
+    # steps are executed by at most as many workers as may execute steps concurrently
+    worker_pids = set(
+        re.match(r'Executing .* in worker process \(pid: (\d+)\)', event.message).group(1)
+        for event in result.event_list
+        if event.is_engine_event and 'in worker process' in event.message
+    )
+    assert 1 <= len(worker_pids) <= 2
+    assert str(os.getpid()) not in worker_pids
+
+
+def test_error_pipeline_multiprocess_persistent_workers():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_error_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'persistent_workers': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert not result.success
+
+
+def test_child_process_errors_are_kept_per_step():
+    # a persistent worker reports the system errors of every step it executes under one pid
+    errors = {}
+    for step_key in ['first.compute', 'second.compute']:
+        step_context = mock.MagicMock()
+        step_context.step.key = step_key
+        child_process_events = [
+            ChildProcessSystemErrorEvent(
+                pid=1234, error_info=SerializableErrorInfo(step_key, [], 'Exception')
+            )
+        ]
+        list(_handle_child_process_events(step_context, child_process_events, errors, {}))
+
+    assert {key: err.message for key, err in errors.items()} == {
+        (1234, 'first.compute'): 'first.compute',
+        (1234, 'second.compute'): 'second.compute',
+    }
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -4,6 +4,7 @@ from dagster import check, pipeline, solid
 from dagster.core.errors import DagsterInvalidConfigError
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.utils import toposort
 
 from ..engine_tests.test_multiprocessing import define_diamond_pipeline
 
@@ -20,6 +21,54 @@ def test_topological_sort():
     assert [step.key for step in levels[2]] == ['adder.compute']
 
 
+def test_subset_plan_topology():
+    plan = create_execution_plan(define_diamond_pipeline())
+    assert plan.topological_step_levels() is not plan.topological_step_levels()
+
+    subset_plan = plan.build_subset_plan(['adder.compute', 'return_two.compute'])
+    assert subset_plan.topology.step_graph is plan.topology.step_graph
+    assert [step.key for step in subset_plan.topological_steps()] == [
+        step.key for step in plan.topological_steps()
+    ]
+
+    # only dependencies on other steps to execute are considered
+    assert subset_plan.execution_deps() == {'adder.compute': set(), 'return_two.compute': set()}
+    assert [[step.key for step in level] for level in subset_plan.execution_step_levels()] == [
+        ['adder.compute', 'return_two.compute']
+    ]
+
+    subset_plan = plan.build_subset_plan(
+        ['adder.compute', 'add_three.compute', 'return_two.compute']
+    )
+    assert [
+        [step.key for step in level] for level in subset_plan.execution_step_levels()
+    ] == toposort(subset_plan.execution_deps())
+    assert subset_plan.execution_downstream_deps() == {
+        'adder.compute': set(),
+        'add_three.compute': {'adder.compute'},
+        'return_two.compute': {'add_three.compute'},
+    }
+
+    # callers are free to modify the views they are returned
+    subset_plan.execution_deps()['adder.compute'].add('mult_three.compute')
+    assert subset_plan.execution_deps()['adder.compute'] == {'add_three.compute'}
+
+
+def test_plan_topology_is_not_a_field():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    # plans with the same fields are equal, whatever has been computed for them
+    plan.execution_step_levels()
+    assert plan == plan.build_subset_plan(plan.step_keys_to_execute)
+
+    # plans made with _replace are executed according to their own steps to execute
+    replaced_plan = plan._replace(step_keys_to_execute=['adder.compute', 'return_two.compute'])
+    assert replaced_plan.execution_deps() == {'adder.compute': set(), 'return_two.compute': set()}
+    assert [[step.key for step in level] for level in replaced_plan.execution_step_levels()] == [
+        ['adder.compute', 'return_two.compute']
+    ]
+
+
 def test_create_execution_plan_with_bad_inputs():
     with pytest.raises(DagsterInvalidConfigError):
         create_execution_plan(
@@ -286,3 +335,80 @@ def test_priorities():
     assert steps[3].key == 'pri_2.compute'
     assert steps[4].key == 'pri_none.compute'
     assert steps[5].key == 'pri_neg_1.compute'
+
+
+def test_fan_out_active_execution():
+    @solid
+    def root(_):
+        return 1
+
+    @solid
+    def branch(_, num):
+        return num
+
+    @pipeline
+    def fan_out():
+        root_output = root()
+        for i in range(20):
+            branch.alias('branch_{i}'.format(i=i))(root_output)
+
+    plan = create_execution_plan(fan_out)
+    active_execution = plan.start(retries=Retries(RetryMode.DISABLED))
+
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['root.compute']
+    active_execution.mark_success('root.compute')
+
+    # steps that become executable together are vended in plan order, respecting the limit
+    branch_keys = [step.key for step in plan.topological_steps()][1:]
+    steps = active_execution.get_steps_to_execute(limit=5)
+    assert [step.key for step in steps] == branch_keys[:5]
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == branch_keys[5:]
+
+    for key in branch_keys:
+        active_execution.mark_success(key)
+
+    assert active_execution.is_complete
+
+
+def test_fan_out_skip_active_execution():
+    @solid
+    def root(_):
+        return 1
+
+    @solid
+    def branch(_, num):
+        return num
+
+    @solid
+    def leaf(_, num):
+        return num
+
+    @pipeline
+    def fan_out():
+        root_output = root()
+        for i in range(10):
+            leaf.alias('leaf_{i}'.format(i=i))(branch.alias('branch_{i}'.format(i=i))(root_output))
+
+    plan = create_execution_plan(fan_out)
+    active_execution = plan.start(retries=Retries(RetryMode.DISABLED))
+
+    active_execution.get_steps_to_execute()
+    active_execution.mark_failed('root.compute')
+
+    assert active_execution.get_steps_to_execute() == []
+    steps = active_execution.get_steps_to_skip()
+    assert len(steps) == 10
+    for step in steps:
+        active_execution.mark_skipped(step.key)
+
+    steps = active_execution.get_steps_to_skip()
+    assert sorted(step.key for step in steps) == sorted(
+        'leaf_{i}.compute'.format(i=i) for i in range(10)
+    )
+    for step in steps:
+        active_execution.mark_skipped(step.key)
+
+    assert active_execution.get_steps_to_skip() == []
+    assert active_execution.is_complete
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from dagster import (
@@ -101,6 +103,51 @@ def test_execution_plan_reexecution():
     assert get_step_output_event(step_events, 'add_two.compute')
 
 
+def test_execution_plan_reexecution_links_intermediates():
+    pipeline_def = define_addy_pipeline()
+    instance = DagsterInstance.ephemeral()
+    environment_dict = env_with_fs({'solids': {'add_one': {'inputs': {'num': {'value': 3}}}}})
+    result = execute_pipeline(pipeline_def, environment_dict=environment_dict, instance=instance)
+    assert result.success
+
+    new_run_id = make_new_run_id()
+    pipeline_run = PipelineRun(
+        pipeline_name=pipeline_def.name,
+        run_id=new_run_id,
+        environment_dict=environment_dict,
+        mode='default',
+        previous_run_id=result.run_id,
+    )
+    execution_plan = create_execution_plan(
+        pipeline_def, environment_dict=environment_dict, run_config=pipeline_run
+    )
+    step_events = execute_plan(
+        execution_plan.build_subset_plan(['add_two.compute', 'add_three.compute']),
+        environment_dict=environment_dict,
+        pipeline_run=pipeline_run,
+        instance=instance,
+    )
+    assert get_step_output_event(step_events, 'add_three.compute')
+
+    old_store = build_fs_intermediate_store(instance.intermediates_directory, result.run_id)
+    new_store = build_fs_intermediate_store(instance.intermediates_directory, new_run_id)
+
+    def path_for(store, step_key):
+        return store.key_for_paths(store.paths_for_intermediate(step_key, 'result'))
+
+    # intermediates copied from the previous run share its data on disk
+    assert os.path.samefile(
+        path_for(old_store, 'add_one.compute'), path_for(new_store, 'add_one.compute')
+    )
+
+    # whereas re-executed steps write new intermediates, leaving those of the previous run intact
+    assert not os.path.samefile(
+        path_for(old_store, 'add_two.compute'), path_for(new_store, 'add_two.compute')
+    )
+    assert old_store.get_intermediate(None, 'add_two.compute', Int).obj == 6
+    assert new_store.get_intermediate(None, 'add_two.compute', Int).obj == 6
+
+
 def test_execution_plan_wrong_run_id():
     pipeline_def = define_addy_pipeline()
 
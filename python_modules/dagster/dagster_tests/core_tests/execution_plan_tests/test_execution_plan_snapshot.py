@@ -0,0 +1,200 @@
+import os
+from enum import Enum as PythonEnum
+
+import pytest
+
+from dagster import (
+    DagsterType,
+    Enum,
+    InputDefinition,
+    Int,
+    composite_solid,
+    input_hydration_config,
+    lambda_solid,
+    pipeline,
+)
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.plan.snapshot import ExecutionPlanSnapshot, pipeline_fingerprint
+from dagster.core.instance import DagsterInstance
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.utils import make_new_run_id
+
+from .test_execution_plan_composite import composite_pipeline
+
+
+def define_config_input_pipeline(multiplier=3):
+    @lambda_solid(input_defs=[InputDefinition('num', Int)])
+    def add_one(num):
+        return num + 1
+
+    @lambda_solid(input_defs=[InputDefinition('num', Int)])
+    def multiply(num):
+        return num * multiplier
+
+    @pipeline
+    def config_input_pipeline():
+        multiply(add_one())
+
+    return config_input_pipeline
+
+
+CONFIG_INPUT_ENVIRONMENT = {
+    'solids': {
+        'add_one': {'inputs': {'num': {'value': 2}}},
+        'multiply': {'outputs': [{'result': {'json': {'path': os.devnull}}}]},
+    }
+}
+
+
+def _roundtrip(snapshot):
+    return deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(snapshot))
+
+
+def test_snapshot_rebuilds_steps_to_execute():
+    pipeline_def = define_config_input_pipeline()
+    execution_plan = create_execution_plan(pipeline_def, CONFIG_INPUT_ENVIRONMENT)
+
+    snapshot = _roundtrip(
+        ExecutionPlanSnapshot.from_execution_plan(
+            execution_plan.build_subset_plan(['multiply.compute'])
+        )
+    )
+    assert [step_snap.key for step_snap in snapshot.steps] == [
+        'add_one.compute',
+        'multiply.compute',
+    ]
+
+    rebuilt_plan = snapshot.rebuild_execution_plan(pipeline_def, CONFIG_INPUT_ENVIRONMENT)
+    assert rebuilt_plan.step_keys_to_execute == ['multiply.compute']
+    assert rebuilt_plan.deps == {'add_one.compute': set(), 'multiply.compute': {'add_one.compute'}}
+
+    for step in rebuilt_plan.steps:
+        original_step = execution_plan.get_step_by_key(step.key)
+        assert step.solid_handle == original_step.solid_handle
+        assert step.tags == original_step.tags
+        assert step.step_inputs == original_step.step_inputs
+        assert step.step_outputs == original_step.step_outputs
+
+    add_one_input = rebuilt_plan.get_step_by_key('add_one.compute').step_input_named('num')
+    assert add_one_input.config_data == {'value': 2}
+    assert rebuilt_plan.get_step_by_key('multiply.compute').step_outputs[0].should_materialize
+
+
+def test_execute_rebuilt_composite_plan():
+    environment_dict = {
+        'solids': {
+            'composite_with_nested_config_solid': {
+                'solids': {'node_a': {'config': {'foo': 'baz'}}, 'node_b': {'config': {'bar': 3}}}
+            }
+        }
+    }
+    execution_plan = create_execution_plan(composite_pipeline, environment_dict=environment_dict)
+    snapshot = _roundtrip(ExecutionPlanSnapshot.from_execution_plan(execution_plan))
+    rebuilt_plan = snapshot.rebuild_execution_plan(composite_pipeline, environment_dict)
+
+    assert [step.key for step in rebuilt_plan.topological_steps()] == [
+        step.key for step in execution_plan.topological_steps()
+    ]
+
+    pipeline_run = PipelineRun.create_empty_run(composite_pipeline.name, make_new_run_id())
+    events = execute_plan(
+        rebuilt_plan,
+        environment_dict=environment_dict,
+        pipeline_run=pipeline_run,
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert [event.step_key for event in events if event.is_step_success] == [
+        'composite_with_nested_config_solid.node_a.compute',
+        'composite_with_nested_config_solid.node_b.compute',
+    ]
+
+
+class Color(PythonEnum):
+    RED = 1
+    BLUE = 2
+
+
+@input_hydration_config(Enum.from_python_enum(Color))
+def _color_input_hydration_config(_context, color):
+    return color
+
+
+ColorType = DagsterType(
+    name='ColorType',
+    type_check_fn=lambda _, value: isinstance(value, Color),
+    input_hydration_config=_color_input_hydration_config,
+)
+
+
+@lambda_solid(input_defs=[InputDefinition('color', ColorType)])
+def color_name(color):
+    return color.name
+
+
+@composite_solid(input_defs=[InputDefinition('color', ColorType)])
+def composite_color_name(color):
+    return color_name(color)
+
+
+@pipeline
+def color_pipeline():
+    color_name()
+    composite_color_name()
+
+
+def test_snapshot_processes_input_config_when_rebuilt():
+    environment_dict = {
+        'solids': {
+            'color_name': {'inputs': {'color': 'RED'}},
+            'composite_color_name': {'inputs': {'color': 'BLUE'}},
+        }
+    }
+    execution_plan = create_execution_plan(color_pipeline, environment_dict)
+
+    # the processed config of the inputs, python enums, is not part of the snapshot
+    snapshot = _roundtrip(ExecutionPlanSnapshot.from_execution_plan(execution_plan))
+    rebuilt_plan = snapshot.rebuild_execution_plan(color_pipeline, environment_dict)
+
+    for step in execution_plan.steps:
+        assert rebuilt_plan.get_step_by_key(step.key).step_inputs == step.step_inputs
+
+    def _config_data(step_key):
+        return rebuilt_plan.get_step_by_key(step_key).step_input_named('color').config_data
+
+    assert _config_data('color_name.compute') == Color.RED
+    # mapped from the input of the composite solid
+    assert _config_data('composite_color_name.color_name.compute') == Color.BLUE
+
+    pipeline_run = PipelineRun.create_empty_run(color_pipeline.name, make_new_run_id())
+    events = execute_plan(
+        rebuilt_plan,
+        environment_dict=environment_dict,
+        pipeline_run=pipeline_run,
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert len([event for event in events if event.is_step_success]) == 2
+
+
+def test_snapshot_checks_pipeline_fingerprint():
+    pipeline_def = define_config_input_pipeline()
+    assert pipeline_fingerprint(pipeline_def) == pipeline_fingerprint(
+        define_config_input_pipeline(multiplier=4)
+    )
+
+    snapshot = ExecutionPlanSnapshot.from_execution_plan(
+        create_execution_plan(pipeline_def, CONFIG_INPUT_ENVIRONMENT)
+    )
+
+    @lambda_solid(input_defs=[InputDefinition('num', Int)])
+    def add_one(num):
+        return num + 1
+
+    @pipeline(name='config_input_pipeline')
+    def changed_pipeline():
+        add_one()
+
+    assert pipeline_fingerprint(changed_pipeline) != pipeline_fingerprint(pipeline_def)
+    with pytest.raises(DagsterInvariantViolationError, match='does not match the definition'):
+        snapshot.rebuild_execution_plan(changed_pipeline, CONFIG_INPUT_ENVIRONMENT)
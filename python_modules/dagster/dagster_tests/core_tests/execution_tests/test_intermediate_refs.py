@@ -0,0 +1,166 @@
+import os
+
+from dagster import (
+    DagsterEventType,
+    ExecutionTargetHandle,
+    InputDefinition,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.object_store import ObjectStoreOperationType
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(input_defs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    @pipeline
+    def diamond_pipeline():
+        two = return_two()
+        adder(left=add_three(two), right=mult_three(two))
+
+    return diamond_pipeline
+
+
+def define_failing_consumer_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(input_defs=[InputDefinition('_num')])
+    def throw_error(_num):
+        raise Exception('bad programmer')
+
+    @pipeline
+    def failing_consumer_pipeline():
+        two = return_two()
+        add_three(two)
+        throw_error(two)
+
+    return failing_consumer_pipeline
+
+
+def removed_intermediates(result):
+    return {
+        event.step_key: event.event_specific_data.metadata_entries[0].entry_data.path
+        for event in result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.event_specific_data.op == ObjectStoreOperationType.RM_OBJECT.value
+    }
+
+
+def test_release_intermediates_in_memory():
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={'execution': {'in_process': {'config': {'release_intermediates': True}}}},
+        instance=instance,
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    released = [
+        record.step_key
+        for record in instance.all_logs(result.run_id)
+        if record.user_message.startswith('Released intermediate')
+    ]
+    assert sorted(released) == ['add_three.compute', 'mult_three.compute', 'return_two.compute']
+
+
+def test_release_intermediates_filesystem():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'in_process': {'config': {'release_intermediates': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    removed = removed_intermediates(result)
+    assert set(removed.keys()) == {'add_three.compute', 'mult_three.compute', 'return_two.compute'}
+    for path in removed.values():
+        assert not os.path.exists(path)
+
+
+def test_intermediates_kept_by_default():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={'storage': {'filesystem': {}}},
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert not removed_intermediates(result)
+    assert result.result_for_solid('return_two').output_value() == 2
+
+
+def test_intermediates_kept_for_failed_consumer():
+    result = execute_pipeline(
+        define_failing_consumer_pipeline(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'in_process': {'config': {'release_intermediates': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+        raise_on_error=False,
+    )
+    assert not result.success
+    assert not removed_intermediates(result)
+    assert result.result_for_solid('return_two').output_value() == 2
+
+
+def test_intermediates_kept_for_materialized_output():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'in_process': {'config': {'release_intermediates': True}}},
+            'solids': {'return_two': {'outputs': [{'result': {'json': {'path': os.devnull}}}]}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert set(removed_intermediates(result).keys()) == {'add_three.compute', 'mult_three.compute'}
+    assert result.result_for_solid('return_two').output_value() == 2
+
+
+def test_release_intermediates_multiprocess():
+    pipe = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_diamond_pipeline'
+    ).build_pipeline_definition()
+    result = execute_pipeline(
+        pipe,
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'release_intermediates': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    removed = removed_intermediates(result)
+    assert set(removed.keys()) == {'add_three.compute', 'mult_three.compute', 'return_two.compute'}
+    for path in removed.values():
+        assert not os.path.exists(path)
@@ -1,9 +1,95 @@
-from dagster.core.types.marshal import PickleSerializationStrategy
+import csv
+import io
+import pickle
+import tempfile
+import zlib
+
+import pytest
+
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.types import marshal
+from dagster.core.types.marshal import (
+    CompressedPickleSerializationStrategy,
+    PickleSerializationStrategy,
+    SerializationStrategy,
+    get_serialization_strategy,
+    resolve_serialization_strategy,
+)
 from dagster.utils import safe_tempfile_path
 
 
+class CsvSerializationStrategy(SerializationStrategy):
+    def __init__(self):
+        super(CsvSerializationStrategy, self).__init__('csv', read_mode='r', write_mode='w')
+
+    def serialize(self, value, write_file_obj):
+        writer = csv.DictWriter(write_file_obj, ['name', 'value'])
+        writer.writeheader()
+        writer.writerows(value)
+
+    def deserialize(self, read_file_obj):
+        return [dict(row) for row in csv.DictReader(read_file_obj)]
+
+
 def test_serialization_strategy():
     serialization_strategy = PickleSerializationStrategy()
     with safe_tempfile_path() as tempfile_path:
         serialization_strategy.serialize_to_file('foo', tempfile_path)
         assert serialization_strategy.deserialize_from_file(tempfile_path) == 'foo'
+
+
+def test_serialization_strategy_streams():
+    serialization_strategy = PickleSerializationStrategy()
+    value = {'foo': list(range(10000))}
+    with tempfile.SpooledTemporaryFile(max_size=1024) as stream:
+        serialization_strategy.serialize_to_stream(value, stream)
+        stream.seek(0)
+        assert serialization_strategy.deserialize_from_stream(stream) == value
+
+
+def test_text_serialization_strategy_streams():
+    serialization_strategy = CsvSerializationStrategy()
+    value = [{'name': u'café', 'value': str(i)} for i in range(1000)]
+    with tempfile.SpooledTemporaryFile(max_size=1024) as stream:
+        serialization_strategy.serialize_to_stream(value, stream)
+        stream.seek(0)
+        assert stream.read(len('name,value')) == b'name,value'
+        stream.seek(0)
+        assert serialization_strategy.deserialize_from_stream(stream) == value
+
+
+def test_compressed_pickle_serialization_strategy():
+    serialization_strategy = CompressedPickleSerializationStrategy(compression='zlib')
+    assert serialization_strategy.name == 'pickle_zlib'
+
+    value = {'foo': list(range(10000)), 'bar': 'baz' * 10000}
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(value, tempfile_path)
+        with open(tempfile_path, 'rb') as ff:
+            assert pickle.loads(zlib.decompress(ff.read())) == value
+        assert serialization_strategy.deserialize_from_file(tempfile_path) == value
+
+
+def test_compressed_pickle_serialization_strategy_missing_codec(monkeypatch):
+    def _import_module(name):
+        raise ImportError('No module named {name}'.format(name=name))
+
+    monkeypatch.setattr(marshal.importlib, 'import_module', _import_module)
+
+    serialization_strategy = CompressedPickleSerializationStrategy(compression='zstd')
+    with pytest.raises(DagsterInvariantViolationError, match='Could not import zstandard'):
+        serialization_strategy.serialize_to_stream('foo', io.BytesIO())
+
+
+def test_resolve_serialization_strategy():
+    serialization_strategy = CsvSerializationStrategy()
+
+    assert resolve_serialization_strategy(None, serialization_strategy) is serialization_strategy
+    assert resolve_serialization_strategy('csv', serialization_strategy) is serialization_strategy
+    assert resolve_serialization_strategy('pickle_zlib', serialization_strategy).name == (
+        'pickle_zlib'
+    )
+    assert get_serialization_strategy('pickle_compressed').name.startswith('pickle_')
+
+    with pytest.raises(DagsterInvariantViolationError, match='No serialization strategy named'):
+        resolve_serialization_strategy('unregistered', serialization_strategy)
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from dagster import seven
+from dagster.core.storage import local_compute_log_manager
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster.utils import ensure_file, touch_file
+
+
+def _wait_for(predicate, timeout=5.0):
+    start = time.time()
+    while not predicate() and time.time() - start < timeout:
+        time.sleep(0.05)
+
+
+def _append(path, data):
+    with open(path, 'a') as log_file:
+        log_file.write(data)
+
+
+def _subscribe(manager, run_id, step_key, io_type):
+    updates = []
+    completed = []
+    manager.observable(run_id, step_key, io_type).subscribe(
+        on_next=updates.append, on_completed=lambda: completed.append(True)
+    )
+    return updates, completed
+
+
+def _use_polling(monkeypatch):
+    class _UnavailableObserver(object):
+        def __init__(self):
+            raise OSError('inotify watch limit reached')
+
+    monkeypatch.setattr(local_compute_log_manager, 'Observer', _UnavailableObserver)
+    monkeypatch.setattr(local_compute_log_manager, 'WATCH_POLLING_INTERVAL', 0.05)
+
+
+@pytest.mark.parametrize('polling', [False, True])
+def test_compute_log_subscription(monkeypatch, polling):
+    if polling:
+        _use_polling(monkeypatch)
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        manager = LocalComputeLogManager(tmpdir_path)
+        try:
+            path = manager.get_local_path('run_id', 'step.compute', ComputeIOType.STDOUT)
+            ensure_file(path)
+            _append(path, 'before\n')
+
+            updates, completed = _subscribe(manager, 'run_id', 'step.compute', ComputeIOType.STDOUT)
+            other_updates, _ = _subscribe(manager, 'run_id', 'step.compute', ComputeIOType.STDOUT)
+            assert (
+                manager._subscription_manager.is_polling  # pylint: disable=protected-access
+                == polling
+            )
+
+            for i in range(10):
+                _append(path, 'line {i}\n'.format(i=i))
+            # the subscriptions are notified independently, so wait for each of them
+            _wait_for(
+                lambda: all(
+                    subscription_updates
+                    and subscription_updates[-1].cursor == len('before\n') + 10 * 7
+                    for subscription_updates in (updates, other_updates)
+                )
+            )
+
+            # each update is read from the cursor at which the previous one stopped
+            expected = 'before\n' + ''.join('line {i}\n'.format(i=i) for i in range(10))
+            assert ''.join(update.data for update in updates) == expected
+            assert ''.join(update.data for update in other_updates) == expected
+            assert not completed
+
+            # output written before the step completes is delivered before completion
+            _append(path, 'after\n')
+            touch_file(manager.complete_artifact_path('run_id', 'step.compute'))
+            _wait_for(lambda: completed)
+
+            assert completed
+            assert ''.join(update.data for update in updates) == expected + 'after\n'
+        finally:
+            manager.dispose()
+
+
+def test_compute_log_subscription_to_completed_step():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        manager = LocalComputeLogManager(tmpdir_path)
+        try:
+            path = manager.get_local_path('run_id', 'step.compute', ComputeIOType.STDERR)
+            ensure_file(path)
+            _append(path, 'done\n')
+            touch_file(manager.complete_artifact_path('run_id', 'step.compute'))
+
+            updates, completed = _subscribe(manager, 'run_id', 'step.compute', ComputeIOType.STDERR)
+            assert completed
+            assert [update.data for update in updates] == ['done\n']
+
+            # the step is no longer watched once its subscriptions are complete
+            subscription_manager = manager._subscription_manager  # pylint: disable=protected-access
+            _wait_for(lambda: not subscription_manager._subscriptions)
+            assert not subscription_manager._subscriptions
+        finally:
+            manager.dispose()
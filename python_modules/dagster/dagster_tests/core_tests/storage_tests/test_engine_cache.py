@@ -0,0 +1,66 @@
+import os
+
+from dagster import seven
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.sql import EngineCache
+
+
+def _conn_string(tmpdir_path, name):
+    return 'sqlite:///{}'.format(os.path.join(tmpdir_path, name))
+
+
+def test_engine_cache_reuses_engines():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        inits = []
+        cache = EngineCache()
+        engine = cache.get_engine(_conn_string(tmpdir_path, 'foo.db'), init_fn=inits.append)
+        assert cache.get_engine(_conn_string(tmpdir_path, 'foo.db'), init_fn=inits.append) is engine
+        assert inits == [engine]
+
+        cache.dispose()
+        assert cache.get_engine(_conn_string(tmpdir_path, 'foo.db')) is not engine
+
+
+def test_engine_cache_evicts_least_recently_used():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        cache = EngineCache(max_engines=2)
+        foo = cache.get_engine(_conn_string(tmpdir_path, 'foo.db'))
+        bar = cache.get_engine(_conn_string(tmpdir_path, 'bar.db'))
+        assert cache.get_engine(_conn_string(tmpdir_path, 'foo.db')) is foo
+
+        cache.get_engine(_conn_string(tmpdir_path, 'baz.db'))
+        assert cache.get_engine(_conn_string(tmpdir_path, 'foo.db')) is foo
+        assert cache.get_engine(_conn_string(tmpdir_path, 'bar.db')) is not bar
+
+
+def test_engine_cache_does_not_share_engines_across_fork():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        cache = EngineCache()
+        engine = cache.get_engine(_conn_string(tmpdir_path, 'foo.db'))
+
+        # simulate having been inherited by a forked child process
+        cache._pid = -1  # pylint: disable=protected-access
+        assert cache.get_engine(_conn_string(tmpdir_path, 'foo.db')) is not engine
+
+
+def test_connection_pool_instance_config():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        pool_config = {'size': 2, 'max_overflow': 0, 'recycle': 3600, 'pre_ping': True}
+        instance = DagsterInstance.local_temp(
+            tmpdir_path,
+            overrides={
+                'run_storage': {
+                    'module': 'dagster.core.storage.runs',
+                    'class': 'SqliteRunStorage',
+                    'config': {'base_dir': tmpdir_path, 'connection_pool': pool_config},
+                },
+                'event_log_storage': {
+                    'module': 'dagster.core.storage.event_log',
+                    'class': 'SqliteEventLogStorage',
+                    'config': {'base_dir': tmpdir_path, 'connection_pool': pool_config},
+                },
+            },
+        )
+        assert instance.get_runs() == []
+        assert instance.all_logs('foo') == []
+        instance.dispose()
@@ -1,5 +1,6 @@
 import multiprocessing
 import os
+import subprocess
 import sys
 import time
 import traceback
@@ -19,6 +20,7 @@ from dagster.core.storage.event_log import (
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster.core.storage.event_log.sqlite import sqlite_event_log
 from dagster.core.storage.sql import create_engine
 
 
@@ -33,9 +35,25 @@ def create_sqlite_run_event_logstorage():
         yield SqliteEventLogStorage(tmpdir_path)
 
 
+@contextmanager
+def create_buffered_sqlite_run_event_logstorage():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(
+            tmpdir_path, event_buffer_size=10, event_buffer_flush_interval=0.1
+        )
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+
+
 event_storage_test = pytest.mark.parametrize(
     'event_storage_factory_cm_fn',
-    [create_in_memory_event_log_storage, create_sqlite_run_event_logstorage],
+    [
+        create_in_memory_event_log_storage,
+        create_sqlite_run_event_logstorage,
+        create_buffered_sqlite_run_event_logstorage,
+    ],
 )
 
 
@@ -163,6 +181,83 @@ def test_event_log_storage_watch(event_storage_factory_cm_fn):
         assert len(watched) == 3
 
 
+def _wait_for(predicate, timeout=5.0):
+    start = time.time()
+    while not predicate() and time.time() - start < timeout:
+        time.sleep(0.05)
+
+
+def test_sqlite_event_log_storage_watch_coalesces_queries():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        queries = []
+        get_logs_for_run = storage.get_logs_for_run
+
+        def _get_logs_for_run(run_id, cursor=-1, limit=None):
+            queries.append((run_id, cursor))
+            return get_logs_for_run(run_id, cursor, limit)
+
+        storage.get_logs_for_run = _get_logs_for_run
+
+        try:
+            storage.store_event(_engine_event('foo', 'Message0'))
+            storage.store_event(_engine_event('bar', 'Other0'))
+
+            watched_one = []
+            watched_two = []
+            watched_bar = []
+            storage.watch('foo', 0, watched_one.append)
+            storage.watch('foo', -1, watched_two.append)
+            storage.watch('bar', 0, watched_bar.append)
+
+            for i in range(1, 21):
+                storage.store_event(_engine_event('foo', 'Message{i}'.format(i=i)))
+            storage.store_event(_engine_event('bar', 'Other1'))
+
+            _wait_for(lambda: len(watched_two) == 21 and len(watched_bar) == 1)
+
+            assert [event.message for event in watched_one] == [
+                'Message{i}'.format(i=i) for i in range(1, 21)
+            ]
+            assert [event.message for event in watched_two] == [
+                'Message{i}'.format(i=i) for i in range(0, 21)
+            ]
+            assert [event.message for event in watched_bar] == ['Other1']
+
+            # subscribers to the same run share queries, and bursts of writes are debounced
+            assert len([query for query in queries if query[0] == 'foo']) < 20
+        finally:
+            storage.dispose()
+
+
+def test_sqlite_event_log_storage_watch_polling(monkeypatch):
+    class _UnavailableObserver(object):
+        def __init__(self):
+            raise OSError('inotify watch limit reached')
+
+    monkeypatch.setattr(sqlite_event_log, 'Observer', _UnavailableObserver)
+    monkeypatch.setattr(sqlite_event_log, 'WATCH_POLLING_INTERVAL', 0.05)
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        try:
+            watched = []
+            storage.watch('foo', -1, watched.append)
+            assert storage._watcher.is_polling  # pylint: disable=protected-access
+
+            storage.store_event(_engine_event('foo', 'Message1'))
+            storage.store_event(_engine_event('foo', 'Message2'))
+            _wait_for(lambda: len(watched) == 2)
+            assert [event.message for event in watched] == ['Message1', 'Message2']
+
+            storage.end_watch('foo', watched.append)
+            storage.store_event(_engine_event('foo', 'Message3'))
+            time.sleep(0.3)
+            assert len(watched) == 2
+        finally:
+            storage.dispose()
+
+
 @event_storage_test
 def test_event_log_storage_pagination(event_storage_factory_cm_fn):
     def evt(name):
@@ -191,6 +286,72 @@ def test_event_log_storage_pagination(event_storage_factory_cm_fn):
         assert len(storage.get_logs_for_run('foo', 1)) == 1
         assert len(storage.get_logs_for_run('foo', 2)) == 0
 
+        assert [record.message for record in storage.get_logs_for_run('foo', limit=2)] == [
+            'Message_0',
+            'Message_1',
+        ]
+        assert [record.message for record in storage.get_logs_for_run('foo', 0, limit=1)] == [
+            'Message_1'
+        ]
+        assert len(storage.get_logs_for_run('foo', 1, limit=5)) == 1
+
+        assert storage.get_logs_count_for_run('foo') == 3
+        assert storage.get_logs_count_for_run('bar') == 0
+
+
+@event_storage_test
+def test_event_log_storage_get_logs_for_step_and_type(event_storage_factory_cm_fn):
+    def evt(event_type, step_key, event_specific_data=None):
+        return DagsterEventRecord(
+            None,
+            'Message',
+            'debug',
+            '',
+            'foo',
+            time.time(),
+            dagster_event=DagsterEvent(
+                event_type.value,
+                'nonce',
+                step_key=step_key,
+                event_specific_data=event_specific_data,
+            ),
+        )
+
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_event(evt(DagsterEventType.STEP_START, 'a.compute'))
+        storage.store_event(evt(DagsterEventType.STEP_START, 'b.compute'))
+        storage.store_event(
+            evt(
+                DagsterEventType.STEP_SUCCESS,
+                'a.compute',
+                event_specific_data=StepSuccessData(duration_ms=100.0),
+            )
+        )
+        storage.store_event(_engine_event('foo'))
+
+        a_logs = storage.get_logs_for_step('foo', 'a.compute')
+        assert [record.dagster_event.event_type for record in a_logs] == [
+            DagsterEventType.STEP_START,
+            DagsterEventType.STEP_SUCCESS,
+        ]
+        assert len(storage.get_logs_for_step('foo', 'b.compute')) == 1
+        assert storage.get_logs_for_step('foo', 'c.compute') == []
+
+        start_logs = storage.get_logs_for_run_by_type('foo', [DagsterEventType.STEP_START])
+        assert [record.dagster_event.step_key for record in start_logs] == [
+            'a.compute',
+            'b.compute',
+        ]
+        assert (
+            len(
+                storage.get_logs_for_run_by_type(
+                    'foo', [DagsterEventType.STEP_SUCCESS, DagsterEventType.ENGINE_EVENT]
+                )
+            )
+            == 2
+        )
+        assert storage.get_logs_for_run_by_type('foo', [DagsterEventType.STEP_FAILURE]) == []
+
 
 @event_storage_test
 def test_event_log_delete(event_storage_factory_cm_fn):
@@ -227,6 +388,163 @@ def test_event_log_get_stats_without_start_and_success(event_storage_factory_cm_
         assert storage.get_stats_for_run('foo')
 
 
+def _engine_event(run_id, message='Message'):
+    return DagsterEventRecord(
+        None,
+        message,
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def _count_stored_events(storage, run_id):
+    # reads the backing database directly, bypassing any flush of the event buffer
+    with storage.connect(run_id) as conn:
+        return conn.execute(
+            sqlalchemy.select([sqlalchemy.func.count()]).select_from(SqlEventLogStorageTable)
+        ).scalar()
+
+
+def test_buffered_sqlite_event_log_storage_flushes_on_size():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(
+            tmpdir_path, event_buffer_size=3, event_buffer_flush_interval=60.0
+        )
+        storage.store_event(_engine_event('foo'))
+        storage.store_event(_engine_event('foo'))
+        assert _count_stored_events(storage, 'foo') == 0
+
+        storage.store_event(_engine_event('foo'))
+        assert _count_stored_events(storage, 'foo') == 3
+        storage.dispose()
+
+
+def test_buffered_sqlite_event_log_storage_flushes_on_boundary():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(
+            tmpdir_path, event_buffer_size=100, event_buffer_flush_interval=60.0
+        )
+        storage.store_event(_engine_event('foo'))
+        assert _count_stored_events(storage, 'foo') == 0
+
+        storage.store_event(
+            DagsterEventRecord(
+                None,
+                'Message',
+                'debug',
+                '',
+                'foo',
+                time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.STEP_SUCCESS.value,
+                    'nonce',
+                    event_specific_data=StepSuccessData(duration_ms=100.0),
+                ),
+            )
+        )
+        assert _count_stored_events(storage, 'foo') == 2
+        storage.dispose()
+
+
+def test_buffered_sqlite_event_log_storage_flushes_on_interval():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(
+            tmpdir_path, event_buffer_size=100, event_buffer_flush_interval=0.1
+        )
+        storage.store_event(_engine_event('foo'))
+
+        attempts = 10
+        while _count_stored_events(storage, 'foo') == 0 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert _count_stored_events(storage, 'foo') == 1
+        storage.dispose()
+
+
+def test_buffered_sqlite_event_log_storage_flushes_on_dispose():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(
+            tmpdir_path, event_buffer_size=100, event_buffer_flush_interval=60.0
+        )
+        for run_id in ['foo', 'bar', 'foo']:
+            storage.store_event(_engine_event(run_id))
+        assert _count_stored_events(storage, 'foo') == 0
+        assert _count_stored_events(storage, 'bar') == 0
+
+        storage.dispose()
+        assert _count_stored_events(storage, 'foo') == 2
+        assert _count_stored_events(storage, 'bar') == 1
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_buffered_sqlite_event_log_storage_flushes_in_forked_child():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(
+            tmpdir_path, event_buffer_size=100, event_buffer_flush_interval=0.1
+        )
+        # starts the flush timer of the parent, which does not run in the child
+        storage.store_event(_engine_event('foo'))
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                storage.store_event(_engine_event('bar'))
+                storage.store_event(_engine_event('bar'))
+
+                attempts = 20
+                while _count_stored_events(storage, 'bar') < 2 and attempts > 0:
+                    time.sleep(0.1)
+                    attempts -= 1
+
+                if _count_stored_events(storage, 'bar') == 2:
+                    exit_code = 0
+            finally:
+                os._exit(exit_code)  # pylint: disable=protected-access
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        assert _count_stored_events(storage, 'bar') == 2
+
+        # the event buffered before the fork is only written by the parent
+        storage.dispose()
+        assert _count_stored_events(storage, 'foo') == 1
+
+
+def test_buffered_sqlite_event_log_storage_flushes_at_exit():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        # the instance is never disposed, as when a pipeline is executed in process
+        subprocess.check_call(
+            [
+                sys.executable,
+                '-c',
+                (
+                    'import sys, time\n'
+                    'from dagster.core.events.log import DagsterEventRecord\n'
+                    'from dagster.core.storage.event_log import SqliteEventLogStorage\n'
+                    'storage = SqliteEventLogStorage(\n'
+                    '    sys.argv[1], event_buffer_size=100, event_buffer_flush_interval=60.0\n'
+                    ')\n'
+                    'storage.store_event(\n'
+                    '    DagsterEventRecord(None, "Message", "debug", "", "foo", time.time())\n'
+                    ')\n'
+                ),
+                tmpdir_path,
+            ]
+        )
+
+        storage = SqliteEventLogStorage(tmpdir_path)
+        assert _count_stored_events(storage, 'foo') == 1
+
+
 def test_filesystem_event_log_storage_run_corrupted():
     with seven.TemporaryDirectory() as tmpdir_path:
         storage = SqliteEventLogStorage(tmpdir_path)
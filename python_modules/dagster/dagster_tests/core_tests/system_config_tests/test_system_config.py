@@ -1,5 +1,7 @@
 import re
 
+import pytest
+
 from dagster import (
     Any,
     DependencyDefinition,
@@ -13,6 +15,7 @@ from dagster import (
     SolidDefinition,
     SolidInvocation,
     String,
+    StringSource,
     execute_pipeline,
     lambda_solid,
     pipeline,
@@ -26,8 +29,10 @@ from dagster.core.definitions.environment_configs import (
     define_solid_config_cls,
     define_solid_dictionary_cls,
 )
+from dagster.core.system_config import objects as system_config_objects
 from dagster.core.system_config.objects import EnvironmentConfig, SolidConfig
 from dagster.loggers import default_loggers
+from dagster.utils import merge_dicts
 
 
 def create_creation_data(pipeline_def):
@@ -619,3 +624,112 @@ def test_storage_in_memory_config():
 
 def test_directly_init_environment_config():
     EnvironmentConfig()
+
+
+def test_environment_config_build_is_cached(monkeypatch):
+    @solid(config={'num': Int})
+    def config_solid(context):
+        return context.solid_config['num']
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(
+                resource_defs={
+                    'source': ResourceDefinition(
+                        lambda _: None, config=Field(StringSource, is_required=False)
+                    )
+                }
+            )
+        ]
+    )
+    def cached_pipeline():
+        config_solid()
+
+    builds = []
+    build = EnvironmentConfig._build  # pylint: disable=protected-access
+
+    def _build(*args):
+        builds.append(args)
+        return build(*args)
+
+    monkeypatch.setattr(EnvironmentConfig, '_build', staticmethod(_build))
+
+    environment_dict = {'solids': {'config_solid': {'config': {'num': 1}}}}
+    first = EnvironmentConfig.build(cached_pipeline, environment_dict)
+    second = EnvironmentConfig.build(
+        cached_pipeline, {'solids': {'config_solid': {'config': {'num': 1}}}}
+    )
+    assert len(builds) == 1
+    assert second.solids == first.solids
+    assert second.original_config_dict == environment_dict
+
+    # different contents, or contents that are resolved on each build, are validated again
+    third = EnvironmentConfig.build(
+        cached_pipeline, {'solids': {'config_solid': {'config': {'num': 2}}}}
+    )
+    assert len(builds) == 2
+    assert third.solids['config_solid'].config == {'num': 2}
+
+    monkeypatch.setenv('SOME_ENV_VAR', 'foo')
+    source_dict = merge_dicts(
+        environment_dict, {'resources': {'source': {'config': {'env': 'SOME_ENV_VAR'}}}}
+    )
+    assert EnvironmentConfig.build(cached_pipeline, source_dict).resources == {
+        'source': {'config': 'foo'}
+    }
+    monkeypatch.setenv('SOME_ENV_VAR', 'bar')
+    assert EnvironmentConfig.build(cached_pipeline, source_dict).resources == {
+        'source': {'config': 'bar'}
+    }
+    assert len(builds) == 4
+
+    # the cache for each pipeline is bounded
+    monkeypatch.setattr(system_config_objects, 'MAX_CACHED_ENVIRONMENT_CONFIGS', 2)
+    for num in range(3, 6):
+        EnvironmentConfig.build(
+            cached_pipeline, {'solids': {'config_solid': {'config': {'num': num}}}}
+        )
+    EnvironmentConfig.build(cached_pipeline, environment_dict)
+    assert len(builds) == 8
+
+
+def test_environment_config_build_results_are_read_only():
+    @solid(config={'nums': [Int]}, input_defs=[InputDefinition('num', Int)])
+    def config_solid(context, num):
+        return context.solid_config['nums'] + [num]
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(
+                resource_defs={
+                    'source': ResourceDefinition(lambda _: None, config={'names': [String]})
+                }
+            )
+        ]
+    )
+    def read_only_pipeline():
+        config_solid()
+
+    environment_dict = {
+        'solids': {'config_solid': {'config': {'nums': [1]}, 'inputs': {'num': 2}}},
+        'resources': {'source': {'config': {'names': ['foo']}}},
+    }
+    environment_config = EnvironmentConfig.build(read_only_pipeline, environment_dict)
+
+    # results are shared by every build with the same environment dict, so they can't be changed
+    with pytest.raises(RuntimeError):
+        environment_config.solids['config_solid'].config['nums'].append(3)
+    with pytest.raises(RuntimeError):
+        environment_config.solids['config_solid'].inputs['num'] = 3
+    with pytest.raises(RuntimeError):
+        environment_config.solids.pop('config_solid')
+    with pytest.raises(RuntimeError):
+        environment_config.resources['source']['config']['names'].append('bar')
+
+    rebuilt = EnvironmentConfig.build(read_only_pipeline, environment_dict)
+    assert rebuilt.solids['config_solid'].config == {'nums': [1]}
+    assert rebuilt.solids['config_solid'].inputs == {'num': 2}
+    assert rebuilt.resources == {'source': {'config': {'names': ['foo']}}}
+
+    result = execute_pipeline(read_only_pipeline, environment_dict)
+    assert result.result_for_solid('config_solid').output_value() == [1, 2]
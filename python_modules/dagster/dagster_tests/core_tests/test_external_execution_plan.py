@@ -12,8 +12,14 @@ from dagster import (
     PipelineDefinition,
     lambda_solid,
 )
-from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.api import (
+    create_execution_plan,
+    execute_plan,
+    execute_plan_in_worker,
+)
+from dagster.core.execution.plan.snapshot import ExecutionPlanSnapshot
 from dagster.core.instance import DagsterInstance
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.utils import make_new_run_id
@@ -193,3 +199,53 @@ def test_using_file_system_for_subplan_invalid_step():
             environment_dict=environment_dict,
             pipeline_run=pipeline_run,
         )
+
+
+def test_execute_plan_in_worker():
+    environment_dict = {'storage': {'filesystem': {}}}
+    instance = DagsterInstance.local_temp()
+    handle = ExecutionTargetHandle.for_pipeline_fn(define_inty_pipeline)
+
+    execution_plan = create_execution_plan(
+        handle.build_pipeline_definition(), environment_dict=environment_dict
+    )
+    run = instance.create_run(
+        PipelineRun(
+            pipeline_name=execution_plan.pipeline_def.name,
+            run_id=make_new_run_id(),
+            environment_dict=environment_dict,
+            mode='default',
+        )
+    )
+    serialized_run = serialize_dagster_namedtuple(run)
+
+    # the plan is rebuilt from a snapshot when one is sent to the worker
+    return_one_step_events = [
+        deserialize_json_to_dagster_namedtuple(event)
+        for event in execute_plan_in_worker(
+            handle,
+            serialized_run,
+            ['return_one.compute'],
+            instance.get_ref(),
+            serialized_execution_plan_snapshot=serialize_dagster_namedtuple(
+                ExecutionPlanSnapshot.from_execution_plan(
+                    execution_plan.build_subset_plan(['return_one.compute'])
+                )
+            ),
+        )
+    ]
+    assert get_step_output(return_one_step_events, 'return_one.compute')
+
+    add_one_step_events = [
+        deserialize_json_to_dagster_namedtuple(event)
+        for event in execute_plan_in_worker(
+            handle, serialized_run, ['add_one.compute'], instance.get_ref()
+        )
+    ]
+    assert get_step_output(add_one_step_events, 'add_one.compute')
+
+    store = build_fs_intermediate_store(instance.intermediates_directory, run.run_id)
+    assert store.get_intermediate(None, 'add_one.compute', Int).obj == 2
+
+    with pytest.raises(DagsterExecutionStepNotFoundError):
+        execute_plan_in_worker(handle, serialized_run, ['nope.compute'], instance.get_ref())
@@ -1,15 +1,37 @@
 import os
+import pickle
+import threading
+import time
+import zlib
 
 import pytest
 
-from dagster import Bool, List, Optional, String, check
+from dagster import (
+    Bool,
+    List,
+    Optional,
+    Output,
+    OutputDefinition,
+    String,
+    check,
+    execute_pipeline,
+    pipeline,
+    solid,
+)
+from dagster.core.errors import DagsterObjectStoreKeyNotFoundError
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
+from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
 from dagster.core.storage.type_storage import TypeStoragePlugin, TypeStoragePluginRegistry
 from dagster.core.types.dagster_type import Bool as RuntimeBool
 from dagster.core.types.dagster_type import String as RuntimeString
 from dagster.core.types.dagster_type import create_any_type, resolve_dagster_type
-from dagster.core.types.marshal import SerializationStrategy
+from dagster.core.types.marshal import (
+    CompressedPickleSerializationStrategy,
+    PickleSerializationStrategy,
+    SerializationStrategy,
+)
 from dagster.core.utils import make_new_run_id
 from dagster.utils import mkdir_p
 from dagster.utils.test import yield_empty_pipeline_context
@@ -61,6 +83,221 @@ def test_file_system_intermediate_store():
         assert intermediate_store.rm_object(context, ['dslkfhjsdflkjfs']) is None
 
 
+def test_file_system_intermediate_store_overwrite_and_missing():
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediate_store.set_object('foo', context, RuntimeString, ['string'])
+        intermediate_store.set_object('bar', context, RuntimeString, ['string'])
+        assert intermediate_store.get_object(context, RuntimeString, ['string']).obj == 'bar'
+
+        with pytest.raises(DagsterObjectStoreKeyNotFoundError):
+            intermediate_store.get_object(context, RuntimeString, ['missing'])
+
+
+def test_file_system_intermediate_store_with_serialization_strategy():
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory,
+        run_id=run_id,
+        serialization_strategy=CompressedPickleSerializationStrategy(compression='zlib'),
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        assert (
+            intermediate_store.set_object(
+                'foo', context, RuntimeString, ['string']
+            ).serialization_strategy_name
+            == 'pickle_zlib'
+        )
+        with open(os.path.join(intermediate_store.root, 'string'), 'rb') as fd:
+            assert pickle.loads(zlib.decompress(fd.read())) == 'foo'
+
+        # types with their own serialization strategy keep it
+        intermediate_store.set_object('foo', context, LowercaseString, ['lowercase'])
+        with open(os.path.join(intermediate_store.root, 'lowercase'), 'rb') as fd:
+            assert fd.read().decode('utf-8') == 'FOO'
+
+        # the strategy is recorded with the object, so that it is read back with the same
+        # strategy by stores configured differently
+        plain_intermediate_store = build_fs_intermediate_store(
+            instance.intermediates_directory, run_id=run_id
+        )
+        get_op = plain_intermediate_store.get_object(context, RuntimeString, ['string'])
+        assert get_op.obj == 'foo'
+        assert get_op.serialization_strategy_name == 'pickle_zlib'
+        assert (
+            plain_intermediate_store.get_object(context, LowercaseString, ['lowercase']).obj
+            == 'foo'
+        )
+
+        # the default strategy is not recorded, since objects without metadata are read with it
+        plain_intermediate_store.set_object('foo', context, RuntimeString, ['string'])
+        assert sorted(os.listdir(intermediate_store.root)) == [
+            '.lowercase.meta',
+            'lowercase',
+            'string',
+        ]
+        assert plain_intermediate_store.get_object(context, RuntimeString, ['string']).obj == 'foo'
+
+
+def test_file_system_intermediate_store_reads_objects_without_metadata():
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory,
+        run_id=run_id,
+        serialization_strategy=CompressedPickleSerializationStrategy(compression='zlib'),
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        # objects written before serialization strategies were recorded were written with the
+        # strategy of their type
+        mkdir_p(intermediate_store.root)
+        PickleSerializationStrategy().serialize_to_file(
+            'foo', os.path.join(intermediate_store.root, 'string')
+        )
+        assert intermediate_store.get_object(context, RuntimeString, ['string']).obj == 'foo'
+
+
+def test_file_system_storage_serialization_strategy_config():
+    @solid
+    def return_one(_):
+        return 1
+
+    @solid
+    def add_one(_, num):
+        return num + 1
+
+    @pipeline
+    def pipe():
+        add_one(return_one())
+
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        pipe,
+        environment_dict={
+            'storage': {'filesystem': {'config': {'serialization_strategy': 'pickle_zlib'}}}
+        },
+        instance=instance,
+    )
+    assert result.success
+    assert result.result_for_solid('add_one').output_value() == 2
+
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=result.run_id
+    )
+    with open(
+        os.path.join(intermediate_store.root, 'intermediates', 'return_one.compute', 'result'),
+        'rb',
+    ) as fd:
+        assert pickle.loads(zlib.decompress(fd.read())) == 1
+
+
+def test_intermediates_manager_skips_existence_checks(monkeypatch):
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+    intermediates_manager = IntermediateStoreIntermediatesManager(intermediate_store)
+
+    def _has_object(_key):
+        raise Exception('Intermediates should be read and written without checking existence')
+
+    monkeypatch.setattr(intermediate_store.object_store, 'has_object', _has_object)
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        handle = StepOutputHandle('solid.compute', 'result')
+        for value in ['foo', 'bar']:
+            intermediates_manager.set_intermediate(
+                context, dagster_type=RuntimeString, step_output_handle=handle, value=value
+            )
+        assert (
+            intermediates_manager.get_intermediate(
+                context, dagster_type=RuntimeString, step_output_handle=handle
+            ).obj
+            == 'bar'
+        )
+
+        with pytest.raises(check.CheckError, match='No intermediate found for step output'):
+            intermediates_manager.get_intermediate(
+                context,
+                dagster_type=RuntimeString,
+                step_output_handle=StepOutputHandle('solid.compute', 'missing'),
+            )
+
+
+def test_intermediates_manager_warns_on_replace():
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediates_manager = IntermediateStoreIntermediatesManager(
+        build_fs_intermediate_store(instance.intermediates_directory, run_id=run_id)
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        warnings = []
+        context.log.warning = warnings.append
+
+        handle = StepOutputHandle('solid.compute', 'result')
+        for value in ['foo', 'bar']:
+            intermediates_manager.set_intermediate(
+                context, dagster_type=RuntimeString, step_output_handle=handle, value=value
+            )
+
+        assert warnings == ['Replacing existing intermediate for solid.compute.result']
+
+
+def test_intermediates_manager_concurrent_operations(monkeypatch):
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+    intermediates_manager = IntermediateStoreIntermediatesManager(
+        intermediate_store, max_concurrent_operations=4
+    )
+
+    thread_ids = set()
+    get_object = intermediate_store.object_store.get_object
+
+    def _slow_get_object(key, serialization_strategy=None):
+        thread_ids.add(threading.current_thread().ident)
+        time.sleep(0.05)
+        return get_object(key, serialization_strategy)
+
+    monkeypatch.setattr(intermediate_store.object_store, 'get_object', _slow_get_object)
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        handles = [StepOutputHandle('solid_{i}.compute'.format(i=i), 'result') for i in range(8)]
+        for i, handle in enumerate(handles):
+            intermediates_manager.set_intermediate(
+                context, dagster_type=RuntimeString, step_output_handle=handle, value=str(i)
+            )
+
+        results = intermediates_manager.get_intermediates(
+            context, [(RuntimeString, handle) for handle in handles]
+        )
+        assert [result.obj for result in results] == [str(i) for i in range(8)]
+        assert len(thread_ids) > 1
+
+        missing_handle = StepOutputHandle('solid_missing.compute', 'result')
+        with pytest.raises(check.CheckError, match='No intermediate found for step output'):
+            intermediates_manager.get_intermediates(
+                context, [(RuntimeString, handles[0]), (RuntimeString, missing_handle)]
+            )
+
+        # the manager's threads are reused rather than started for each batch of operations
+        with intermediates_manager.operation_executor() as executor:
+            with intermediates_manager.operation_executor() as other_executor:
+                assert executor is not None and executor is other_executor
+
+
 def test_file_system_intermediate_store_composite_types():
     run_id = make_new_run_id()
     instance = DagsterInstance.ephemeral()
@@ -172,3 +409,28 @@ def test_file_system_intermediate_store_with_composite_type_storage_plugin():
             intermediate_store.set_value(
                 ['hello'], context, resolve_dagster_type(Optional[List[String]]), ['obj_name']
             )
+
+
+def test_output_is_stored_before_solid_resumes():
+    @solid(output_defs=[OutputDefinition(name='buffer'), OutputDefinition(name='done')])
+    def reuse_buffer(_):
+        buf = list(range(1000))
+        yield Output(buf, 'buffer')
+        del buf[:]
+        buf.append(0)
+        yield Output(True, 'done')
+
+    @solid
+    def buffer_length(_, buf):
+        return len(buf)
+
+    @pipeline
+    def reuse_buffer_pipeline():
+        buf, _ = reuse_buffer()  # pylint: disable=no-value-for-parameter
+        buffer_length(buf)
+
+    result = execute_pipeline(
+        reuse_buffer_pipeline, environment_dict={'storage': {'filesystem': {}}}
+    )
+    assert result.success
+    assert result.result_for_solid('buffer_length').output_value() == 1000
@@ -10,7 +10,7 @@ from dagster.core.definitions import SolidHandle
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.logger import InitLoggerContext
 from dagster.core.execution.plan.objects import StepFailureData
-from dagster.core.log_manager import DagsterLogManager
+from dagster.core.log_manager import DagsterLogManager, StructuredEventLogger
 from dagster.loggers import colored_console_logger, json_console_logger
 from dagster.utils.error import SerializableErrorInfo
 
@@ -201,3 +201,51 @@ def test_json_console_logger(capsys):
                 found_msg = True
 
     assert found_msg
+
+
+def test_logging_skips_disabled_levels():
+    with _setup_logger('test') as (captured_results, logger):
+        logger.setLevel(logging.INFO)
+
+        dl = DagsterLogManager('123', {}, [logger])
+        dl.debug('test')
+        assert captured_results == []
+
+        dl.info('test')
+        assert len(captured_results) == 1
+
+
+def test_logging_structured_event_logger():
+    class CapturingStructuredEventLogger(StructuredEventLogger):
+        def __init__(self):
+            super(CapturingStructuredEventLogger, self).__init__('capture', level=logging.INFO)
+            self.captured = []
+
+        def log_structured(self, level, message, meta, timestamp):
+            self.captured.append((level, message, meta, timestamp))
+
+        def log(self, level, msg, *args, **kwargs):
+            raise Exception('Structured messages should not be dispatched through log')
+
+    structured_logger = CapturingStructuredEventLogger()
+    dl = DagsterLogManager('123', {'pipeline': 'foo'}, [structured_logger])
+    dl.debug('ignored')
+    dl.info('test', foo=2)
+
+    assert len(structured_logger.captured) == 1
+    level, message, meta, timestamp = structured_logger.captured[0]
+    assert level == logging.INFO
+    assert message.startswith('system - 123 - test')
+    assert meta['orig_message'] == 'test'
+    assert meta['run_id'] == '123'
+    assert meta['pipeline'] == 'foo'
+    assert meta['foo'] == 2
+    assert isinstance(timestamp, float)
+
+
+def test_structured_event_logger_requires_log_structured():
+    class IncompleteStructuredEventLogger(StructuredEventLogger):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteStructuredEventLogger('incomplete')
@@ -1,7 +1,10 @@
+import os
+
 import pytest
 
 from dagster import (
     Any,
+    DagsterEventType,
     DagsterInvalidDefinitionError,
     DependencyDefinition,
     InputDefinition,
@@ -9,6 +12,7 @@ from dagster import (
     List,
     MultiDependencyDefinition,
     Nothing,
+    Output,
     OutputDefinition,
     PipelineDefinition,
     composite_solid,
@@ -17,6 +21,7 @@ from dagster import (
     pipeline,
     solid,
 )
+from dagster.core.instance import DagsterInstance
 
 
 def test_simple_values():
@@ -59,6 +64,62 @@ def test_simple_values():
     assert result.result_for_solid('sum_num').output_value() == 6
 
 
+def test_fan_in_persistent_storage_events_in_order():
+    @solid(input_defs=[InputDefinition('numbers', List[Int])])
+    def sum_num(_context, numbers):
+        return sum(numbers)
+
+    @solid(output_defs=[OutputDefinition(Int, 'a'), OutputDefinition(Int, 'b')])
+    def emit_two(_context):
+        yield Output(1, 'a')
+        yield Output(2, 'b')
+
+    @lambda_solid
+    def emit_3():
+        return 3
+
+    @pipeline
+    def fan_in():
+        a, b = emit_two()  # pylint: disable=no-value-for-parameter
+        sum_num([a, b, emit_3()])
+
+    result = execute_pipeline(
+        fan_in,
+        environment_dict={'storage': {'filesystem': {}}},
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('sum_num').output_value() == 6
+
+    # intermediates are written as they are yielded, and read concurrently in a deterministic order
+    emit_two_events = [
+        (event.event_type, event.event_specific_data.value_name)
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        else (event.event_type, None)
+        for event in result.result_for_solid('emit_two').compute_step_events
+    ]
+    assert emit_two_events == [
+        (DagsterEventType.STEP_START, None),
+        (DagsterEventType.STEP_OUTPUT, None),
+        (DagsterEventType.OBJECT_STORE_OPERATION, 'a'),
+        (DagsterEventType.STEP_OUTPUT, None),
+        (DagsterEventType.OBJECT_STORE_OPERATION, 'b'),
+        (DagsterEventType.STEP_SUCCESS, None),
+    ]
+
+    sum_num_reads = [
+        event.event_specific_data.metadata_entries[0].entry_data.path
+        for event in result.result_for_solid('sum_num').compute_step_events
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.event_specific_data.value_name == 'numbers'
+    ]
+    assert [key.split(os.sep)[-2:] for key in sum_num_reads] == [
+        ['emit_two.compute', 'a'],
+        ['emit_two.compute', 'b'],
+        ['emit_3.compute', 'result'],
+    ]
+
+
 @solid(input_defs=[InputDefinition('stuff', List[Any])])
 def collect(_context, stuff):
     assert set(stuff) == set([1, None, 'one'])
@@ -1,10 +1,18 @@
 from contextlib import contextmanager
 
 import pytest
+import sqlalchemy as db
 
 from dagster import PipelineDefinition, seven
+from dagster.core.events import DagsterEventType
 from dagster.core.instance import DagsterInstance
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster.core.storage.runs.schema import RunsTable
+from dagster.core.storage.runs.sqlite import sqlite_run_storage
+from dagster.core.storage.sql import check_alembic_revision, get_alembic_config, stamp_alembic_rev
+from dagster.core.utils import make_new_run_id
 from dagster.utils.test.run_storage import TestRunStorage
 
 
@@ -49,3 +57,53 @@ class TestMyStorageImplementation(TestRunStorage):
     def run_storage(self, request):
         with request.param() as s:
             yield s
+
+
+def test_sqlite_run_storage_migrates_indexes():
+    with seven.TemporaryDirectory() as tempdir:
+        storage = SqliteRunStorage.from_local(tempdir)
+        alembic_config = get_alembic_config(sqlite_run_storage.__file__)
+        with storage.connect() as conn:
+            conn.execute('DROP INDEX idx_run_pipeline_name_status')
+            conn.execute('DROP INDEX idx_run_tags_key_value')
+            stamp_alembic_rev(alembic_config, conn, rev='9fe9e746268c')
+        storage.dispose()
+
+        storage = SqliteRunStorage.from_local(tempdir)
+        with storage.connect() as conn:
+            assert check_alembic_revision(alembic_config, conn) == ('9fe9e746268c', '3b1e175a2be3',)
+
+        storage.upgrade()
+
+        with storage.connect() as conn:
+            assert check_alembic_revision(alembic_config, conn) == ('3b1e175a2be3', '3b1e175a2be3',)
+            inspector = db.inspect(conn)
+            assert 'idx_run_pipeline_name_status' in [
+                index['name'] for index in inspector.get_indexes('runs')
+            ]
+            assert 'idx_run_tags_key_value' in [
+                index['name'] for index in inspector.get_indexes('run_tags')
+            ]
+        storage.dispose()
+
+
+def test_sqlite_handle_run_event_writes_status_column():
+    with create_sqlite_run_storage() as storage:
+        run_id = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=run_id, pipeline_name='some_pipeline'))
+        storage.handle_run_event(
+            run_id,
+            TestRunStorage.build_pipeline_event(DagsterEventType.PIPELINE_FAILURE, 'some_pipeline'),
+        )
+
+        ((status, run_body),) = storage.execute(
+            db.select([RunsTable.c.status, RunsTable.c.run_body]).where(
+                RunsTable.c.run_id == run_id
+            )
+        )
+        assert status == PipelineRunStatus.FAILURE.value
+        # the serialized run is left untouched, and reconciled with the status column on read
+        assert deserialize_json_to_dagster_namedtuple(run_body).status == (
+            PipelineRunStatus.NOT_STARTED
+        )
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.FAILURE
@@ -4,6 +4,7 @@ from enum import Enum
 
 import pytest
 
+from dagster import seven
 from dagster.check import ParameterCheckError
 from dagster.core.serdes import (
     _deserialize_json_to_dagster_namedtuple,
@@ -127,3 +128,52 @@ def test_backward_compat_serdes():
     assert deserialized.foo == quux.foo
     assert deserialized.bar == quux.bar
     assert not hasattr(deserialized, 'baz')
+
+
+def test_serdes_caches_args_for_class(monkeypatch):
+    _TEST_TUPLE_MAP = {}
+    _TEST_ENUM_MAP = {}
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Grault(namedtuple('_Grault', 'foo bar')):
+        def __new__(cls, foo, bar):
+            return super(Grault, cls).__new__(cls, foo, bar)  # pylint: disable=bad-super-call
+
+    get_args_calls = []
+    get_args = seven.get_args
+
+    def counting_get_args(callble):
+        get_args_calls.append(callble)
+        return get_args(callble)
+
+    monkeypatch.setattr(seven, 'get_args', counting_get_args)
+
+    serialized = _serialize_dagster_namedtuple(
+        [Grault('zip', 'zow'), Grault('wow', 'wee')],
+        tuple_map=_TEST_TUPLE_MAP,
+        enum_map=_TEST_ENUM_MAP,
+    )
+    for _ in range(3):
+        assert _deserialize_json_to_dagster_namedtuple(
+            serialized, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP
+        ) == [Grault('zip', 'zow'), Grault('wow', 'wee')]
+
+    assert get_args_calls == [Grault]
+
+
+def test_serdes_enum_subclassing_primitive():
+    _TEST_TUPLE_MAP = {}
+    _TEST_ENUM_MAP = {}
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Garply(str, Enum):
+        FOO = 'foo'
+
+    packed = _pack_value(
+        {'garply': Garply.FOO, 'foo': 'foo'}, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP
+    )
+    assert packed == {'garply': {'__enum__': 'Garply.FOO'}, 'foo': 'foo'}
+    assert (
+        _unpack_value(packed, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)['garply']
+        is Garply.FOO
+    )
@@ -1,12 +1,16 @@
 import os
 import random
 import string
+import subprocess
 import sys
+import threading
+import time
 
 import pytest
 
 from dagster import DagsterEventType, execute_pipeline, lambda_solid, pipeline
-from dagster.core.execution.compute_logs import should_disable_io_stream_redirect
+from dagster.core.execution import compute_logs
+from dagster.core.execution.compute_logs import mirror_io, should_disable_io_stream_redirect
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
 
@@ -112,3 +116,103 @@ def test_long_solid_names():
 
     stdout = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDOUT)
     assert stdout.data == HELLO_WORLD + SEPARATOR
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_mirror_io_captures_subprocesses_and_trailing_output(tmpdir, capfd):
+    outpath = str(tmpdir.join('stdout'))
+    errpath = str(tmpdir.join('stderr'))
+
+    with mirror_io(outpath, errpath):
+        # pytest swaps sys.stdout for a file other than fd 1, so pass it to the subprocess
+        subprocess.check_call(
+            [sys.executable, '-c', 'import sys; sys.stdout.write("from subprocess\\n")'],
+            stdout=sys.stdout,
+        )
+        os.write(sys.stdout.fileno(), b'no trailing newline')
+        os.write(sys.stderr.fileno(), b'to stderr')
+
+    with open(outpath) as outfile:
+        assert outfile.read() == 'from subprocess' + SEPARATOR + 'no trailing newline'
+
+    with open(errpath) as errfile:
+        assert errfile.read() == 'to stderr'
+
+    # output is still mirrored to the original streams
+    captured = capfd.readouterr()
+    assert captured.out == 'from subprocess' + SEPARATOR + 'no trailing newline'
+    assert captured.err == 'to stderr'
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_mirror_io_restores_stream_when_mirroring_fails(tmpdir, capfd, monkeypatch):
+    outpath = str(tmpdir.join('stdout'))
+    errpath = str(tmpdir.join('stderr'))
+
+    def _write_fully(_fd, _data):
+        raise OSError('original destination went away')
+
+    monkeypatch.setattr(compute_logs, '_write_fully', _write_fully)
+
+    with mirror_io(outpath, errpath):
+        os.write(sys.stdout.fileno(), b'captured')
+
+        # wait for the output to be captured, so that mirroring it fails before the stream is
+        # restored
+        attempts = 50
+        while os.path.getsize(outpath) == 0 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+    with open(outpath) as outfile:
+        assert outfile.read() == 'captured'
+
+    # the stream is restored to its original destination
+    os.write(sys.stdout.fileno(), b'restored')
+    assert capfd.readouterr().out == 'restored'
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_mirror_io_outlived_by_subprocess(tmpdir, capfd, monkeypatch):
+    outpath = str(tmpdir.join('stdout'))
+    errpath = str(tmpdir.join('stderr'))
+
+    monkeypatch.setattr(compute_logs, 'MIRROR_DRAIN_TIMEOUT', 0.1)
+
+    with mirror_io(outpath, errpath):
+        # pytest swaps sys.stdout for a file other than fd 1, so pass it to the subprocess
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                '-c',
+                'import sys, time; time.sleep(1); sys.stdout.write("from subprocess")',
+            ],
+            stdout=sys.stdout,
+        )
+
+    # files opened once the step has finished must not receive the output of the subprocess, in
+    # case they reuse the descriptor to which it is mirrored
+    with open(str(tmpdir.join('other')), 'wb'):
+        process.wait()
+
+        attempts = 50
+        while (
+            any(thread.name.startswith('compute-log-') for thread in threading.enumerate())
+            and attempts > 0
+        ):
+            time.sleep(0.1)
+            attempts -= 1
+
+    with open(str(tmpdir.join('other'))) as other_file:
+        assert other_file.read() == ''
+
+    with open(outpath) as outfile:
+        assert outfile.read() == 'from subprocess'
+
+    assert capfd.readouterr().out == 'from subprocess'
@@ -65,6 +65,7 @@ def _do_setup(name='dagster'):
             'future',
             'funcsigs',
             'functools32; python_version<"3"',
+            'futures; python_version<"3"',
             'contextlib2>=0.5.4',
             'pathlib2>=2.3.4; python_version<"3"',
             # cli
@@ -103,6 +103,9 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     def on_subscribe(self, subscription):
         self.local_manager.on_subscribe(subscription)
 
+    def dispose(self):
+        self.local_manager.dispose()
+
     def _should_download(self, run_id, step_key, io_type):
         local_path = self.get_local_path(run_id, step_key, io_type)
         if os.path.exists(local_path):
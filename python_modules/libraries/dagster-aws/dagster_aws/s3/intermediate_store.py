@@ -13,6 +13,7 @@ class S3IntermediateStore(IntermediateStore):
         s3_session=None,
         type_storage_plugin_registry=None,
         s3_prefix='dagster',
+        serialization_strategy=None,
     ):
         check.str_param(s3_bucket, 's3_bucket')
         check.str_param(s3_prefix, 's3_prefix')
@@ -34,4 +35,5 @@ class S3IntermediateStore(IntermediateStore):
                 'type_storage_plugin_registry',
                 TypeStoragePluginRegistry,
             ),
+            serialization_strategy=serialization_strategy,
         )
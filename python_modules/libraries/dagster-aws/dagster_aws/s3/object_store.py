@@ -1,13 +1,21 @@
 import logging
-import sys
-from io import BytesIO, StringIO
+import shutil
+import tempfile
 
 import boto3
+import six
+from botocore.exceptions import ClientError
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
-from dagster.core.storage.object_store import ObjectStore
-from dagster.core.types.marshal import SerializationStrategy
+from dagster.core.errors import DagsterObjectStoreKeyNotFoundError
+from dagster.core.storage.object_store import SERIALIZATION_STRATEGY_METADATA_KEY, ObjectStore
+from dagster.core.types.marshal import SerializationStrategy, resolve_serialization_strategy
+
+
+# The size of the in-memory buffer through which objects are streamed to and from S3, beyond which
+# they are spooled to disk
+SPOOLED_BUFFER_SIZE = 16 * 1024 * 1024
 
 
 class S3ObjectStore(ObjectStore):
@@ -27,21 +35,19 @@ class S3ObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning('Removing existing S3 key: {key}'.format(key=key))
-            self.rm_object(key)
-
-        with BytesIO() as bytes_io:
-            if serialization_strategy.write_mode == 'w' and sys.version_info >= (3, 0):
-                with StringIO() as string_io:
-                    string_io = StringIO()
-                    serialization_strategy.serialize(obj, string_io)
-                    string_io.seek(0)
-                    bytes_io.write(string_io.read().encode('utf-8'))
-            else:
-                serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+        # The serialized object is spooled to disk once it outgrows a bounded in-memory buffer, and
+        # upload_fileobj uploads large objects in parts, replacing any existing object at the key
+        with tempfile.SpooledTemporaryFile(max_size=SPOOLED_BUFFER_SIZE) as file_obj:
+            serialization_strategy.serialize_to_stream(obj, file_obj)
+            file_obj.seek(0)
+            self.s3.upload_fileobj(
+                file_obj,
+                self.bucket,
+                key,
+                ExtraArgs={
+                    'Metadata': {SERIALIZATION_STRATEGY_METADATA_KEY: serialization_strategy.name}
+                },
+            )
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -56,16 +62,29 @@ class S3ObjectStore(ObjectStore):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read())
-            if serialization_strategy.read_mode == 'rb'
-            else StringIO(
-                self.s3.get_object(Bucket=self.bucket, Key=key)['Body']
-                .read()
-                .decode(serialization_strategy.encoding)
+        with tempfile.SpooledTemporaryFile(max_size=SPOOLED_BUFFER_SIZE) as file_obj:
+            try:
+                # The response carries the object's metadata along with a stream of its body
+                response = self.s3.get_object(Bucket=self.bucket, Key=key)
+            except ClientError as exc:
+                if exc.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                    raise
+                six.raise_from(
+                    DagsterObjectStoreKeyNotFoundError(
+                        'No S3 object at: ' + self.uri_for_key(key), key=key
+                    ),
+                    exc,
+                )
+
+            shutil.copyfileobj(response['Body'], file_obj)
+            file_obj.seek(0)
+
+            serialization_strategy = resolve_serialization_strategy(
+                response.get('Metadata', {}).get(SERIALIZATION_STRATEGY_METADATA_KEY),
+                serialization_strategy,
             )
-        )
+            obj = serialization_strategy.deserialize_from_stream(file_obj)
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -79,31 +98,45 @@ class S3ObjectStore(ObjectStore):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)['KeyCount']
+        # The object may have been written by a type storage plugin as a number of objects under
+        # the key, but objects whose keys merely share its prefix don't count
+        try:
+            self.s3.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as exc:
+            if exc.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                raise
+
+        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key + self.sep, MaxKeys=1)[
+            'KeyCount'
+        ]
         return bool(key_count > 0)
 
     def rm_object(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        def delete_for_results(store, results):
-            store.s3.delete_objects(
-                Bucket=store.bucket,
-                Delete={'Objects': [{'Key': result['Key']} for result in results['Contents']]},
-            )
-
         if self.has_object(key):
-            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)
-            delete_for_results(self, results)
+            self._rm_objects_with_prefix(key)
 
-            continuation = results['IsTruncated']
-            while continuation:
-                continuation_token = results['NextContinuationToken']
-                results = self.s3.list_objects_v2(
-                    Bucket=self.bucket, Prefix=key, ContinuationToken=continuation_token
-                )
-                delete_for_results(self, results)
-                continuation = results['IsTruncated']
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.RM_OBJECT,
+            key=self.uri_for_key(key),
+            dest_key=None,
+            obj=None,
+            serialization_strategy_name=None,
+            object_store_name=self.name,
+        )
+
+    def rm_object_at_key(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        # Deleting a key that does not exist succeeds. Objects written by type storage plugins
+        # under the key are removed too, but not objects whose keys merely share its prefix, such
+        # as the intermediates of other outputs whose names start with the same name.
+        self.s3.delete_object(Bucket=self.bucket, Key=key)
+        self._rm_objects_with_prefix(key + self.sep)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.RM_OBJECT,
@@ -114,12 +147,40 @@ class S3ObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def _rm_objects_with_prefix(self, prefix):
+        def delete_for_results(store, results):
+            if not results.get('Contents'):
+                return
+            store.s3.delete_objects(
+                Bucket=store.bucket,
+                Delete={'Objects': [{'Key': result['Key']} for result in results['Contents']]},
+            )
+
+        results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
+        delete_for_results(self, results)
+
+        continuation = results['IsTruncated']
+        while continuation:
+            continuation_token = results['NextContinuationToken']
+            results = self.s3.list_objects_v2(
+                Bucket=self.bucket, Prefix=prefix, ContinuationToken=continuation_token
+            )
+            delete_for_results(self, results)
+            continuation = results['IsTruncated']
+
     def cp_object(self, src, dst):
         check.str_param(src, 'src')
         check.str_param(dst, 'dst')
 
-        self.s3.copy_object(
-            Bucket=self.bucket, Key=dst, CopySource={'Bucket': self.bucket, 'Key': src}
+        # A managed copy is performed server-side, in parts for objects larger than a single
+        # copy_object call allows. Parts do not carry the metadata of the source object, so it is
+        # set explicitly.
+        metadata = self.s3.head_object(Bucket=self.bucket, Key=src).get('Metadata', {})
+        self.s3.copy(
+            CopySource={'Bucket': self.bucket, 'Key': src},
+            Bucket=self.bucket,
+            Key=dst,
+            ExtraArgs={'Metadata': metadata, 'MetadataDirective': 'REPLACE'},
         )
 
         return ObjectStoreOperation(
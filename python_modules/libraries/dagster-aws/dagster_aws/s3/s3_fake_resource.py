@@ -20,6 +20,7 @@ class S3FakeSession(object):
         from dagster.seven import mock
 
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
+        self.metadata = defaultdict(dict)
         self.mock_extras = mock.MagicMock()
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
@@ -27,15 +28,24 @@ class S3FakeSession(object):
 
     def head_object(self, Bucket, Key, *args, **kwargs):
         self.mock_extras.head_object(*args, **kwargs)
-        return {'ContentLength': len(self.buckets.get(Bucket, {}).get(Key, b''))}
+        if not self.has_object(Bucket, Key):
+            raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+        return {
+            'ContentLength': len(self.buckets.get(Bucket, {}).get(Key, b'')),
+            'Metadata': self.metadata[Bucket].get(Key, {}),
+        }
 
     def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
         self.mock_extras.list_objects_v2(*args, **kwargs)
-        key = self.buckets.get(Bucket, {}).get(Prefix)
-        if key:
-            return {'KeyCount': 1, 'Contents': [{'Key': key}], 'IsTruncated': False}
-        else:
-            return {'KeyCount': 0, 'Contents': [], 'IsTruncated': False}
+        keys = sorted(key for key in self.buckets.get(Bucket, {}) if key.startswith(Prefix))
+        if 'MaxKeys' in kwargs:
+            keys = keys[: kwargs['MaxKeys']]
+        return {
+            'KeyCount': len(keys),
+            'Contents': [{'Key': key} for key in keys],
+            'IsTruncated': False,
+        }
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
@@ -43,14 +53,43 @@ class S3FakeSession(object):
 
     def get_object(self, Bucket, Key, *args, **kwargs):
         if not self.has_object(Bucket, Key):
-            raise ClientError({}, None)
+            raise ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
 
         self.mock_extras.get_object(*args, **kwargs)
-        return {'Body': self._get_byte_stream(Bucket, Key)}
+        return {
+            'Body': self._get_byte_stream(Bucket, Key),
+            'Metadata': self.metadata[Bucket].get(Key, {}),
+        }
 
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
         self.buckets[bucket][key] = fileobj.read()
+        self.metadata[bucket][key] = kwargs.get('ExtraArgs', {}).get('Metadata', {})
+
+    def copy(self, CopySource, Bucket, Key, *args, **kwargs):
+        self.mock_extras.copy(*args, **kwargs)
+        if not self.has_object(CopySource['Bucket'], CopySource['Key']):
+            raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+        self.buckets[Bucket][Key] = self.buckets[CopySource['Bucket']][CopySource['Key']]
+        extra_args = kwargs.get('ExtraArgs', {})
+        if extra_args.get('MetadataDirective') == 'REPLACE':
+            self.metadata[Bucket][Key] = extra_args.get('Metadata', {})
+        else:
+            self.metadata[Bucket][Key] = self.metadata[CopySource['Bucket']].get(
+                CopySource['Key'], {}
+            )
+
+    def delete_object(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.delete_object(*args, **kwargs)
+        self.buckets.get(Bucket, {}).pop(Key, None)
+        self.metadata[Bucket].pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete, *args, **kwargs):
+        self.mock_extras.delete_objects(*args, **kwargs)
+        for obj in Delete['Objects']:
+            self.buckets.get(Bucket, {}).pop(obj['Key'], None)
+            self.metadata[Bucket].pop(obj['Key'], None)
 
     def has_object(self, bucket, key):
         return bucket in self.buckets and key in self.buckets[bucket]
@@ -1,6 +1,10 @@
 from dagster import Field, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
-from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
+from dagster.core.storage.system_storage import (
+    fs_system_storage,
+    mem_system_storage,
+    serialization_strategy_from_config,
+)
 
 from .file_manager import S3FileManager
 from .intermediate_store import S3IntermediateStore
@@ -12,6 +16,7 @@ from .intermediate_store import S3IntermediateStore
     config={
         's3_bucket': Field(String),
         's3_prefix': Field(String, is_required=False, default_value='dagster'),
+        'serialization_strategy': Field(String, is_required=False),
     },
     required_resource_keys={'s3'},
 )
@@ -47,6 +52,10 @@ def s3_system_storage(init_context):
             config:
               s3_bucket: my-cool-bucket
               s3_prefix: good/prefix-for-files-
+
+    Set ``serialization_strategy`` to the name of a registered serialization strategy, such as
+    ``pickle_compressed``, to store intermediates of types that don't specify their own strategy
+    with it rather than plain pickling them.
     '''
     s3_session = init_context.resources.s3.session
     s3_key = '{prefix}/storage/{run_id}/files'.format(
@@ -66,6 +75,9 @@ def s3_system_storage(init_context):
                 s3_prefix=init_context.system_storage_config['s3_prefix'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+                serialization_strategy=serialization_strategy_from_config(
+                    init_context.system_storage_config
+                ),
             )
         ),
     )
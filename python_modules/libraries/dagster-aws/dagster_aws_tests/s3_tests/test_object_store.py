@@ -0,0 +1,113 @@
+import pytest
+from dagster_aws.s3 import object_store as s3_object_store
+from dagster_aws.s3.intermediate_store import S3IntermediateStore
+from dagster_aws.s3.object_store import S3ObjectStore
+from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+from dagster.core.errors import DagsterObjectStoreKeyNotFoundError
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
+from dagster.core.storage.object_store import (
+    DEFAULT_SERIALIZATION_STRATEGY,
+    SERIALIZATION_STRATEGY_METADATA_KEY,
+)
+from dagster.core.types.dagster_type import String as RuntimeString
+from dagster.core.types.marshal import CompressedPickleSerializationStrategy
+from dagster.core.utils import make_new_run_id
+from dagster.utils.test import yield_empty_pipeline_context
+
+
+def test_s3_object_store_overwrites_without_existence_checks():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    object_store.set_object('some/key', 'foo', DEFAULT_SERIALIZATION_STRATEGY)
+    object_store.set_object('some/key', 'bar', DEFAULT_SERIALIZATION_STRATEGY)
+
+    assert object_store.get_object('some/key', DEFAULT_SERIALIZATION_STRATEGY).obj == 'bar'
+    assert s3_session.mock_extras.upload_fileobj.call_count == 2
+    assert s3_session.mock_extras.list_objects_v2.call_count == 0
+
+
+def test_s3_object_store_missing_key():
+    object_store = S3ObjectStore('some-bucket', s3_session=S3FakeSession())
+
+    with pytest.raises(DagsterObjectStoreKeyNotFoundError) as exc_info:
+        object_store.get_object('some/missing/key', DEFAULT_SERIALIZATION_STRATEGY)
+
+    assert exc_info.value.key == 'some/missing/key'
+
+
+def test_s3_object_store_streams_large_objects(monkeypatch):
+    # Spill the serialized object to disk rather than holding it in memory
+    monkeypatch.setattr(s3_object_store, 'SPOOLED_BUFFER_SIZE', 1024)
+
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    value = {'foo': list(range(10000))}
+    object_store.set_object('some/key', value, DEFAULT_SERIALIZATION_STRATEGY)
+
+    assert object_store.get_object('some/key', DEFAULT_SERIALIZATION_STRATEGY).obj == value
+    assert s3_session.mock_extras.upload_fileobj.call_count == 1
+    assert s3_session.mock_extras.get_object.call_count == 1
+
+
+def test_s3_object_store_records_serialization_strategy():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    object_store.set_object(
+        'some/key', 'foo', CompressedPickleSerializationStrategy(compression='zlib')
+    )
+    assert s3_session.metadata['some-bucket']['some/key'] == {
+        SERIALIZATION_STRATEGY_METADATA_KEY: 'pickle_zlib'
+    }
+
+    get_op = object_store.get_object('some/key', DEFAULT_SERIALIZATION_STRATEGY)
+    assert get_op.obj == 'foo'
+    assert get_op.serialization_strategy_name == 'pickle_zlib'
+
+
+def test_s3_object_store_copies_server_side():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    object_store.set_object(
+        'some/key', 'foo', CompressedPickleSerializationStrategy(compression='zlib')
+    )
+    object_store.cp_object('some/key', 'some/other/key')
+
+    assert s3_session.mock_extras.copy.call_count == 1
+    assert s3_session.mock_extras.get_object.call_count == 0
+
+    get_op = object_store.get_object('some/other/key', DEFAULT_SERIALIZATION_STRATEGY)
+    assert get_op.obj == 'foo'
+    assert get_op.serialization_strategy_name == 'pickle_zlib'
+
+
+def test_s3_intermediates_manager_releases_only_the_exact_intermediate():
+    run_id = make_new_run_id()
+    intermediates_manager = IntermediateStoreIntermediatesManager(
+        S3IntermediateStore('some-bucket', run_id, s3_session=S3FakeSession())
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id) as context:
+        # the key of the first output is a prefix of the key of the second
+        out = StepOutputHandle('solid.compute', 'out')
+        out_2 = StepOutputHandle('solid.compute', 'out_2')
+        for handle in [out, out_2]:
+            intermediates_manager.set_intermediate(
+                context, dagster_type=RuntimeString, step_output_handle=handle, value='foo'
+            )
+
+        intermediates_manager.rm_intermediate(context, out)
+
+        assert not intermediates_manager.has_intermediate(context, out)
+        assert intermediates_manager.has_intermediate(context, out_2)
+        assert (
+            intermediates_manager.get_intermediate(
+                context, dagster_type=RuntimeString, step_output_handle=out_2
+            ).obj
+            == 'foo'
+        )
@@ -7,7 +7,8 @@ from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.core.execution.plan.snapshot import ExecutionPlanSnapshot
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.net import is_local_uri
 
@@ -125,7 +126,9 @@ class CeleryEngine(Engine):
                         EngineEventData(marker_start=DELEGATE_MARKER),
                         step_key=step.key,
                     )
-                    step_results[step.key] = _submit_task(app, pipeline_context, step, queue)
+                    step_results[step.key] = _submit_task(
+                        app, pipeline_context, execution_plan, step, queue
+                    )
                 except Exception:
                     yield DagsterEvent.engine_event(
                         pipeline_context,
@@ -152,7 +155,7 @@ class CeleryEngine(Engine):
             )
 
 
-def _submit_task(app, pipeline_context, step, queue):
+def _submit_task(app, pipeline_context, execution_plan, step, queue):
     priority = int(step.tags.get('dagster-celery/priority', task_default_priority))
 
     task = create_task(app)
@@ -160,27 +163,26 @@ def _submit_task(app, pipeline_context, step, queue):
     handle_dict = pipeline_context.execution_target_handle.to_dict()
     instance_ref_dict = pipeline_context.instance.get_ref().to_dict()
 
-    pipeline_name = pipeline_context.pipeline_def.name
-    mode = pipeline_context.mode_def.name
-    run_id = pipeline_context.pipeline_run.run_id
-
-    variables = {
-        'executionParams': {
-            'selector': {'name': pipeline_name},
-            'environmentConfigData': override_env_for_inner_executor(
-                pipeline_context.environment_dict,
-                pipeline_context.executor_config.retries,
-                step.key,
-                DELEGATE_MARKER,
-            ),
-            'mode': mode,
-            'executionMetadata': {'runId': run_id},
-            'stepKeys': [step.key],
-        }
-    }
-    task_signature = task.si(handle_dict, variables, instance_ref_dict)
+    environment_dict = override_env_for_inner_executor(
+        pipeline_context.environment_dict,
+        pipeline_context.executor_config.retries,
+        step.key,
+        DELEGATE_MARKER,
+    )
+    execution_plan_snapshot = ExecutionPlanSnapshot.from_execution_plan(
+        execution_plan.build_subset_plan([step.key])
+    )
+
+    task_signature = task.si(
+        handle_dict,
+        serialize_dagster_namedtuple(pipeline_context.pipeline_run),
+        [step.key],
+        instance_ref_dict,
+        environment_dict,
+        serialize_dagster_namedtuple(execution_plan_snapshot),
+    )
     return task_signature.apply_async(
-        priority=priority, queue=queue, routing_key='{queue}.execute_query'.format(queue=queue),
+        priority=priority, queue=queue, routing_key='{queue}.execute_plan'.format(queue=queue),
     )
 
 
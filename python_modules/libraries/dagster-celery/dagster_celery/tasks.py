@@ -1,28 +1,38 @@
 from celery import Celery
 from celery.utils.collections import force_mapping
 from dagster_celery.config import CeleryConfig
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
 from kombu import Queue
 
 from dagster import ExecutionTargetHandle, check
+from dagster.core.execution.api import execute_plan_in_worker
 from dagster.core.instance import InstanceRef
-from dagster.core.serdes import serialize_dagster_namedtuple
 from dagster.seven import is_module_available
 
 
 def create_task(celery_app, **task_kwargs):
-    @celery_app.task(bind=True, name='execute_query', **task_kwargs)
-    def _execute_query(_self, handle_dict, variables, instance_ref_dict):
+    @celery_app.task(bind=True, name='execute_plan', **task_kwargs)
+    def _execute_plan(
+        _self,
+        handle_dict,
+        serialized_pipeline_run,
+        step_keys,
+        instance_ref_dict,
+        environment_dict,
+        serialized_execution_plan_snapshot,
+    ):
         instance_ref = InstanceRef.from_dict(instance_ref_dict)
         handle = ExecutionTargetHandle.from_dict(handle_dict)
 
-        events = execute_execute_plan_mutation(
-            handle=handle, variables=variables, instance_ref=instance_ref,
+        return execute_plan_in_worker(
+            handle,
+            serialized_pipeline_run,
+            step_keys,
+            instance_ref,
+            environment_dict=environment_dict,
+            serialized_execution_plan_snapshot=serialized_execution_plan_snapshot,
         )
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
 
-    return _execute_query
+    return _execute_plan
 
 
 def make_app(config=None):
@@ -42,7 +52,7 @@ def make_app(config=None):
         Queue('dagster', routing_key='dagster.#', queue_arguments={'x-max-priority': 10})
     ]
     app_.conf.task_routes = {
-        'execute_query': {'queue': 'dagster', 'routing_key': 'dagster.execute_query'}
+        'execute_plan': {'queue': 'dagster', 'routing_key': 'dagster.execute_plan'}
     }
     app_.conf.task_queue_max_priority = 10
     app_.conf.task_default_priority = 5
@@ -51,4 +61,4 @@ def make_app(config=None):
 
 app = make_app()
 
-execute_query = create_task(app)
+execute_plan = create_task(app)
@@ -4,12 +4,15 @@
 import os
 import shutil
 from contextlib import contextmanager
+from enum import Enum as PythonEnum
 
 import pytest
 from dagster_celery import celery_executor
 
 from dagster import (
     CompositeSolidExecutionResult,
+    DagsterType,
+    Enum,
     ExecutionTargetHandle,
     InputDefinition,
     Int,
@@ -23,6 +26,7 @@ from dagster import (
     default_executors,
     execute_pipeline,
     execute_pipeline_iterator,
+    input_hydration_config,
     lambda_solid,
     pipeline,
     seven,
@@ -146,6 +150,33 @@ def test_retries():
     retry_request()
 
 
+class Color(PythonEnum):
+    RED = 1
+    BLUE = 2
+
+
+@input_hydration_config(Enum.from_python_enum(Color))
+def _color_input_hydration_config(_context, color):
+    return color
+
+
+ColorType = DagsterType(
+    name='ColorType',
+    type_check_fn=lambda _, value: isinstance(value, Color),
+    input_hydration_config=_color_input_hydration_config,
+)
+
+
+@lambda_solid(input_defs=[InputDefinition('color', ColorType)])
+def color_name(color):
+    return color.name
+
+
+@pipeline(mode_defs=celery_mode_defs)
+def enum_input_config_pipeline():
+    color_name()
+
+
 def events_of_type(result, event_type):
     return [event for event in result.event_list if event.event_type_value == event_type]
 
@@ -181,16 +212,17 @@ def execute_pipeline_on_celery(pipeline_name,):
 
 
 @contextmanager
-def execute_eagerly_on_celery(pipeline_name):
+def execute_eagerly_on_celery(pipeline_name, environment_dict=None):
     with seven.TemporaryDirectory() as tempdir:
         result = execute_pipeline(
             ExecutionTargetHandle.for_pipeline_python_file(
                 __file__, pipeline_name
             ).build_pipeline_definition(),
-            environment_dict={
-                'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
-                'execution': {'celery': {'config': {'config_source': {'task_always_eager': True}}}},
-            },
+            environment_dict=dict(
+                environment_dict or {},
+                storage={'filesystem': {'config': {'base_dir': tempdir}}},
+                execution={'celery': {'config': {'config_source': {'task_always_eager': True}}}},
+            ),
             instance=DagsterInstance.local_temp(tempdir=tempdir),
         )
         yield result
@@ -308,6 +340,15 @@ def test_execute_eagerly_on_celery():
         assert started == ended
 
 
+def test_execute_eagerly_enum_input_config_on_celery():
+    # the input config is processed into a python enum, which steps must not be serialized with
+    with execute_eagerly_on_celery(
+        'enum_input_config_pipeline', {'solids': {'color_name': {'inputs': {'color': 'RED'}}}}
+    ) as result:
+        assert result.success
+        assert result.result_for_solid('color_name').output_value() == 'RED'
+
+
 def test_execute_eagerly_serial_on_celery():
     with execute_eagerly_on_celery('test_serial_pipeline') as result:
         assert result.result_for_solid('simple').output_value() == 1
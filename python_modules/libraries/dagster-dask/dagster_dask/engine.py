@@ -1,12 +1,14 @@
 import dask
 import dask.distributed
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
 
 from dagster import check, seven
 from dagster.core.engine.engine_base import Engine
 from dagster.core.events import DagsterEvent
+from dagster.core.execution.api import execute_plan_in_worker
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.snapshot import ExecutionPlanSnapshot
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.utils import frozentags
 from dagster.utils.net import is_local_uri
 
@@ -16,13 +18,26 @@ from .config import DaskConfig
 DASK_RESOURCE_REQUIREMENTS_KEY = 'dagster-dask/resource_requirements'
 
 
-def query_on_dask_worker(
-    handle, variables, dependencies, instance_ref=None
+def execute_plan_on_dask_worker(
+    handle,
+    serialized_pipeline_run,
+    step_keys,
+    environment_dict,
+    serialized_execution_plan_snapshot,
+    dependencies,
+    instance_ref=None,
 ):  # pylint: disable=unused-argument
     '''Note that we need to pass "dependencies" to ensure Dask sequences futures during task
     scheduling, even though we do not use this argument within the function.
     '''
-    return execute_execute_plan_mutation(handle, variables, instance_ref=instance_ref)
+    return execute_plan_in_worker(
+        handle,
+        serialized_pipeline_run,
+        step_keys,
+        instance_ref,
+        environment_dict=environment_dict,
+        serialized_execution_plan_snapshot=serialized_execution_plan_snapshot,
+    )
 
 
 def get_dask_resource_requirements(tags):
@@ -80,6 +95,8 @@ class DaskEngine(Engine):  # pylint: disable=no-init
 
         instance = pipeline_context.instance
 
+        serialized_pipeline_run = serialize_dagster_namedtuple(pipeline_context.pipeline_run)
+
         with dask.distributed.Client(**dask_config.build_dict(pipeline_name)) as client:
             execution_futures = []
             execution_futures_dict = {}
@@ -96,22 +113,19 @@ class DaskEngine(Engine):  # pylint: disable=no-init
                     environment_dict = dict(
                         pipeline_context.environment_dict, execution={'in_process': {}}
                     )
-                    variables = {
-                        'executionParams': {
-                            'selector': {'name': pipeline_name},
-                            'environmentConfigData': environment_dict,
-                            'mode': pipeline_context.mode_def.name,
-                            'executionMetadata': {'runId': pipeline_context.pipeline_run.run_id},
-                            'stepKeys': [step.key],
-                        }
-                    }
+                    execution_plan_snapshot = ExecutionPlanSnapshot.from_execution_plan(
+                        execution_plan.build_subset_plan([step.key])
+                    )
 
                     dask_task_name = '%s.%s' % (pipeline_name, step.key)
 
                     future = client.submit(
-                        query_on_dask_worker,
+                        execute_plan_on_dask_worker,
                         pipeline_context.execution_target_handle,
-                        variables,
+                        serialized_pipeline_run,
+                        [step.key],
+                        environment_dict,
+                        serialize_dagster_namedtuple(execution_plan_snapshot),
                         dependencies,
                         instance.get_ref(),
                         key=dask_task_name,
@@ -124,7 +138,8 @@ class DaskEngine(Engine):  # pylint: disable=no-init
             # This tells Dask to awaits the step executions and retrieve their results to the
             # master
             for future in dask.distributed.as_completed(execution_futures):
-                for step_event in future.result():
+                for serialized_step_event in future.result():
+                    step_event = deserialize_json_to_dagster_namedtuple(serialized_step_event)
                     check.inst(step_event, DagsterEvent)
 
                     yield step_event
@@ -1,12 +1,18 @@
+from enum import Enum as PythonEnum
+
 import dagster_pandas as dagster_pd
 from dagster_dask import dask_executor
 
 from dagster import (
+    DagsterType,
+    Enum,
     ExecutionTargetHandle,
     InputDefinition,
     ModeDefinition,
     execute_pipeline,
     file_relative_path,
+    input_hydration_config,
+    lambda_solid,
     pipeline,
     seven,
     solid,
@@ -93,3 +99,48 @@ def test_pandas_dask():
     )
 
     assert result.success
+
+
+class Color(PythonEnum):
+    RED = 1
+    BLUE = 2
+
+
+@input_hydration_config(Enum.from_python_enum(Color))
+def _color_input_hydration_config(_context, color):
+    return color
+
+
+ColorType = DagsterType(
+    name='ColorType',
+    type_check_fn=lambda _, value: isinstance(value, Color),
+    input_hydration_config=_color_input_hydration_config,
+)
+
+
+@lambda_solid(input_defs=[InputDefinition('color', ColorType)])
+def color_name(color):
+    return color.name
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])])
+def enum_input_config_pipeline():
+    return color_name()
+
+
+def test_enum_input_config_dask():
+    # the input config is processed into a python enum, which steps must not be serialized with
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, enum_input_config_pipeline.name
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'dask': {'config': {'timeout': 30}}},
+            'solids': {'color_name': {'inputs': {'color': 'RED'}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+
+    assert result.success
+    assert result.result_for_solid('color_name').output_value() == 'RED'
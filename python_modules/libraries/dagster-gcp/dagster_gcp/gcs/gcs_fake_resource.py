@@ -0,0 +1,107 @@
+from collections import defaultdict
+
+from google.api_core.exceptions import NotFound
+
+
+class FakeGCSBlob(object):
+    '''Stand-in for a google.cloud.storage.Blob, backed by the in-memory dict of its bucket.'''
+
+    def __init__(self, name, bucket, chunk_size=None):
+        self.name = name
+        self.bucket = bucket
+        self.chunk_size = chunk_size
+        self.metadata = bucket.metadata.get(name)
+
+    def exists(self):
+        return self.name in self.bucket.blobs
+
+    def delete(self):
+        if not self.exists():
+            raise NotFound('Blob {name} not found'.format(name=self.name))
+        del self.bucket.blobs[self.name]
+        self.bucket.metadata.pop(self.name, None)
+
+    def upload_from_file(self, file_obj, rewind=False):
+        if rewind:
+            file_obj.seek(0)
+        self.bucket.blobs[self.name] = file_obj.read()
+        self.bucket.metadata[self.name] = self.metadata
+
+    def upload_from_string(self, data):
+        self.bucket.blobs[self.name] = data if isinstance(data, bytes) else data.encode('utf-8')
+        self.bucket.metadata[self.name] = self.metadata
+
+    def download_to_file(self, file_obj):
+        if not self.exists():
+            raise NotFound('Blob {name} not found'.format(name=self.name))
+
+        data = self.bucket.blobs[self.name]
+        if self.chunk_size:
+            # mimic chunked downloads, so that tests exercise writes of partial objects
+            for start in range(0, len(data), self.chunk_size):
+                file_obj.write(data[start : start + self.chunk_size])
+        else:
+            file_obj.write(data)
+
+    def rewrite(self, source, token=None):
+        if not source.exists():
+            raise NotFound('Blob {name} not found'.format(name=source.name))
+
+        data = source.bucket.blobs[source.name]
+        if token is None:
+            # mimic rewrites of large objects, which take several calls
+            return 'rewrite-token', 0, len(data)
+
+        self.bucket.blobs[self.name] = data
+        self.bucket.metadata[self.name] = source.bucket.metadata.get(source.name)
+        return None, len(data), len(data)
+
+    def download_as_string(self):
+        if not self.exists():
+            raise NotFound('Blob {name} not found'.format(name=self.name))
+        return self.bucket.blobs[self.name]
+
+
+class FakeGCSBucket(object):
+    '''Stand-in for a google.cloud.storage.Bucket, holding its blobs in an in-memory dict.'''
+
+    def __init__(self, name, blobs, metadata):
+        self.name = name
+        self.blobs = blobs
+        self.metadata = metadata
+
+    def exists(self):
+        return True
+
+    def blob(self, blob_name, chunk_size=None):
+        return FakeGCSBlob(blob_name, self, chunk_size=chunk_size)
+
+    def get_blob(self, blob_name):
+        return self.blob(blob_name) if blob_name in self.blobs else None
+
+    def copy_blob(self, blob, destination_bucket, new_name=None):
+        destination_bucket.blobs[new_name or blob.name] = self.blobs[blob.name]
+        destination_bucket.metadata[new_name or blob.name] = self.metadata.get(blob.name)
+        return destination_bucket.blob(new_name or blob.name)
+
+
+class FakeGCSClient(object):
+    '''Stateful stand-in for a google.cloud.storage.Client for test.
+
+    Buckets are implemented using in-memory dicts, and are created on first access.
+    '''
+
+    def __init__(self, buckets=None):
+        self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
+        self.metadata = defaultdict(dict)
+
+    def get_bucket(self, bucket_name):
+        return FakeGCSBucket(bucket_name, self.buckets[bucket_name], self.metadata[bucket_name])
+
+    def list_blobs(self, bucket_or_name, prefix=None):
+        bucket_name = getattr(bucket_or_name, 'name', bucket_or_name)
+        return [
+            FakeGCSBlob(name, self.get_bucket(bucket_name))
+            for name in sorted(self.buckets[bucket_name].keys())
+            if prefix is None or name.startswith(prefix)
+        ]
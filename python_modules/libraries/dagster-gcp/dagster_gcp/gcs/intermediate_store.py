@@ -13,6 +13,7 @@ class GCSIntermediateStore(IntermediateStore):
         client=None,
         type_storage_plugin_registry=None,
         gcs_prefix='dagster',
+        serialization_strategy=None,
     ):
         check.str_param(gcs_bucket, 'gcs_bucket')
         check.str_param(gcs_prefix, 'gcs_prefix')
@@ -34,4 +35,5 @@ class GCSIntermediateStore(IntermediateStore):
                 'type_storage_plugin_registry',
                 TypeStoragePluginRegistry,
             ),
+            serialization_strategy=serialization_strategy,
         )
@@ -1,17 +1,26 @@
 import logging
-import sys
-from io import BytesIO, StringIO
+import tempfile
 
-from google.api_core.exceptions import TooManyRequests
+import six
+from google.api_core.exceptions import NotFound, TooManyRequests
 from google.cloud import storage
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
-from dagster.core.storage.object_store import ObjectStore
-from dagster.core.types.marshal import SerializationStrategy
+from dagster.core.errors import DagsterObjectStoreKeyNotFoundError
+from dagster.core.storage.object_store import SERIALIZATION_STRATEGY_METADATA_KEY, ObjectStore
+from dagster.core.types.marshal import SerializationStrategy, resolve_serialization_strategy
 from dagster.utils.backoff import backoff
 
 
+# The size of the in-memory buffer through which objects are streamed to and from GCS, beyond which
+# they are spooled to disk
+SPOOLED_BUFFER_SIZE = 16 * 1024 * 1024
+
+# Objects are uploaded and downloaded in chunks of this size, which must be a multiple of 256 KB
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
 class GCSObjectStore(ObjectStore):
     def __init__(self, bucket, client=None):
         self.bucket = check.str_param(bucket, 'bucket')
@@ -30,20 +39,17 @@ class GCSObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning('Removing existing GCS key: {key}'.format(key=key))
-            backoff(self.rm_object, args=[key], retry_on=(TooManyRequests,))
-
-        with (
-            BytesIO()
-            if serialization_strategy.write_mode == 'wb' or sys.version_info < (3, 0)
-            else StringIO()
-        ) as file_like:
-            serialization_strategy.serialize(obj, file_like)
-            file_like.seek(0)
+        # The serialized object is spooled to disk once it outgrows a bounded in-memory buffer, and
+        # uploaded in chunks with a resumable upload, replacing any existing blob at the key
+        with tempfile.SpooledTemporaryFile(max_size=SPOOLED_BUFFER_SIZE) as file_obj:
+            serialization_strategy.serialize_to_stream(obj, file_obj)
+            file_obj.seek(0)
+            blob = self.bucket_obj.blob(key, chunk_size=CHUNK_SIZE)
+            blob.metadata = {SERIALIZATION_STRATEGY_METADATA_KEY: serialization_strategy.name}
             backoff(
-                self.bucket_obj.blob(key).upload_from_file,
-                args=[file_like],
+                blob.upload_from_file,
+                args=[file_obj],
+                kwargs={'rewind': True},
                 retry_on=(TooManyRequests,),
             )
 
@@ -60,19 +66,33 @@ class GCSObjectStore(ObjectStore):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        if serialization_strategy.read_mode == 'rb':
-            file_obj = BytesIO()
-            self.bucket_obj.blob(key).download_to_file(file_obj)
-        else:
-            file_obj = StringIO(
-                self.bucket_obj.blob(key)
-                .download_as_string()
-                .decode(serialization_strategy.encoding)
+        # Fetching the blob loads its metadata, and pins the download to the generation of the object
+        # that the metadata describes
+        blob = self.bucket_obj.get_blob(key)
+        if blob is None:
+            raise DagsterObjectStoreKeyNotFoundError(
+                'No GCS object at: ' + self.uri_for_key(key), key=key
             )
+        blob.chunk_size = CHUNK_SIZE
+
+        with tempfile.SpooledTemporaryFile(max_size=SPOOLED_BUFFER_SIZE) as file_obj:
+            try:
+                blob.download_to_file(file_obj)
+            except NotFound as exc:
+                six.raise_from(
+                    DagsterObjectStoreKeyNotFoundError(
+                        'No GCS object at: ' + self.uri_for_key(key), key=key
+                    ),
+                    exc,
+                )
+
+            file_obj.seek(0)
+            serialization_strategy = resolve_serialization_strategy(
+                (blob.metadata or {}).get(SERIALIZATION_STRATEGY_METADATA_KEY),
+                serialization_strategy,
+            )
+            obj = serialization_strategy.deserialize_from_stream(file_obj)
 
-        file_obj.seek(0)
-
-        obj = serialization_strategy.deserialize(file_obj)
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -85,7 +105,11 @@ class GCSObjectStore(ObjectStore):
     def has_object(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
-        blobs = self.client.list_blobs(self.bucket, prefix=key)
+        # The object may have been written by a type storage plugin as a number of objects under
+        # the key, but objects whose keys merely share its prefix don't count
+        if self.bucket_obj.blob(key).exists():
+            return True
+        blobs = self.client.list_blobs(self.bucket, prefix=key + self.sep, max_results=1)
         return len(list(blobs)) > 0
 
     def rm_object(self, key):
@@ -104,12 +128,39 @@ class GCSObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def rm_object_at_key(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        # Objects written by type storage plugins under the key are removed too, but not objects
+        # whose keys merely share its prefix
+        try:
+            self.bucket_obj.blob(key).delete()
+        except NotFound:
+            pass
+        for blob in self.client.list_blobs(self.bucket, prefix=key + self.sep):
+            blob.delete()
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.RM_OBJECT,
+            key=self.uri_for_key(key),
+            dest_key=None,
+            obj=None,
+            serialization_strategy_name=None,
+            object_store_name=self.name,
+        )
+
     def cp_object(self, src, dst):
         check.str_param(src, 'src')
         check.str_param(dst, 'dst')
 
+        # Rewriting copies server-side. Large objects are rewritten over several calls, each of
+        # which returns a token with which to resume.
         source_blob = self.bucket_obj.blob(src)
-        self.bucket_obj.copy_blob(source_blob, self.bucket_obj, dst)
+        dst_blob = self.bucket_obj.blob(dst)
+        token, _, _ = dst_blob.rewrite(source_blob)
+        while token is not None:
+            token, _, _ = dst_blob.rewrite(source_blob, token=token)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.CP_OBJECT,
@@ -1,6 +1,10 @@
 from dagster import Field, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
-from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
+from dagster.core.storage.system_storage import (
+    fs_system_storage,
+    mem_system_storage,
+    serialization_strategy_from_config,
+)
 
 from .file_manager import GCSFileManager
 from .intermediate_store import GCSIntermediateStore
@@ -12,6 +16,7 @@ from .intermediate_store import GCSIntermediateStore
     config={
         'gcs_bucket': Field(String),
         'gcs_prefix': Field(String, is_required=False, default_value='dagster'),
+        'serialization_strategy': Field(String, is_required=False),
     },
     required_resource_keys={'gcs'},
 )
@@ -34,6 +39,9 @@ def gcs_system_storage(init_context):
                 gcs_prefix=init_context.system_storage_config['gcs_prefix'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+                serialization_strategy=serialization_strategy_from_config(
+                    init_context.system_storage_config
+                ),
             )
         ),
     )
@@ -1,9 +1,16 @@
 import uuid
 from io import BytesIO
 
+import pytest
+from dagster_gcp.gcs import object_store as gcs_object_store
+from dagster_gcp.gcs.gcs_fake_resource import FakeGCSClient
 from dagster_gcp.gcs.object_store import GCSObjectStore
 
-from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster.core.errors import DagsterObjectStoreKeyNotFoundError
+from dagster.core.types.marshal import (
+    CompressedPickleSerializationStrategy,
+    PickleSerializationStrategy,
+)
 
 
 def test_gcs_object_store(gcs_bucket):
@@ -30,3 +37,43 @@ def test_gcs_object_store(gcs_bucket):
     object_store.rm_object(other_key)
     assert not object_store.has_object(key)
     assert not object_store.has_object(other_key)
+
+
+def test_gcs_object_store_streams_objects(monkeypatch):
+    # Spill the serialized object to disk, and transfer it in several chunks
+    monkeypatch.setattr(gcs_object_store, 'SPOOLED_BUFFER_SIZE', 1024)
+    monkeypatch.setattr(gcs_object_store, 'CHUNK_SIZE', 256)
+
+    client = FakeGCSClient()
+    object_store = GCSObjectStore('some-bucket', client=client)
+    serialization_strategy = PickleSerializationStrategy()
+
+    value = {'foo': list(range(10000))}
+    object_store.set_object('some/key', value, serialization_strategy)
+    object_store.set_object('some/key', value, serialization_strategy)
+
+    assert list(client.buckets['some-bucket'].keys()) == ['some/key']
+    assert object_store.get_object('some/key', serialization_strategy).obj == value
+
+
+def test_gcs_object_store_missing_key():
+    object_store = GCSObjectStore('some-bucket', client=FakeGCSClient())
+
+    with pytest.raises(DagsterObjectStoreKeyNotFoundError) as exc_info:
+        object_store.get_object('some/missing/key', PickleSerializationStrategy())
+
+    assert exc_info.value.key == 'some/missing/key'
+
+
+def test_gcs_object_store_records_serialization_strategy():
+    client = FakeGCSClient()
+    object_store = GCSObjectStore('some-bucket', client=client)
+
+    object_store.set_object(
+        'some/key', 'foo', CompressedPickleSerializationStrategy(compression='zlib')
+    )
+    object_store.cp_object('some/key', 'some/other/key')
+
+    get_op = object_store.get_object('some/other/key', PickleSerializationStrategy())
+    assert get_op.obj == 'foo'
+    assert get_op.serialization_strategy_name == 'pickle_zlib'
@@ -1,3 +1,5 @@
+import pickle
+
 import pandas as pd
 from dagster_pandas.constraints import ColumnTypeConstraint, ConstraintViolationException
 from dagster_pandas.validation import PandasColumn, validate_constraints
@@ -15,9 +17,12 @@ from dagster import (
 )
 from dagster.config.field_utils import Selector
 from dagster.core.types.config_schema import input_selector_schema, output_selector_schema
+from dagster.core.types.marshal import SerializationStrategy, register_serialization_strategy
 
 CONSTRAINT_BLACKLIST = {ColumnTypeConstraint}
 
+PARQUET_MAGIC = b'PAR1'
+
 
 def dict_without_keys(ddict, *keys):
     return {key: value for key, value in ddict.items() if key not in set(keys)}
@@ -76,6 +81,56 @@ def dataframe_input_schema(_context, file_type, file_options):
         )
 
 
+class DataFrameParquetSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Stores DataFrames as Parquet files with pyarrow, which writes and reads columnar data much
+    faster, and much more compactly, than pickling.
+
+    Select it for a DataFrame type by passing it as the type's ``serialization_strategy``, or for
+    every type stored by a system storage by setting the storage's ``serialization_strategy`` config
+    to ``parquet``. Values other than DataFrames, and DataFrames that Arrow can't represent or write
+    to Parquet, such as those with columns of mixed types, are pickled instead, as are DataFrames
+    stored before this strategy was selected; both are recognized and unpickled when read.
+    '''
+
+    def __init__(self, name='parquet'):
+        super(DataFrameParquetSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        if not isinstance(value, pd.DataFrame):
+            pickle.dump(value, write_file_obj, pickle.HIGHEST_PROTOCOL)
+            return
+
+        import pyarrow
+        import pyarrow.parquet
+
+        # Arrow raises for DataFrames it can't convert, or whose schema it can't write to Parquet,
+        # before anything is written to the file object, so that we can fall back to pickling them
+        try:
+            table = pyarrow.Table.from_pandas(value)
+            writer = pyarrow.parquet.ParquetWriter(write_file_obj, table.schema)
+        except (pyarrow.ArrowException, TypeError, ValueError):
+            pickle.dump(value, write_file_obj, pickle.HIGHEST_PROTOCOL)
+            return
+
+        try:
+            writer.write_table(table)
+        finally:
+            writer.close()
+
+    def deserialize(self, read_file_obj):
+        magic = read_file_obj.read(len(PARQUET_MAGIC))
+        read_file_obj.seek(0)
+        if magic != PARQUET_MAGIC:
+            return pickle.load(read_file_obj)
+
+        import pyarrow.parquet
+
+        return pyarrow.parquet.read_table(read_file_obj).to_pandas()
+
+
+register_serialization_strategy(DataFrameParquetSerializationStrategy())
+
+
 def df_type_check(_, value):
     if not isinstance(value, pd.DataFrame):
         return TypeCheck(success=False)
@@ -150,6 +205,7 @@ def create_dagster_pandas_dataframe_type(
     dataframe_constraints=None,
     input_hydration_config=None,
     output_materialization_config=None,
+    serialization_strategy=None,
 ):
     """
     Constructs a custom pandas dataframe dagster type.
@@ -169,6 +225,10 @@ def create_dagster_pandas_dataframe_type(
         output_materialization_config (Optional[OutputMaterializationConfig]): An instance of a class
             that inherits from :py:class:`~dagster.OutputMaterializationConfig`. If None, we will
             default to using the `dataframe_output_schema` output_materialization_config.
+        serialization_strategy (Optional[SerializationStrategy]): An instance of a class that
+            inherits from :py:class:`~dagster.SerializationStrategy`, such as
+            :py:class:`DataFrameParquetSerializationStrategy`. If None, dataframes are stored
+            with the serialization strategy of the system storage, which pickles them by default.
     """
     # We allow for the plugging in of input_hydration_config/output_materialization_configs so that
     # Users can hydrate and persist their custom dataframes via configuration their own way if the default
@@ -212,6 +272,7 @@ def create_dagster_pandas_dataframe_type(
         output_materialization_config=output_materialization_config
         if output_materialization_config
         else dataframe_output_schema,
+        serialization_strategy=serialization_strategy,
         description=description,
     )
 
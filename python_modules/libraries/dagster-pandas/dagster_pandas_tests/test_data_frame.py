@@ -1,12 +1,21 @@
+import os
+import pickle
+
 import pytest
 from dagster_pandas.constraints import (
     ColumnTypeConstraint,
     InRangeColumnConstraint,
     NonNullableColumnConstraint,
 )
-from dagster_pandas.data_frame import _execute_summary_stats, create_dagster_pandas_dataframe_type
+from dagster_pandas.data_frame import DataFrame as DagsterPandasDataFrame
+from dagster_pandas.data_frame import (
+    DataFrameParquetSerializationStrategy,
+    _execute_summary_stats,
+    create_dagster_pandas_dataframe_type,
+)
 from dagster_pandas.validation import PandasColumn
-from pandas import DataFrame, read_csv
+from pandas import Categorical, DataFrame, Index, read_csv, to_timedelta
+from pandas.testing import assert_frame_equal
 
 from dagster import (
     DagsterInvariantViolationError,
@@ -22,6 +31,7 @@ from dagster import (
     execute_pipeline,
     execute_solid,
     pipeline,
+    seven,
     solid,
 )
 from dagster.core.types.config_schema import input_selector_schema, output_selector_schema
@@ -246,3 +256,148 @@ def test_custom_dagster_dataframe_parametrizable_input():
     materialization_events = solid_result.materialization_events_during_compute
     assert len(materialization_events) == 1
     assert materialization_events[0].event_specific_data.materialization.label == 'did nothing'
+
+
+def test_dataframe_parquet_serialization_strategy():
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+    df = DataFrame({'foo': [1, 2, 3], 'bar': ['a', 'b', 'c']})
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        with open(tempfile_path, 'rb') as ff:
+            assert ff.read(4) == b'PAR1'
+        assert serialization_strategy.deserialize_from_file(tempfile_path).equals(df)
+
+
+@pytest.mark.parametrize(
+    'df',
+    [
+        DataFrame({'foo': [1, 2, 3]}, index=Index(['x', 'y', 'z'], name='key')),
+        DataFrame({'foo': Categorical(['a', 'b', 'a']), 'bar': [1.5, None, 2.5]}),
+    ],
+)
+def test_dataframe_parquet_serialization_strategy_roundtrip(df):
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        with open(tempfile_path, 'rb') as ff:
+            assert ff.read(4) == b'PAR1'
+        assert_frame_equal(serialization_strategy.deserialize_from_file(tempfile_path), df)
+
+
+def test_dataframe_parquet_serialization_strategy_pickles_mixed_objects():
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+    df = DataFrame({'mixed': [1, 'a', {'b': 2}]})
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        with open(tempfile_path, 'rb') as ff:
+            assert ff.read(4) != b'PAR1'
+        assert_frame_equal(serialization_strategy.deserialize_from_file(tempfile_path), df)
+
+
+@pytest.mark.parametrize(
+    'df',
+    [
+        DataFrame({'mixed': [1, 'a', 2.5], 'other_mixed': [b'a', 'b', None]}),
+        DataFrame({'foo': [1, 2], 'elapsed': to_timedelta(['1 days', '2 hours'])}),
+    ],
+)
+def test_dataframe_parquet_serialization_strategy_stores_mixed_and_timedelta_columns(df):
+    # whether these are written as Parquet or pickled depends on the version of pyarrow, but they
+    # must be stored either way
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        assert_frame_equal(serialization_strategy.deserialize_from_file(tempfile_path), df)
+
+
+def test_dataframe_parquet_serialization_strategy_pickles_unwritable_parquet(monkeypatch):
+    import pyarrow
+    import pyarrow.parquet
+
+    def _parquet_writer(_where, _schema):
+        raise pyarrow.ArrowNotImplementedError(
+            'Unhandled type for Arrow to Parquet schema conversion: duration[ns]'
+        )
+
+    monkeypatch.setattr(pyarrow.parquet, 'ParquetWriter', _parquet_writer)
+
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+    df = DataFrame({'elapsed': to_timedelta(['1 days', '2 hours'])})
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        with open(tempfile_path, 'rb') as ff:
+            assert ff.read(4) != b'PAR1'
+        assert_frame_equal(serialization_strategy.deserialize_from_file(tempfile_path), df)
+
+
+@pytest.mark.parametrize(
+    'serialization_strategy_config,is_parquet',
+    [({}, False), ({'serialization_strategy': 'parquet'}, True)],
+)
+def test_dataframe_intermediates_roundtrip_through_filesystem_storage(
+    serialization_strategy_config, is_parquet
+):
+    df = DataFrame({'foo': Categorical(['a', 'b', 'a'])}, index=Index([10, 20, 30], name='key'))
+    mixed_df = DataFrame({'mixed': [1, 'a', None]})
+
+    @solid(
+        output_defs=[
+            OutputDefinition(name='df', dagster_type=DagsterPandasDataFrame),
+            OutputDefinition(name='mixed_df', dagster_type=DagsterPandasDataFrame),
+            OutputDefinition(name='num', dagster_type=int),
+        ]
+    )
+    def produce(_):
+        yield Output(df.copy(), 'df')
+        yield Output(mixed_df.copy(), 'mixed_df')
+        yield Output(1, 'num')
+
+    @solid(
+        input_defs=[
+            InputDefinition('input_df', DagsterPandasDataFrame),
+            InputDefinition('input_mixed_df', DagsterPandasDataFrame),
+            InputDefinition('num', int),
+        ]
+    )
+    def consume(_, input_df, input_mixed_df, num):
+        assert_frame_equal(input_df, df)
+        assert_frame_equal(input_mixed_df, mixed_df)
+        assert num == 1
+
+    @pipeline
+    def dataframe_pipeline():
+        input_df, input_mixed_df, num = produce()
+        consume(input_df, input_mixed_df, num)
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        result = execute_pipeline(
+            dataframe_pipeline,
+            {
+                'storage': {
+                    'filesystem': {
+                        'config': dict(serialization_strategy_config, base_dir=tmpdir_path)
+                    }
+                }
+            },
+        )
+        assert result.success
+
+        # DataFrames are only stored as Parquet when the strategy is selected
+        with open(os.path.join(tmpdir_path, 'intermediates', 'produce.compute', 'df'), 'rb') as ff:
+            assert (ff.read(4) == b'PAR1') == is_parquet
+
+
+def test_dataframe_parquet_serialization_strategy_pickles_other_values():
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file({'foo': [1, 2]}, tempfile_path)
+        assert serialization_strategy.deserialize_from_file(tempfile_path) == {'foo': [1, 2]}
+
+
+def test_dataframe_parquet_serialization_strategy_reads_pickles():
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+    df = DataFrame({'foo': [1, 2, 3], 'bar': ['a', 'b', 'c']})
+    with safe_tempfile_path() as tempfile_path:
+        with open(tempfile_path, 'wb') as ff:
+            pickle.dump(df, ff)
+        assert serialization_strategy.deserialize_from_file(tempfile_path).equals(df)
@@ -0,0 +1,53 @@
+"""add step_key column and indexes to event log
+
+Revision ID: c63a27054f08
+Revises: 8f8dba68fd3b
+Create Date: 2020-03-10 14:02:11.473015
+
+"""
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# revision identifiers, used by Alembic.
+revision = 'c63a27054f08'
+down_revision = '8f8dba68fd3b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'event_logs' not in has_tables:
+        return
+
+    has_columns = [col['name'] for col in inspector.get_columns('event_logs')]
+    if 'step_key' not in has_columns:
+        op.add_column('event_logs', sa.Column('step_key', sa.Text))
+
+    has_indexes = [index['name'] for index in inspector.get_indexes('event_logs')]
+    if 'idx_run_id_step_key' not in has_indexes:
+        op.create_index('idx_run_id_step_key', 'event_logs', ['run_id', 'step_key'])
+    if 'idx_run_id_event_type' not in has_indexes:
+        op.create_index('idx_run_id_event_type', 'event_logs', ['run_id', 'dagster_event_type'])
+
+    op.execute(
+        'update event_logs\n'
+        'set\n'
+        '  step_key = coalesce(\n'
+        '    event::json->>\'step_key\', event::json->\'dagster_event\'->>\'step_key\'\n'
+        '  )\n'
+        'where step_key is null'
+    )
+
+
+def downgrade():
+    op.drop_index('idx_run_id_event_type', 'event_logs')
+    op.drop_index('idx_run_id_step_key', 'event_logs')
+    op.drop_column('event_logs', 'step_key')
@@ -1,25 +1,32 @@
-import datetime
 import threading
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 
 import psycopg2
 import sqlalchemy as db
 
 from dagster import check
+from dagster.config import Field
 from dagster.core.events.log import EventRecord
 from dagster.core.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
     deserialize_json_to_dagster_namedtuple,
-    serialize_dagster_namedtuple,
 )
 from dagster.core.storage.event_log import (
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
+from dagster.core.storage.sql import (
+    EngineCache,
+    connection_pool_config,
+    create_engine,
+    get_alembic_config,
+    pool_kwargs_from_config,
+    run_alembic_upgrade,
+)
+from dagster.utils import merge_dicts
 
 from ..pynotify import await_pg_notifications
 from ..utils import pg_config, pg_url_from_config
@@ -47,8 +54,19 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     '''
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(
+        self,
+        postgres_url,
+        inst_data=None,
+        event_buffer_size=None,
+        event_buffer_flush_interval=None,
+        connection_pool=None,
+    ):
         self.postgres_url = check.str_param(postgres_url, 'postgres_url')
+        self.init_event_buffer(event_buffer_size, event_buffer_flush_interval)
+        self._engine_cache = EngineCache(
+            merge_dicts(pool_kwargs_from_config(connection_pool), {'isolation_level': 'AUTOCOMMIT'})
+        )
         self._event_watcher = PostgresEventWatcher(self.postgres_url)
         with self.get_engine() as engine:
             SqlEventLogStorageMetadata.create_all(engine)
@@ -56,13 +74,7 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     @contextmanager
     def get_engine(self):
-        engine = create_engine(
-            self.postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
-        try:
-            yield engine
-        finally:
-            engine.dispose()
+        yield self._engine_cache.get_engine(self.postgres_url)
 
     def upgrade(self):
         alembic_config = get_alembic_config(__file__)
@@ -75,12 +87,23 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return pg_config()
+        return merge_dicts(
+            pg_config(),
+            {
+                'event_buffer_size': Field(int, is_required=False),
+                'event_buffer_flush_interval': Field(float, is_required=False),
+                'connection_pool': connection_pool_config(),
+            },
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresEventLogStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            event_buffer_size=config_value.get('event_buffer_size'),
+            event_buffer_flush_interval=config_value.get('event_buffer_flush_interval'),
+            connection_pool=config_value.get('connection_pool'),
         )
 
     @staticmethod
@@ -89,38 +112,42 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         inst.wipe()
         return inst
 
-    def store_event(self, event):
-        '''Store an event corresponding to a pipeline run.
+    def store_events(self, events):
+        '''Store a batch of events with a single multi-row insert, notifying watchers once for each
+        run in the batch.
+
         Args:
-            event (EventRecord): The event to store.
+            events (List[EventRecord]): The events to store.
         '''
-        check.inst_param(event, 'event', EventRecord)
-
-        dagster_event_type = None
-        if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
+        check.list_param(events, 'events', of_type=EventRecord)
 
-        run_id = event.run_id
+        if not events:
+            return
 
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
             event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-                run_id=run_id,
-                event=serialize_dagster_namedtuple(event),
-                dagster_event_type=dagster_event_type,
-                timestamp=datetime.datetime.fromtimestamp(event.timestamp),
+                [self.prepare_event_row(event) for event in events]
             )
             result_proxy = conn.execute(
                 event_insert.returning(
                     SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
                 )
             )
-            res = result_proxy.fetchone()
+            res = result_proxy.fetchall()
             result_proxy.close()
-            conn.execute(
-                '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
-                (res[0] + '_' + str(res[1]),),
-            )
+
+            # Watchers fetch every event of a run up to the notified id, so only the last event of
+            # each run needs to be announced
+            last_event_ids = OrderedDict()
+            for (run_id, event_id) in res:
+                last_event_ids[run_id] = max(event_id, last_event_ids.get(run_id, event_id))
+
+            for run_id, event_id in last_event_ids.items():
+                conn.execute(
+                    '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
+                    (run_id + '_' + str(event_id),),
+                )
 
     @contextmanager
     def connect(self, run_id=None):
@@ -142,7 +169,9 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         self.dispose()
 
     def dispose(self):
+        self.flush()
         self._event_watcher.close()
+        self._engine_cache.dispose()
 
 
 EventWatcherProcessStartedEvent = namedtuple('EventWatcherProcessStartedEvent', '')
@@ -166,8 +195,11 @@ POLLING_CADENCE = 0.25
 TERMINATE_EVENT_LOOP = 'TERMINATE_EVENT_LOOP'
 
 
-def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_thread_exit):
+def watcher_thread(conn_string, event_watcher, watcher_thread_exit):
+    '''Listens for notifications on a single dedicated connection, and fetches the events they
+    announce over a single pooled query connection.'''
 
+    engine = create_engine(conn_string, isolation_level='AUTOCOMMIT', pool_size=1, max_overflow=0)
     try:
         for notif in await_pg_notifications(
             conn_string,
@@ -180,83 +212,115 @@ def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_t
                 if watcher_thread_exit.is_set():
                     break
             else:
-                run_id, index_str = notif.payload.split('_')
-                if run_id not in run_id_dict:
-                    continue
-
-                index = int(index_str)
-                with dict_lock:
-                    handlers = handlers_dict.get(run_id, [])
-
-                engine = create_engine(
-                    conn_string, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-                )
-                try:
-                    res = engine.execute(
-                        db.select([SqlEventLogStorageTable.c.event]).where(
-                            SqlEventLogStorageTable.c.id == index
-                        ),
-                    )
-                    dagster_event = deserialize_json_to_dagster_namedtuple(res.fetchone()[0])
-                finally:
-                    engine.dispose()
-
-                for (cursor, callback) in handlers:
-                    if index >= cursor:
-                        callback(dagster_event)
+                run_id, index_str = notif.payload.rsplit('_', 1)
+                event_watcher.fetch_events(engine, run_id, int(index_str))
     except psycopg2.OperationalError:
         pass
+    finally:
+        engine.dispose()
+
+
+class _RunWatch(object):
+    '''The subscribers to the events of a single run, and how far into its event log the watcher
+    has fetched.'''
+
+    def __init__(self, start_cursor):
+        self.handlers = []
+        # The index of the last event of the run that has been fetched, in the cursor convention of
+        # get_logs_for_run, and the id of that event in the event log table
+        self.cursor = start_cursor
+        self.last_event_id = None
 
 
 class PostgresEventWatcher(object):
+    '''Dispatches the events of watched runs to their subscribers.
+
+    A burst of notifications for a run is coalesced: the first notification fetches every event of
+    the run stored since the last fetch with a single range query, and later notifications for
+    events that have already been fetched are dropped without querying.
+    '''
+
     def __init__(self, conn_string):
-        self._run_id_dict = {}
-        self._handlers_dict = {}
+        self._run_watches = {}
         self._dict_lock = threading.Lock()
         self._conn_string = conn_string
         self._watcher_thread_exit = threading.Event()
         self._watcher_thread = threading.Thread(
-            target=watcher_thread,
-            args=(
-                self._conn_string,
-                self._run_id_dict,
-                self._handlers_dict,
-                self._dict_lock,
-                self._watcher_thread_exit,
-            ),
+            target=watcher_thread, args=(self._conn_string, self, self._watcher_thread_exit),
         )
         self._watcher_thread.daemon = True
         self._watcher_thread.start()
 
     def has_run_id(self, run_id):
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_dict
+            _has_run_id = run_id in self._run_watches
         return _has_run_id
 
     def watch_run(self, run_id, start_cursor, callback):
+        start_cursor = start_cursor if start_cursor is not None else -1
         with self._dict_lock:
-            if run_id in self._run_id_dict:
-                self._handlers_dict[run_id].append((start_cursor, callback))
-            else:
-                # See: https://docs.python.org/2/library/multiprocessing.html#multiprocessing.managers.SyncManager
-                run_id_dict = self._run_id_dict
-                run_id_dict[run_id] = None
-                self._run_id_dict = run_id_dict
-                self._handlers_dict[run_id] = [(start_cursor, callback)]
+            if run_id not in self._run_watches:
+                self._run_watches[run_id] = _RunWatch(start_cursor)
+
+            run_watch = self._run_watches[run_id]
+            if run_watch.last_event_id is None:
+                run_watch.cursor = min(run_watch.cursor, start_cursor)
+            run_watch.handlers.append((start_cursor, callback))
 
     def unwatch_run(self, run_id, handler):
         with self._dict_lock:
-            if run_id in self._run_id_dict:
-                self._handlers_dict[run_id] = [
-                    (start_cursor, callback)
-                    for (start_cursor, callback) in self._handlers_dict[run_id]
-                    if callback != handler
-                ]
-            if not self._handlers_dict[run_id]:
-                del self._handlers_dict[run_id]
-                run_id_dict = self._run_id_dict
-                del run_id_dict[run_id]
-                self._run_id_dict = run_id_dict
+            if run_id not in self._run_watches:
+                return
+
+            run_watch = self._run_watches[run_id]
+            run_watch.handlers = [
+                (start_cursor, callback)
+                for (start_cursor, callback) in run_watch.handlers
+                if callback != handler
+            ]
+            if not run_watch.handlers:
+                del self._run_watches[run_id]
+
+    def fetch_events(self, engine, run_id, event_id):
+        '''Fetch the events of a watched run that have not yet been fetched, and hand them to the
+        run's subscribers. Called on the watcher thread when event_id is announced for the run.'''
+        with self._dict_lock:
+            run_watch = self._run_watches.get(run_id)
+            if run_watch is None:
+                return
+            if run_watch.last_event_id is not None and event_id <= run_watch.last_event_id:
+                return
+            cursor, last_event_id = run_watch.cursor, run_watch.last_event_id
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if last_event_id is not None:
+            query = query.where(SqlEventLogStorageTable.c.id > last_event_id)
+        elif cursor > -1:
+            query = query.offset(cursor + 1)
+
+        res = engine.execute(query)
+        rows = res.fetchall()
+        res.close()
+        if not rows:
+            return
+
+        with self._dict_lock:
+            run_watch = self._run_watches.get(run_id)
+            if run_watch is None:
+                return
+            run_watch.cursor = cursor + len(rows)
+            run_watch.last_event_id = rows[-1][0]
+            handlers = list(run_watch.handlers)
+
+        for index, (_id, event_json) in enumerate(rows, cursor + 1):
+            dagster_event = deserialize_json_to_dagster_namedtuple(event_json)
+            for (handler_cursor, callback) in handlers:
+                if index > handler_cursor:
+                    callback(dagster_event)
 
     def close(self):
         self._watcher_thread_exit.set()
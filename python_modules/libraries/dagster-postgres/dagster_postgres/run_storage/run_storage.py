@@ -5,7 +5,15 @@ import sqlalchemy as db
 from dagster import check
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.core.storage.runs import RunStorageSqlMetadata, SqlRunStorage
-from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
+from dagster.core.storage.sql import (
+    EngineCache,
+    connection_pool_config,
+    create_engine,
+    get_alembic_config,
+    pool_kwargs_from_config,
+    run_alembic_upgrade,
+)
+from dagster.utils import merge_dicts
 
 from ..utils import pg_config, pg_url_from_config
 
@@ -26,21 +34,18 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
        :language: YAML
     '''
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, connection_pool=None):
         self.postgres_url = postgres_url
+        self._engine_cache = EngineCache(
+            merge_dicts(pool_kwargs_from_config(connection_pool), {'isolation_level': 'AUTOCOMMIT'})
+        )
         with self.get_engine() as engine:
             RunStorageSqlMetadata.create_all(engine)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @contextmanager
     def get_engine(self):
-        engine = create_engine(
-            self.postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
-        try:
-            yield engine
-        finally:
-            engine.dispose()
+        yield self._engine_cache.get_engine(self.postgres_url)
 
     @property
     def inst_data(self):
@@ -48,12 +53,14 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return pg_config()
+        return merge_dicts(pg_config(), {'connection_pool': connection_pool_config()})
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresRunStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            connection_pool=config_value.get('connection_pool'),
         )
 
     @staticmethod
@@ -76,3 +83,6 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
         alembic_config = get_alembic_config(__file__)
         with self.get_engine() as engine:
             run_alembic_upgrade(alembic_config, engine)
+
+    def dispose(self):
+        self._engine_cache.dispose()
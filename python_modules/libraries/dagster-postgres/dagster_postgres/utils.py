@@ -2,7 +2,8 @@ import time
 
 import psycopg2
 
-from dagster.config import Field, Selector
+from dagster import check
+from dagster.config import Field
 from dagster.core.instance.source_types import StringSource
 from dagster.seven import quote_plus as urlquote
 
@@ -14,21 +15,30 @@ def get_conn(conn_string):
 
 
 def pg_config():
-    return Selector(
-        {
-            'postgres_url': str,
-            'postgres_db': {
+    # Exactly one of postgres_url and postgres_db must be set. This is a Shape rather than a
+    # Selector so that individual storages can add their own fields alongside the connection
+    # settings.
+    return {
+        'postgres_url': Field(str, is_required=False),
+        'postgres_db': Field(
+            {
                 'username': str,
                 'password': StringSource,
                 'hostname': str,
                 'db_name': str,
                 'port': Field(int, is_required=False, default_value=5432),
             },
-        }
-    )
+            is_required=False,
+        ),
+    }
 
 
 def pg_url_from_config(config_value):
+    check.invariant(
+        ('postgres_url' in config_value) != ('postgres_db' in config_value),
+        'Postgres storage config must specify exactly one of postgres_url or postgres_db.',
+    )
+
     if config_value.get('postgres_url'):
         return config_value['postgres_url']
 
@@ -355,7 +355,7 @@ def test_listen_notify_single_run_event(conn_string):
 
     run_id = make_new_run_id()
 
-    event_log_storage.event_watcher.watch_run(run_id, 0, event_list.append)
+    event_log_storage.event_watcher.watch_run(run_id, -1, event_list.append)
 
     try:
         events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
@@ -388,8 +388,8 @@ def test_listen_notify_filter_two_runs_event(conn_string):
     run_id_one = make_new_run_id()
     run_id_two = make_new_run_id()
 
-    event_log_storage.event_watcher.watch_run(run_id_one, 0, event_list_one.append)
-    event_log_storage.event_watcher.watch_run(run_id_two, 0, event_list_two.append)
+    event_log_storage.event_watcher.watch_run(run_id_one, -1, event_list_one.append)
+    event_log_storage.event_watcher.watch_run(run_id_two, -1, event_list_two.append)
 
     try:
         events_one, _result_one = gather_events(_solids, run_config=RunConfig(run_id=run_id_one))
@@ -430,7 +430,7 @@ def test_listen_notify_filter_run_event(conn_string):
 
     # only watch one of the runs
     event_list = []
-    event_log_storage.event_watcher.watch_run(run_id_two, 0, event_list.append)
+    event_log_storage.event_watcher.watch_run(run_id_two, -1, event_list.append)
 
     try:
         events_one, _result_one = gather_events(_solids, run_config=RunConfig(run_id=run_id_one))
@@ -452,6 +452,51 @@ def test_listen_notify_filter_run_event(conn_string):
         del event_log_storage
 
 
+def test_listen_notify_batch_event(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    run_id = make_new_run_id()
+
+    event_list = []
+    late_event_list = []
+    event_log_storage.event_watcher.watch_run(run_id, -1, event_list.append)
+
+    try:
+        events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
+        event_log_storage.store_events(events[:3])
+        event_log_storage.store_events(events[3:])
+
+        start = time.time()
+        while len(event_list) < 7 and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert [event.message for event in event_list] == [event.message for event in events]
+
+        # a subscriber that has already seen some of the run's events only receives the rest
+        event_log_storage.event_watcher.watch_run(run_id, 6, late_event_list.append)
+        more_events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
+        event_log_storage.store_events(more_events)
+
+        start = time.time()
+        while len(late_event_list) < 7 and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert len(event_list) == 14
+        assert [event.message for event in late_event_list] == [
+            event.message for event in more_events
+        ]
+
+    finally:
+        del event_log_storage
+
+
 def test_load_from_config(hostname):
     url_cfg = '''
       event_log_storage: